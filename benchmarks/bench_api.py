@@ -0,0 +1,195 @@
+"""Запросы в секунду к HTTP/JSON API под локальной нагрузкой.
+
+Сервер работает в отдельном потоке со своим циклом событий, генератор
+нагрузки открывает ``--connections`` соединений и шлет по ним запросы
+подряд. Сравниваются: кеш ответов и без него, повторная проверка по
+If-None-Match (304), новое соединение на каждый запрос вместо keep-alive
+и переключение между ``--profiles`` профилями, когда все они помещаются
+в LRU открытых профилей и когда нет.
+
+Запуск: python -m benchmarks.bench_api --tasks 1000 --requests 5000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from benchmarks.datagen import task_records
+from core.api_server import ApiServer
+from core.profiles import ProfileCache, profile_dir
+from core.storage import save_records
+
+
+class ServerThread(threading.Thread):
+    def __init__(self, api: ApiServer):
+        super().__init__(daemon=True)
+        self.api = api
+        self.loop = asyncio.new_event_loop()
+        self.port = None
+        self._ready = threading.Event()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        server = self.loop.run_until_complete(self.api.start("127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self.loop.run_forever()
+        server.close()
+        self.loop.run_until_complete(server.wait_closed())
+        self.loop.close()
+
+    def __enter__(self):
+        self.start()
+        self._ready.wait()
+        return self
+
+    async def _drain(self):
+        # Клиенты уже закрыли соединения: обработчики завершатся, получив EOF
+        current = asyncio.current_task()
+        for _ in range(200):
+            if all(task is current for task in asyncio.all_tasks()):
+                break
+            await asyncio.sleep(0.01)
+        self.loop.stop()
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self._drain(), self.loop)
+        self.join()
+
+
+async def read_response(reader: asyncio.StreamReader):
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    etag = None
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "etag":
+            etag = value.strip()
+    if length:
+        await reader.readexactly(length)
+    return status, etag
+
+
+def request_bytes(path: str, etag=None, keep_alive=True, profile=None) -> bytes:
+    lines = [f"GET {path} HTTP/1.1", "Host: 127.0.0.1"]
+    if profile:
+        lines.append(f"X-Profile: {profile}")
+    if etag:
+        lines.append(f"If-None-Match: {etag}")
+    if not keep_alive:
+        lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def worker(port, path, count, revalidate, keep_alive, profiles, statuses):
+    etag = None
+    reader = writer = None
+    for i in range(count):
+        if writer is None:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        profile = profiles[i % len(profiles)] if profiles else None
+        writer.write(
+            request_bytes(path, etag if revalidate else None, keep_alive, profile)
+        )
+        status, new_etag = await read_response(reader)
+        statuses[status] = statuses.get(status, 0) + 1
+        etag = new_etag or etag
+        if not keep_alive:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def load(
+    port,
+    path,
+    requests,
+    connections,
+    revalidate=False,
+    keep_alive=True,
+    profiles=(),
+):
+    statuses = {}
+    per_connection = max(requests // connections, 1)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            worker(
+                port,
+                path,
+                per_connection,
+                revalidate,
+                keep_alive,
+                profiles[offset:] + profiles[:offset],
+                statuses,
+            )
+            # Соединения начинают с разных профилей, равномерно по списку
+            for offset in (i * len(profiles) // connections for i in range(connections))
+        )
+    )
+    elapsed = time.perf_counter() - start
+    return per_connection * connections / elapsed, statuses
+
+
+def run(tasks: int, requests: int, connections: int, profiles: int) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        names = [f"user{i}" for i in range(profiles)]
+        for name in ["default"] + names:
+            path = os.path.join(profile_dir(name, directory), "tasks.json")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            count = tasks if name == "default" else max(tasks // 10, 1)
+            save_records(path, task_records(count), keyed_by="name")
+
+        scenarios = (
+            ("/api/tasks", "кеш", 256, {}, 1),
+            ("/api/tasks", "без кеша", 0, {}, 1),
+            ("/api/tasks", "304", 256, {"revalidate": True}, 1),
+            ("/api/stats", "кеш", 256, {}, 1),
+            ("/api/stats", "без keep-alive", 256, {"keep_alive": False}, 1),
+            ("/api/stats", f"{profiles} профилей", 256, {"profiles": names}, profiles),
+            ("/api/stats", "LRU < профилей", 256, {"profiles": names}, profiles // 2),
+        )
+        for endpoint, mode, cache_size, options, open_profiles in scenarios:
+            cache = ProfileCache(maxsize=open_profiles, root=directory)
+            api = ApiServer(cache, cache_size=cache_size)
+            with ServerThread(api) as server:
+                # Прогрев: профили открыты, кеши ответов заполнены
+                warmup = max(len(options.get("profiles", ())), connections)
+                asyncio.run(load(server.port, endpoint, warmup, connections, **options))
+                rate, statuses = asyncio.run(
+                    load(server.port, endpoint, requests, connections, **options)
+                )
+            results.append(
+                {"endpoint": endpoint, "mode": mode, "rps": rate, "statuses": statuses}
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=20)
+    parser.add_argument("--profiles", type=int, default=200)
+    args = parser.parse_args()
+
+    results = run(args.tasks, args.requests, args.connections, args.profiles)
+    print(f"{'адрес':12} {'режим':15} {'запр./с':>9}  ответы")
+    for row in results:
+        statuses = ", ".join(f"{k}: {v}" for k, v in sorted(row["statuses"].items()))
+        print(f"{row['endpoint']:12} {row['mode']:15} {row['rps']:9.0f}  {statuses}")
+
+
+if __name__ == "__main__":
+    main()
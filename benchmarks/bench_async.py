@@ -0,0 +1,114 @@
+"""Остановки цикла событий при конкурентных обращениях к ядру.
+
+Сравнивает синхронные методы, вызванные из корутин (блокируют цикл), с
+асинхронными: прогнозы с локального поставщика с задержкой и загрузку и
+сохранение задач. Пульс цикла - корутина, засыпающая на 1 мс, - измеряет
+самую долгую остановку цикла за прогон.
+
+Запуск: python -m benchmarks.bench_async --requests 100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.datagen import task_records
+from benchmarks.fake_weather import FakeWeatherServer
+from core.storage import save_records
+from core.task_manager import TaskManager
+from core.weather_service import WeatherService
+
+PULSE = 0.001
+
+
+async def measure(calls) -> dict:
+    """Время выполнения корутин calls и самая долгая остановка цикла"""
+    done = False
+    longest = 0.0
+
+    async def pulse():
+        nonlocal longest
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(PULSE)
+            now = time.perf_counter()
+            longest = max(longest, now - last - PULSE)
+            last = now
+
+    ticker = asyncio.ensure_future(pulse())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker
+    return {"seconds": elapsed, "max_stall_ms": longest * 1000}
+
+
+async def blocking(func, *args):
+    # Так выглядит прямой вызов синхронного ядра из сервиса на asyncio
+    return func(*args)
+
+
+async def task_roundtrip_async(manager: TaskManager):
+    await manager.load_data_async()
+    await manager.save_data_async()
+
+
+async def task_roundtrip_blocking(manager: TaskManager):
+    manager.load_data()
+    manager.save_data()
+
+
+async def run(requests: int, latency: float, tasks: int, rounds: int) -> list:
+    results = []
+    with FakeWeatherServer(latency) as server:
+        service = WeatherService(server.url)
+        for mode, calls in (
+            ("sync", [blocking(service.get_forecast) for _ in range(requests)]),
+            ("async", [service.get_forecast_async() for _ in range(requests)]),
+        ):
+            row = await measure(calls)
+            row.update(scenario="прогноз", mode=mode, count=requests)
+            results.append(row)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        save_records(path, task_records(tasks), keyed_by="name")
+        manager = TaskManager(path)
+        for mode, roundtrip in (
+            ("sync", task_roundtrip_blocking),
+            ("async", task_roundtrip_async),
+        ):
+            row = await measure([roundtrip(manager) for _ in range(rounds)])
+            row.update(scenario=f"задачи {tasks}", mode=mode, count=rounds)
+            results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="задержка, с")
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=10, help="загрузок+сохранений")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests, args.latency, args.tasks, args.rounds))
+
+    print(
+        f"{'сценарий':14} {'режим':6} {'вызовов':>8} {'с':>8} {'выз./с':>9} "
+        f"{'макс. остановка, мс':>20}"
+    )
+    for row in results:
+        print(
+            f"{row['scenario']:14} {row['mode']:6} {row['count']:8} "
+            f"{row['seconds']:8.3f} {row['count'] / row['seconds']:9.1f} "
+            f"{row['max_stall_ms']:20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
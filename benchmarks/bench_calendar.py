@@ -0,0 +1,61 @@
+"""Бенчмарки запросов CalendarManager: месяц, год, повестка, день, ближайшие."""
+
+import os
+
+from benchmarks.datagen import event_records
+from benchmarks.harness import Case
+from core.calendar_manager import CalendarManager
+from core.storage import save_records
+
+
+def cases(sizes, workdir: str):
+    for size in sizes:
+        path = os.path.join(workdir, f"calendar-{size}.json")
+
+        def manager(size=size, path=path):
+            if not os.path.exists(path):
+                save_records(path, event_records(size))
+            return CalendarManager(path)
+
+        yield Case(
+            "calendar",
+            "events_by_month",
+            lambda m: m.get_events_by_month(2025, 6),
+            setup=manager,
+            size=size,
+        )
+        yield Case(
+            "calendar",
+            "events_for_calendar",
+            lambda m: m.get_events_for_calendar(2025, 6),
+            setup=manager,
+            size=size,
+        )
+        yield Case(
+            "calendar",
+            "day_counts_year",
+            lambda m: m.get_day_counts(2025),
+            setup=manager,
+            size=size,
+        )
+        yield Case(
+            "calendar",
+            "agenda_page",
+            lambda m: m.get_agenda("2025-06-01", limit=10),
+            setup=manager,
+            size=size,
+        )
+        yield Case(
+            "calendar",
+            "events_by_date",
+            lambda m: m.get_events_by_date("2025-06-15"),
+            setup=manager,
+            size=size,
+        )
+        yield Case(
+            "calendar",
+            "upcoming_events",
+            lambda m: m.get_upcoming_events(7),
+            setup=manager,
+            size=size,
+        )
@@ -0,0 +1,104 @@
+"""Бенчмарки игровых движков: проверка победителя, операции и повтор партий.
+
+Тетрис запускается с фиксированным зерном, поэтому фигуры и записанная
+партия одинаковы в каждом прогоне. Партия также пишется в файл повтора
+(ходы раз в 300 мс) - на нем меряются чтение журнала и перемотка.
+"""
+
+import os
+
+from benchmarks.datagen import tetris_session
+from benchmarks.harness import Case
+from core.game_manager import SimpleTetris, TicTacToe
+from core.replay import ReplayPlayer, ReplayReader, ReplayWriter
+from core.rng import MoveStream
+
+SEED = 2025
+
+BOARDS = {
+    "empty": [" "] * 9,
+    "midgame": ["X", "O", " ", " ", "X", " ", "O", " ", " "],
+    "draw": ["X", "O", "X", "X", "O", "O", "O", "X", "X"],
+    "win_last_line": ["O", "X", "O", "X", "O", "X", "X", "X", "X"],
+}
+
+
+def _tic_tac_toe(board):
+    game = TicTacToe()
+    game.board = list(board)
+    return game
+
+
+def _replay_file(moves: MoveStream, path: str) -> str:
+    clock = iter(range(0, 10**9, 300))
+    with ReplayWriter(
+        path, "tetris", moves.seed, clock=lambda: next(clock) / 1000
+    ) as writer:
+        writer.sync(moves)
+    return path
+
+
+def _seek_back_and_forth(player: ReplayPlayer):
+    middle = player.reader.frame_count // 2
+    player.seek(middle)
+    player.seek(middle // 2)
+    return player.seek(player.reader.frame_count)
+
+
+def cases(sizes, workdir: str):
+    for name, board in BOARDS.items():
+        yield Case(
+            "games",
+            f"tictactoe_check_winner_{name}",
+            lambda game: game.check_winner(),
+            setup=lambda board=board: _tic_tac_toe(board),
+        )
+
+    yield Case(
+        "games",
+        "tetris_create_random_piece",
+        lambda tetris: tetris.create_random_piece(),
+        setup=lambda: SimpleTetris(SEED),
+    )
+    yield Case(
+        "games",
+        "tetris_display_board",
+        lambda tetris: tetris.display_board(),
+        setup=lambda: tetris_session(SEED, 20),
+    )
+    session = tetris_session(SEED).moves
+    yield Case(
+        "games",
+        "tetris_replay",
+        SimpleTetris.replay,
+        setup=lambda: session,
+        size=len(session),
+    )
+    path = _replay_file(session, os.path.join(workdir, "tetris.shxr"))
+    yield Case(
+        "games",
+        "replay_decode",
+        lambda reader: sum(1 for _ in reader.frames()),
+        setup=lambda: ReplayReader(path),
+        size=len(session),
+    )
+    yield Case(
+        "games",
+        "replay_run_headless",
+        lambda reader: ReplayPlayer(reader).run(),
+        setup=lambda: ReplayReader(path),
+        size=len(session),
+    )
+    yield Case(
+        "games",
+        "replay_seek",
+        _seek_back_and_forth,
+        setup=lambda: ReplayPlayer(ReplayReader(path)),
+        size=len(session),
+    )
+    yield Case(
+        "games",
+        "tictactoe_replay",
+        TicTacToe.replay,
+        setup=lambda: MoveStream(moves=[4, 0, 2, 6, 3, 5, 1, 7, 8]),
+    )
@@ -0,0 +1,93 @@
+"""Скорость и пиковая память загрузки файлов данных.
+
+Сравнивает прежнюю загрузку (json.load всего файла, затем from_dict) с
+потоковой загрузкой TaskManager.load_data для форматов .json и .jsonl.
+
+Запуск: python -m benchmarks.bench_load --sizes 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.datagen import task_records
+from core.storage import save_records
+from core.task_manager import Task, TaskManager
+
+
+def legacy_load(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: Task.from_dict(task_data) for name, task_data in data.items()}
+
+
+def streaming_load(path: str):
+    return TaskManager(path).tasks
+
+
+def measure(loader, path: str) -> dict:
+    """Время загрузки, МБ/с и пиковая память сверх удерживаемых объектов"""
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    start = time.perf_counter()
+    loader(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = loader(path)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "seconds": elapsed,
+        "mb_per_sec": size_mb / elapsed if elapsed > 0 else 0.0,
+        "overhead_mb": (peak - retained) / 1024 / 1024,
+    }
+
+
+def run(sizes, directory: str) -> list:
+    results = []
+    for count in sizes:
+        json_path = os.path.join(directory, f"tasks-{count}.json")
+        jsonl_path = os.path.join(directory, f"tasks-{count}.jsonl")
+        save_records(json_path, task_records(count), keyed_by="name")
+        save_records(jsonl_path, task_records(count))
+
+        for name, loader, path in (
+            ("json.load", legacy_load, json_path),
+            ("stream .json", streaming_load, json_path),
+            ("stream .jsonl", streaming_load, jsonl_path),
+        ):
+            row = measure(loader, path)
+            row.update(
+                loader=name,
+                records=count,
+                file_mb=os.path.getsize(path) / 1024 / 1024,
+            )
+            results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = run(args.sizes, directory)
+
+    print(
+        f"{'записей':>8} {'загрузчик':14} {'файл, МБ':>9} {'с':>8} {'МБ/с':>7} {'пик сверх, МБ':>14}"
+    )
+    for row in results:
+        print(
+            f"{row['records']:8} {row['loader']:14} {row['file_mb']:9.2f} "
+            f"{row['seconds']:8.3f} {row['mb_per_sec']:7.1f} {row['overhead_mb']:14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
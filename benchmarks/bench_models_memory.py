@@ -0,0 +1,113 @@
+"""Замер памяти на объект для моделей Task и CalendarEvent.
+
+Сравнивает текущие модели на __slots__ с прежним представлением
+(обычный класс с __dict__, ISO-строки и список словарей в истории).
+
+Запуск: python -m benchmarks.bench_models_memory --count 100000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.datagen import event_records, task_records
+from core.calendar_manager import CalendarEvent
+from core.task_manager import Task
+
+
+class LegacyTask:
+    """Прежняя модель задачи - для сравнения"""
+
+    def __init__(self, name, description="", target_count=1, priority="medium"):
+        self.name = name
+        self.description = description
+        self.target_count = target_count
+        self.current_count = 0
+        self.priority = priority
+        self.created_at = datetime.now().isoformat()
+        self.completed_at = None
+        self.history = []
+
+
+class LegacyCalendarEvent:
+    """Прежняя модель события - для сравнения"""
+
+    def __init__(self, title, date, description="", event_type="personal"):
+        self.title = title
+        self.date = date
+        self.description = description
+        self.event_type = event_type
+        self.created_at = datetime.now().isoformat()
+
+
+def _legacy_task(data):
+    task = LegacyTask(
+        data["name"], data["description"], data["target_count"], data["priority"]
+    )
+    task.current_count = data["current_count"]
+    task.created_at = data["created_at"]
+    task.completed_at = data["completed_at"]
+    task.history = data["history"]
+    return task
+
+
+def _legacy_event(data):
+    event = LegacyCalendarEvent(
+        data["title"], data["date"], data["description"], data["event_type"]
+    )
+    event.created_at = data["created_at"]
+    return event
+
+
+def measure(factory, records) -> float:
+    """Средняя удерживаемая память (байт) на объект, загруженный из JSON
+
+    Записи разбираются из JSON внутри замера, как при load_data, поэтому
+    учитываются и строки/словари, на которые объект продолжает ссылаться.
+    """
+    lines = [json.dumps(record, ensure_ascii=False) for record in records]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(json.loads(line)) for line in lines]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(lines)
+
+
+def run(count: int = 100_000, history: int = 5) -> dict:
+    results = {
+        "task": {
+            "before": measure(_legacy_task, task_records(count, history)),
+            "after": measure(Task.from_dict, task_records(count, history)),
+        },
+        "calendar_event": {
+            "before": measure(_legacy_event, event_records(count)),
+            "after": measure(CalendarEvent.from_dict, event_records(count)),
+        },
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--history", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.count, args.history)
+    print(f"Объектов: {args.count}, записей истории на задачу: {args.history}")
+    for model, sizes in results.items():
+        saved = 100 * (1 - sizes["after"] / sizes["before"])
+        print(
+            f"{model:15} до: {sizes['before']:8.0f} Б/объект  "
+            f"после: {sizes['after']:8.0f} Б/объект  (-{saved:.0f}%)"
+        )
+
+
+if __name__ == "__main__":
+    main()
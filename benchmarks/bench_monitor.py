@@ -0,0 +1,97 @@
+"""Бенчмарки монитора: замер системы и обход процессов по их количеству.
+
+Обход процессов измеряется на синтетическом дереве /proc, чтобы
+результат зависел только от числа процессов, а не от хоста.
+"""
+
+import os
+
+from benchmarks.harness import Case
+from core import system_monitor
+from core.metrics_history import MetricsRecorder
+from core.system_monitor import METRICS, ProcessScanner, SystemMonitor
+
+MAX_PROCESSES = 10_000
+
+
+def make_fake_proc(root: str, count: int) -> str:
+    """Создает каталог вида /proc с count процессами"""
+    if os.path.isdir(root):
+        return root
+    for pid in range(1, count + 1):
+        directory = os.path.join(root, str(pid))
+        os.makedirs(directory)
+        fields = ["S", "1", "1", "1", "0", "-1", "4194560", "100", "0", "0", "0"]
+        fields += [str(pid % 97), str(pid % 13)]  # utime, stime
+        fields += ["0", "0", "20", "0", "1", "0", str(pid), "1000000"]
+        fields += [str(pid % 5000 + 100)]  # rss в страницах
+        with open(os.path.join(directory, "stat"), "w") as f:
+            f.write(f"{pid} (worker {pid}) {' '.join(fields)}\n")
+        with open(os.path.join(directory, "cmdline"), "wb") as f:
+            f.write(f"/usr/bin/worker\0--id\0{pid}\0".encode())
+    return root
+
+
+def cases(sizes, workdir: str):
+    if system_monitor.available():
+
+        def monitor():
+            instance = SystemMonitor()
+            instance.sample()
+            return instance
+
+        yield Case("monitor", "sample", lambda m: m.sample(), setup=monitor)
+
+    yield from history_cases(workdir)
+
+    for count in sizes:
+        if count > MAX_PROCESSES:
+            continue
+
+        def scanner(count=count):
+            root = make_fake_proc(os.path.join(workdir, f"proc-{count}"), count)
+            instance = ProcessScanner(proc=root)
+            instance.scan()
+            return instance
+
+        yield Case(
+            "monitor", "process_scan", lambda s: s.scan(), setup=scanner, size=count
+        )
+        yield Case(
+            "monitor",
+            "process_top10",
+            lambda s: s.top(10, "cpu"),
+            setup=scanner,
+            size=count,
+        )
+
+
+def history_cases(workdir: str):
+    def recorder():
+        instance = MetricsRecorder(os.path.join(workdir, "metrics.bin"))
+        sample = {metric: 1.0 for metric in METRICS}
+        # Заполняем сутки поминутной истории
+        start = 1_700_000_000
+        for second in range(0, 86400, 15):
+            instance.record(sample, start + second)
+        instance.now = start + 86400
+        return instance
+
+    yield Case(
+        "monitor",
+        "history_record",
+        lambda r: r.record({"cpu_percent": 1.0}, r.now),
+        setup=recorder,
+    )
+    yield Case(
+        "monitor",
+        "history_read_hour_1m",
+        lambda r: r.read("1m", 3600, r.now),
+        setup=recorder,
+    )
+    yield Case(
+        "monitor",
+        "history_read_day_1m",
+        lambda r: r.read("1m", 86400, r.now),
+        setup=recorder,
+    )
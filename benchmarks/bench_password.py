@@ -0,0 +1,82 @@
+"""Бенчмарки PasswordGenerator: генерация, политики, парольные фразы и проверка."""
+
+from benchmarks.harness import Case
+from core.password_generator import PasswordGenerator
+from core.password_policy import PasswordPolicy
+from core.wordlist import get_wordlist
+
+
+def cases(sizes, workdir: str):
+    generator = PasswordGenerator()
+
+    for length in (12, 32, 128):
+        yield Case(
+            "password",
+            f"generate_len{length}",
+            lambda g, length=length: g.generate_password(length=length),
+            setup=lambda: generator,
+        )
+        password = generator.generate_password(length=length)
+        yield Case(
+            "password",
+            f"check_len{length}",
+            lambda g, password=password: g.check_password_strength(password),
+            setup=lambda: generator,
+        )
+
+    yield Case(
+        "password",
+        "generate_multiple_100",
+        lambda g: g.generate_multiple_passwords(count=100),
+        setup=lambda: generator,
+    )
+
+    # Строгая политика должна стоить столько же, сколько обычная генерация
+    policies = {
+        "lax": PasswordPolicy(16),
+        "strict": PasswordPolicy(
+            16,
+            lower=2,
+            upper=2,
+            digits=4,
+            special=3,
+            exclude_ambiguous=True,
+            exclude="%^&",
+            max_repeat=1,
+        ),
+    }
+    for name, policy in policies.items():
+        yield Case(
+            "password",
+            f"policy_{name}_len16",
+            lambda g, policy=policy: g.generate_password(policy=policy),
+            setup=lambda: generator,
+        )
+    strict = policies["strict"]
+    password = generator.generate_password(policy=strict)
+    yield Case(
+        "password",
+        "policy_check_len16",
+        lambda g: g.check_password_strength(password, strict),
+        setup=lambda: generator,
+    )
+
+    for language in ("en", "ru"):
+        yield Case(
+            "password",
+            f"passphrase_6_{language}",
+            lambda g, language=language: g.generate_passphrase(language=language),
+            setup=lambda: generator,
+        )
+    yield Case(
+        "password",
+        "passphrase_multiple_100",
+        lambda g: g.generate_multiple_passwords(count=100, passphrase=True),
+        setup=lambda: generator,
+    )
+    yield Case(
+        "password",
+        "wordlist_lookup",
+        lambda wordlist: wordlist[len(wordlist) // 2],
+        setup=lambda: get_wordlist("ru"),
+    )
@@ -0,0 +1,31 @@
+"""Бенчмарки планировщика напоминаний при разном числе ожидающих."""
+
+import itertools
+import random
+
+from benchmarks.harness import Case
+from core.reminders import ReminderScheduler
+
+
+def cases(sizes, workdir: str):
+    for size in sizes:
+
+        def scheduler(size=size):
+            rng = random.Random(size)
+            instance = ReminderScheduler(lambda reminder: None, clock=lambda: 0.0)
+            for key in range(size):
+                instance.schedule(key, rng.uniform(1, 1e6), "bench")
+            return instance, itertools.count(size)
+
+        def churn(state):
+            # Новое напоминание и отмена только что добавленного
+            instance, keys = state
+            key = next(keys)
+            instance.schedule(key, 5e5, "bench")
+            instance.cancel(key)
+
+        def next_due(state):
+            return state[0].next_due()
+
+        yield Case("reminders", "schedule_cancel", churn, setup=scheduler, size=size)
+        yield Case("reminders", "next_due", next_due, setup=scheduler, size=size)
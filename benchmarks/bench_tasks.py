@@ -0,0 +1,81 @@
+"""Бенчмарки TaskManager: загрузка, сохранение, прогресс, статистика, граф."""
+
+import os
+
+from benchmarks.datagen import task_records
+from benchmarks.harness import Case
+from core.storage import save_records
+from core.task_graph import TaskGraph
+from core.task_manager import Task, TaskManager
+
+
+def dependency_tasks(count: int):
+    """Задачи, каждая из которых зависит от двух предыдущих"""
+    tasks = []
+    for i in range(count):
+        depends_on = [f"task-{j}" for j in (i - 1, i // 2) if 0 <= j < i]
+        tasks.append(
+            Task(
+                f"task-{i}",
+                priority=("low", "medium", "high")[i % 3],
+                depends_on=depends_on,
+            )
+        )
+    return tasks
+
+
+def cases(sizes, workdir: str):
+    for size in sizes:
+        path = os.path.join(workdir, f"tasks-{size}.json")
+
+        def prepare(size=size, path=path):
+            if not os.path.exists(path):
+                save_records(path, task_records(size), keyed_by="name")
+            return path
+
+        def manager(prepare=prepare):
+            return TaskManager(prepare())
+
+        yield Case("tasks", "load", TaskManager, setup=prepare, size=size)
+        yield Case("tasks", "save", lambda m: m.save_data(), setup=manager, size=size)
+        yield Case(
+            "tasks",
+            "increment",
+            lambda m: m.increment_task("task-1"),
+            setup=manager,
+            size=size,
+        )
+        yield Case(
+            "tasks",
+            "get_statistics",
+            lambda m: m.get_statistics(),
+            setup=manager,
+            size=size,
+        )
+
+        def graph(size=size):
+            instance = TaskGraph()
+            instance.rebuild(dependency_tasks(size))
+            return instance
+
+        def complete_reopen(g):
+            # Завершение корня и его сброс: пересчет только зависимых
+            root = g.tasks["task-0"]
+            root.increment()
+            g.completed(root.name)
+            root.reset()
+            g.reopened(root.name)
+
+        yield Case(
+            "tasks",
+            "graph_rebuild",
+            lambda tasks: TaskGraph().rebuild(tasks),
+            setup=lambda size=size: dependency_tasks(size),
+            size=size,
+        )
+        yield Case(
+            "tasks", "graph_complete_reopen", complete_reopen, setup=graph, size=size
+        )
+        yield Case(
+            "tasks", "graph_next10", lambda g: g.next_tasks(10), setup=graph, size=size
+        )
@@ -0,0 +1,134 @@
+"""Время открытия раздела погоды при медленном и недоступном поставщике.
+
+Сравнивает прямой запрос при открытии (как было) с чтением кеша, который
+заполняет фоновый WeatherRefresher: поставщик отвечает сразу, с
+задержкой ``--latency``, ошибкой 503 и не отвечает вовсе (сервер
+остановлен). Отдельно проверяется, что при коротком сроке годности поток
+успевает обновлять прогноз заранее: открытия не видят устаревших данных.
+
+Запуск: python -m benchmarks.bench_weather --opens 20 --latency 0.5
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.fake_weather import FakeWeatherServer
+from core.weather_cache import WeatherCache, WeatherRefresher
+from core.weather_service import WeatherService
+
+
+def open_direct(service: WeatherService):
+    try:
+        return service.get_forecast()
+    except Exception:
+        return None
+
+
+def open_cached(refresher: WeatherRefresher):
+    return refresher.forecast(refresher.cities[0])[0]
+
+
+def measure(open_section, opens: int) -> dict:
+    times = []
+    shown = 0
+    for _ in range(opens):
+        start = time.perf_counter()
+        forecast = open_section()
+        times.append(time.perf_counter() - start)
+        shown += forecast is not None
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "max_ms": max(times) * 1000,
+        "shown": shown,
+        "opens": opens,
+    }
+
+
+def run(opens: int, latency: float, timeout: float) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        with FakeWeatherServer() as server:
+            service = WeatherService(server.url, timeout=timeout)
+            cache = WeatherCache(os.path.join(directory, "weather_cache.json"))
+            refresher = WeatherRefresher(service, cache)
+            refresher.start()
+            refresher.wait(refresher.cities[0], timeout)
+
+            for provider, server_latency, status in (
+                ("быстрый", 0.0, 200),
+                (f"задержка {latency} с", latency, 200),
+                ("ошибка 503", 0.0, 503),
+            ):
+                server.latency, server.status = server_latency, status
+                for mode, open_section in (
+                    ("запрос", lambda: open_direct(service)),
+                    ("кеш", lambda: open_cached(refresher)),
+                ):
+                    row = measure(open_section, opens)
+                    row.update(provider=provider, mode=mode)
+                    results.append(row)
+            refresher.stop()
+
+        # Сервер остановлен: соединение отклоняется
+        for mode, open_section in (
+            ("запрос", lambda: open_direct(service)),
+            ("кеш", lambda: open_cached(refresher)),
+        ):
+            row = measure(open_section, opens)
+            row.update(provider="недоступен", mode=mode)
+            results.append(row)
+
+        # Короткий срок годности: фоновый поток должен обновлять заранее
+        with FakeWeatherServer(latency=latency / 5) as server:
+            service = WeatherService(server.url, timeout=timeout)
+            cache = WeatherCache(os.path.join(directory, "short_ttl.json"))
+            refresher = WeatherRefresher(service, cache, ttl=1.0, ahead=0.5)
+            refresher.start()
+            refresher.wait(refresher.cities[0], timeout)
+            stale = 0
+            for _ in range(opens):
+                time.sleep(0.1)
+                entry = refresher.forecast(refresher.cities[0])[1]
+                stale += refresher.is_stale(entry)
+            refresher.stop()
+            results.append(
+                {
+                    "provider": "срок годности 1 с",
+                    "mode": "кеш",
+                    "stale": stale,
+                    "opens": opens,
+                    "requests": server.requests,
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--opens", type=int, default=20, help="открытий раздела")
+    parser.add_argument("--latency", type=float, default=0.5, help="задержка, с")
+    parser.add_argument("--timeout", type=float, default=3.0, help="таймаут, с")
+    args = parser.parse_args()
+
+    results = run(args.opens, args.latency, args.timeout)
+    print(
+        f"{'поставщик':18} {'режим':7} {'медиана, мс':>12} {'макс., мс':>10}  показан"
+    )
+    for row in results:
+        if "stale" in row:
+            print(
+                f"{row['provider']:18} {row['mode']:7} устаревших открытий: "
+                f"{row['stale']} из {row['opens']}, запросов: {row['requests']}"
+            )
+            continue
+        print(
+            f"{row['provider']:18} {row['mode']:7} {row['median_ms']:12.2f} "
+            f"{row['max_ms']:10.2f}  {row['shown']}/{row['opens']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Генераторы синтетических данных для бенчмарков.
+
+Данные детерминированы: одинаковые аргументы дают одинаковые записи,
+поэтому результаты разных коммитов можно сравнивать между собой.
+"""
+
+from datetime import datetime, timedelta
+
+from core.game_manager import SimpleTetris
+from core.rng import GameRng
+
+PRIORITIES = ("low", "medium", "high")
+EVENT_TYPES = ("personal", "work", "holiday")
+BASE_DATE = datetime(2025, 1, 1)
+
+
+def task_records(count: int, history: int = 3):
+    """Записи задач в формате Task.to_dict"""
+    for i in range(count):
+        created = BASE_DATE + timedelta(seconds=i)
+        done = i % 4 == 0
+        yield {
+            "name": f"task-{i}",
+            "description": f"Описание задачи номер {i}",
+            "target_count": history + 1,
+            "current_count": history + 1 if done else history,
+            "priority": PRIORITIES[i % 3],
+            "created_at": created.isoformat(),
+            "completed_at": (created + timedelta(days=1)).isoformat() if done else None,
+            "history": [
+                {
+                    "timestamp": (created + timedelta(minutes=j)).isoformat(),
+                    "action": "increment",
+                }
+                for j in range(history)
+            ],
+        }
+
+
+def event_records(count: int, days: int = 730):
+    """Записи событий в формате CalendarEvent.to_dict, равномерно на ``days`` дней"""
+    for i in range(count):
+        date = BASE_DATE + timedelta(days=i % days)
+        yield {
+            "title": f"event-{i}",
+            "date": date.strftime("%Y-%m-%d"),
+            "description": "",
+            "event_type": EVENT_TYPES[i % 3],
+            "created_at": (BASE_DATE + timedelta(seconds=i)).isoformat(),
+        }
+
+
+def _placement_score(game, cells) -> float:
+    """Оценка поля после укладки: линии, высота, дыры и неровность"""
+    filled = {
+        (x, y)
+        for y, row in enumerate(game.board)
+        for x, cell in enumerate(row)
+        if cell != " "
+    }
+    filled.update(cells)
+    full = [
+        y
+        for y in range(game.board_height)
+        if all((x, y) in filled for x in range(game.board_width))
+    ]
+    heights, holes = [], 0
+    for x in range(game.board_width):
+        column = [y for y in range(game.board_height) if (x, y) in filled]
+        top = column[0] if column else game.board_height
+        heights.append(game.board_height - top)
+        holes += game.board_height - top - len(column)
+    bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    return 8 * len(full) - 0.5 * sum(heights) - 4 * holes - bumpiness
+
+
+def tetris_session(seed: int, pieces: int = 200):
+    """Партия Тетриса жадным ботом; при равной оценке ход выбирает GameRng"""
+    game = SimpleTetris(seed)
+    bot = GameRng(seed + 1)
+    for _ in range(pieces):
+        if game.game_over:
+            break
+        piece = game.current_piece
+        best, shape = [], piece.shape
+        for rotation in range(4):
+            for x in range(-2, game.board_width):
+                if not game.fits(piece, shape, x, piece.y):
+                    continue
+                y = piece.y
+                while game.fits(piece, shape, x, y + 1):
+                    y += 1
+                score = _placement_score(game, set(piece.cells(shape, x, y)))
+                if best and score > best[0][0]:
+                    best = []
+                if not best or score == best[0][0]:
+                    best.append((score, rotation, x))
+            shape = [list(row) for row in zip(*shape[::-1])]
+        if best:
+            _, rotation, x = bot.choice(best)
+            for _ in range(rotation):
+                game.apply("rotate")
+            shift = x - game.current_piece.x
+            for _ in range(abs(shift)):
+                game.apply("left" if shift < 0 else "right")
+        if bot.randrange(4) == 0:
+            game.apply("tick")
+        game.apply("drop")
+    return game
@@ -0,0 +1,111 @@
+"""Локальный поставщик прогнозов с искусственной задержкой.
+
+Отвечает на ``GET /forecast?city=...&days=...`` в формате, который ждет
+WeatherService. Нужен для бенчмарков и ручной проверки медленного или
+недоступного поставщика:
+
+    python -m benchmarks.fake_weather --port 8765 --latency 3
+    SHORIEXT_WEATHER_URL=http://127.0.0.1:8765 python main.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlsplit
+
+CONDITIONS = ["Солнечно", "Облачно", "Дождь", "Снег", "Гроза"]
+
+
+def forecast_days(city: str, days: int) -> list:
+    start = date.today()
+    shift = sum(map(ord, city)) % 10
+    return [
+        {
+            "date": (start + timedelta(days=i)).isoformat(),
+            "condition": CONDITIONS[(i + shift) % len(CONDITIONS)],
+            "temp_min": shift - 5 + i,
+            "temp_max": shift + 3 + i,
+        }
+        for i in range(days)
+    ]
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # сотни одновременных подключений в бенчмарке
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server.owner
+        server.requests += 1
+        if server.latency:
+            time.sleep(server.latency)
+        parts = urlsplit(self.path)
+        if parts.path != "/forecast" or server.status != 200:
+            self.send_error(404 if server.status == 200 else server.status)
+            return
+        query = parse_qs(parts.query)
+        city = query.get("city", ["Москва"])[0]
+        days = int(query.get("days", ["7"])[0])
+        body = json.dumps(forecast_days(city, days), ensure_ascii=False).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeWeatherServer:
+    """Сервер в фоновом потоке; latency и status можно менять на ходу"""
+
+    def __init__(self, latency: float = 0.0, port: int = 0, status: int = 200):
+        self.latency = latency
+        self.status = status
+        self.requests = 0
+        self._server = _Server(("127.0.0.1", port), _Handler)
+        self._server.owner = self
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> "FakeWeatherServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="задержка, с")
+    parser.add_argument("--status", type=int, default=200, help="код ответа")
+    args = parser.parse_args()
+
+    server = FakeWeatherServer(args.latency, args.port, args.status)
+    print(f"Поставщик прогнозов: {server.url} (задержка {args.latency} с)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Минимальный харнесс бенчмарков на timeit.
+
+Каждый замер - ``Case``: подготовка состояния (не входит в замер) и
+измеряемая функция. Результаты сохраняются в JSON и сравниваются с
+предыдущим прогоном, чтобы ловить регрессии между коммитами.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class Case:
+    def __init__(
+        self,
+        group: str,
+        name: str,
+        func: Callable[[Any], Any],
+        setup: Optional[Callable[[], Any]] = None,
+        size: Optional[int] = None,
+    ):
+        self.group = group
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.size = size
+
+    @property
+    def key(self) -> str:
+        suffix = f"[{self.size}]" if self.size is not None else ""
+        return f"{self.group}.{self.name}{suffix}"
+
+
+def measure(case: Case, min_time: float = 0.2, repeat: int = 3) -> Dict[str, float]:
+    """Лучшее время одного вызова из нескольких серий"""
+    state = case.setup() if case.setup else None
+    timer = timeit.Timer(lambda: case.func(state))
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [elapsed]
+    # Долгие операции (секунды на вызов) не повторяем лишний раз
+    if elapsed / number < 1.0:
+        timings += timer.repeat(repeat=repeat - 1, number=number)
+
+    best = min(timings) / number
+    return {
+        "seconds": best,
+        "ops_per_sec": 1 / best if best > 0 else 0.0,
+        "number": number,
+    }
+
+
+def run_cases(
+    cases: Iterable[Case], pattern: str = "", log: Callable[[str], None] = print
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for case in cases:
+        if pattern and pattern not in case.key:
+            continue
+        result = measure(case)
+        results[case.key] = result
+        log(
+            f"{case.key:45} {result['seconds'] * 1e6:14.2f} мкс "
+            f"{result['ops_per_sec']:14.1f} оп/с"
+        )
+    return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(path: str, results: Dict[str, Dict[str, float]]):
+    payload = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float = 0.2,
+) -> List[Dict[str, Any]]:
+    """Замеры, ставшие медленнее базовых более чем на ``threshold``"""
+    regressions = []
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        ratio = result["seconds"] / baseline[key]["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    "key": key,
+                    "baseline": baseline[key]["seconds"],
+                    "current": result["seconds"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
@@ -0,0 +1,82 @@
+"""Запуск всех бенчмарков с сохранением результатов в JSON.
+
+Примеры:
+    python -m benchmarks.run
+    python -m benchmarks.run --full --output before.json
+    python -m benchmarks.run --compare before.json --filter tasks
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import (
+    bench_calendar,
+    bench_games,
+    bench_monitor,
+    bench_password,
+    bench_reminders,
+    bench_tasks,
+)
+from benchmarks.harness import compare, load_results, run_cases, save_results
+
+MODULES = [
+    bench_tasks,
+    bench_calendar,
+    bench_password,
+    bench_games,
+    bench_monitor,
+    bench_reminders,
+]
+DEFAULT_SIZES = [10, 1000, 100_000]
+FULL_SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки console-util")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--full", action="store_true", help="размеры от 10 до 1 000 000 записей"
+    )
+    parser.add_argument("--filter", default="", help="подстрока имени замера")
+    parser.add_argument("--output", help="файл результатов JSON")
+    parser.add_argument("--compare", help="результаты прошлого прогона для сравнения")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="допустимое замедление (0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    sizes = FULL_SIZES if args.full else args.sizes
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = (case for module in MODULES for case in module.cases(sizes, workdir))
+        results = run_cases(cases, args.filter)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S.json"))
+    save_results(output, results)
+    print(f"\nРезультаты сохранены: {output}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare), results, args.threshold)
+        if not regressions:
+            print("Регрессий не найдено")
+            return
+        print(f"Регрессии (медленнее более чем на {args.threshold:.0%}):")
+        for item in regressions:
+            print(
+                f"  {item['key']:45} {item['baseline'] * 1e6:12.2f} -> "
+                f"{item['current'] * 1e6:12.2f} мкс (x{item['ratio']:.2f})"
+            )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
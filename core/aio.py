@@ -0,0 +1,124 @@
+"""Асинхронный доступ к ядру для встраивания в сервисы на asyncio.
+
+Чтение файлов менеджеров и разбор записей в новые модели идут в пуле
+потоков (``run_blocking``); готовый результат подменяет данные менеджера
+в потоке цикла событий. При сохранении словари записей строятся в цикле,
+а пул только сериализует и пишет готовый снимок, так что живые модели
+трогает только поток цикла. Синхронное сохранение во время асинхронного
+не ждет записи файла: ее повторяет сам ``save_data_async``.
+
+``fetch_json`` - неблокирующий HTTP-клиент на asyncio-потоках без
+сторонних зависимостей (GET, ответ в JSON).
+"""
+
+import asyncio
+import functools
+import json
+import ssl
+from typing import Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_TIMEOUT = 10.0
+MAX_RESPONSE_SIZE = 16 * 1024 * 1024
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, reason: str, url: str):
+        super().__init__(f"{url}: HTTP {status} {reason}")
+        self.status = status
+
+
+async def run_blocking(func, *args, executor=None, **kwargs):
+    """Выполняет блокирующую функцию в пуле потоков, не останавливая цикл"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    body = bytearray()
+    while True:
+        line = await reader.readline()
+        size = int(line.split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            # Завершающие заголовки (trailer) до пустой строки
+            while (await reader.readline()).strip():
+                pass
+            return bytes(body)
+        body += await reader.readexactly(size)
+        await reader.readexactly(2)  # \r\n после блока
+        if len(body) > MAX_RESPONSE_SIZE:
+            raise ValueError("Слишком большой ответ")
+
+
+async def _read_to_eof(reader: asyncio.StreamReader) -> bytes:
+    """Тело без длины и chunked: до закрытия соединения (Connection: close)"""
+    body = bytearray()
+    while True:
+        # read(n) возвращает то, что уже пришло, - один сегмент, а не все тело
+        chunk = await reader.read(64 * 1024)
+        if not chunk:
+            return bytes(body)
+        body += chunk
+        if len(body) > MAX_RESPONSE_SIZE:
+            raise ValueError("Слишком большой ответ")
+
+
+async def _get(url: str, headers: Dict[str, str]) -> bytes:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"Неподдерживаемая схема: {url}")
+    secure = parts.scheme == "https"
+    port = parts.port or (443 if secure else 80)
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, port, ssl=ssl.create_default_context() if secure else None
+    )
+    try:
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        lines = [f"GET {target} HTTP/1.1", f"Host: {parts.netloc}"]
+        lines += ["Accept: application/json", "Connection: close"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        status_line = (await reader.readline()).decode("latin-1")
+        try:
+            _, status, reason = (status_line.rstrip("\r\n").split(" ", 2) + [""])[:3]
+            status = int(status)
+        except ValueError:
+            raise ValueError(f"{url}: некорректный ответ {status_line!r}")
+        response_headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await _read_chunked(reader)
+        elif "content-length" in response_headers:
+            body = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            body = await _read_to_eof(reader)
+        if not 200 <= status < 300:
+            raise HttpError(status, reason, url)
+        return body
+    finally:
+        writer.close()
+
+
+async def fetch_json(
+    url: str,
+    params: Optional[Dict[str, object]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+):
+    """GET-запрос без блокировки цикла; возвращает разобранный JSON"""
+    if params:
+        url += ("&" if "?" in url else "?") + urlencode(params)
+    body = await asyncio.wait_for(_get(url, headers or {}), timeout)
+    return json.loads(body.decode("utf-8"))
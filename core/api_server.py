@@ -0,0 +1,413 @@
+"""Локальный HTTP/JSON API поверх менеджеров ядра (asyncio, только stdlib).
+
+Эндпоинты:
+
+* ``GET /api/tasks`` - все задачи (``?history=1`` - с историей);
+* ``GET /api/tasks/<имя>`` - одна задача (любое имя, в том числе ``next``);
+* ``GET /api/next-tasks`` - готовые к работе (``?count=10``);
+* ``GET /api/stats`` - статистика задач;
+* ``GET /api/events`` - события: все, за день (``?date=ГГГГ-ММ-ДД``),
+  за месяц (``?year=&month=``) или ближайшие (``?days=7``);
+* ``GET /api/weather`` - прогноз (``?city=&days=``);
+* ``GET /api/passwords`` - новые пароли (``?count=&length=``), не кешируются;
+* ``POST /api/passwords/check`` - ``{"password": ...}``: надежность и
+  соответствие сохраненной политике паролей;
+* ``GET /api/profiles`` - профили данных.
+
+Профиль задается заголовком ``X-Profile`` или параметром ``?profile=``
+(по умолчанию - профиль, выбранный при запуске); открытые профили
+держит LRU ``ProfileCache``.
+
+Ответы на чтение получают ETag из счетчика версии хранилища профиля
+(``TaskManager.version``, ``CalendarManager.version``); при совпадении
+с If-None-Match отдается 304 без тела. Готовые тела ответов лежат в LRU
+до смены версии, так что повторный запрос не сериализует данные заново.
+Соединения HTTP/1.1 остаются открытыми (keep-alive), пока клиент не
+закроет их или не промолчит ``KEEPALIVE_TIMEOUT`` секунд.
+
+Перед ответом файлы данных проверяются на изменения другими процессами
+(одна проверка stat) и при необходимости перечитываются в пуле потоков.
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from core.aio import run_blocking
+from core.password_generator import PasswordGenerator
+from core.password_policy import load_policy
+from core.profiles import (
+    Profile,
+    ProfileCache,
+    ProfileError,
+    current_profile,
+    list_profiles,
+    validate_name,
+)
+from core.profiling import instrument
+from core.weather_service import WeatherService
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+KEEPALIVE_TIMEOUT = 15.0
+MAX_HEADERS = 100
+MAX_BODY = 64 * 1024
+WEATHER_TTL = 600  # секунд на одну версию прогноза
+MAX_PASSWORDS = 100
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "headers", "body", "profile")
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body=b""):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = unquote(parts.path)
+        self.query = dict(parse_qsl(parts.query))
+        self.headers = headers
+        self.body = body
+        self.profile: Optional[Profile] = None
+
+    def int_param(self, name: str, default: int, low: int, high: int) -> int:
+        value = self.query.get(name)
+        if value is None:
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            raise ApiError(400, f"Параметр {name} должен быть числом")
+        if not low <= number <= high:
+            raise ApiError(400, f"Параметр {name} вне диапазона {low}..{high}")
+        return number
+
+    def json(self) -> dict:
+        try:
+            data = json.loads(self.body.decode("utf-8"))
+        except ValueError:
+            raise ApiError(400, "Тело запроса должно быть JSON")
+        if not isinstance(data, dict):
+            raise ApiError(400, "Ожидается JSON-объект")
+        return data
+
+
+class Response:
+    __slots__ = ("status", "body", "headers")
+
+    def __init__(self, status: int, body: bytes = b"", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+def encode_json(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    # Слабое сравнение: W/"x" и "x" считаются одним тегом
+    return "*" in candidates or etag in (tag.replace("W/", "", 1) for tag in candidates)
+
+
+class Route:
+    """Обработчик пути; source - имя хранилища, по версии которого кешировать"""
+
+    def __init__(self, method: str, pattern: str, handler: Callable, source=None):
+        self.method = method
+        self.pattern = re.compile(f"^{pattern}$")
+        self.handler = handler
+        self.source = source
+
+
+class ApiServer:
+    def __init__(
+        self,
+        profiles: Optional[ProfileCache] = None,
+        default_profile: Optional[str] = None,
+        password_generator: Optional[PasswordGenerator] = None,
+        weather_service: Optional[WeatherService] = None,
+        cache_size: int = 256,
+    ):
+        self.profiles = profiles if profiles is not None else ProfileCache()
+        self.default_profile = default_profile or current_profile()
+        self.password_generator = password_generator or PasswordGenerator()
+        self.weather_service = weather_service or WeatherService()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, Tuple[str, bytes]]" = OrderedDict()
+        self.hits = self.misses = self.not_modified = 0
+        # Счетчики версий начинаются заново в каждом процессе: метка запуска
+        # в ETag не дает перезапущенному серверу подтвердить чужую копию
+        self._boot = format(time.time_ns() & 0xFFFFFFFF, "x")
+        self.versions: Dict[str, Callable[[Profile], object]] = {
+            "tasks": lambda profile: profile.task_manager.version,
+            "events": lambda profile: profile.calendar_manager.version,
+            "weather": lambda profile: int(time.time() // WEATHER_TTL),
+        }
+        self.routes: List[Route] = [
+            Route("GET", "/api/tasks", self.list_tasks, "tasks"),
+            Route("GET", "/api/tasks/(?P<name>.+)", self.get_task, "tasks"),
+            Route("GET", "/api/next-tasks", self.next_tasks, "tasks"),
+            Route("GET", "/api/stats", self.statistics, "tasks"),
+            Route("GET", "/api/events", self.list_events, "events"),
+            Route("GET", "/api/weather", self.forecast, "weather"),
+            Route("GET", "/api/passwords", self.generate_passwords),
+            Route("POST", "/api/passwords/check", self.check_password),
+            Route("GET", "/api/profiles", self.list_profiles),
+        ]
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    # ---------- обработчики ----------
+    def list_tasks(self, request: Request):
+        history = request.query.get("history") in ("1", "true")
+        tasks = request.profile.task_manager.tasks
+        return [task.to_dict(history) for task in tasks.values()]
+
+    def next_tasks(self, request: Request):
+        count = request.int_param("count", 10, 1, 1000)
+        tasks = request.profile.task_manager.get_next_tasks(count)
+        return [task.to_dict(False) for task in tasks]
+
+    def get_task(self, request: Request, name: str):
+        task = request.profile.task_manager.get_task(name)
+        if task is None:
+            raise ApiError(404, f"Задача не найдена: {name}")
+        return task.to_dict()
+
+    def statistics(self, request: Request):
+        manager = request.profile.task_manager
+        stats = manager.get_statistics()
+        stats["blocked_tasks"] = len(manager.get_blocked_tasks())
+        return stats
+
+    def list_events(self, request: Request):
+        manager = request.profile.calendar_manager
+        if "date" in request.query:
+            events = manager.get_events_by_date(request.query["date"])
+        elif "year" in request.query or "month" in request.query:
+            year = request.int_param("year", time.localtime().tm_year, 1, 9999)
+            month = request.int_param("month", time.localtime().tm_mon, 1, 12)
+            events = manager.get_events_by_month(year, month)
+        elif "days" in request.query:
+            events = manager.get_upcoming_events(request.int_param("days", 7, 0, 3660))
+        else:
+            events = manager.events
+        return [event.to_dict() for event in events]
+
+    async def forecast(self, request: Request):
+        days = request.int_param("days", 7, 1, 16)
+        city = request.query.get("city", "Москва")
+        try:
+            return await self.weather_service.get_forecast_async(city, days)
+        except Exception as e:
+            raise ApiError(502, f"Поставщик прогнозов недоступен: {e}")
+
+    def generate_passwords(self, request: Request):
+        count = request.int_param("count", 5, 1, MAX_PASSWORDS)
+        length = request.int_param("length", 12, 4, 1024)
+        return self.password_generator.generate_multiple_passwords(
+            count=count, length=length
+        )
+
+    def check_password(self, request: Request):
+        password = request.json().get("password")
+        if not isinstance(password, str) or not password:
+            raise ApiError(400, "Нужно поле password")
+        return self.password_generator.check_password_strength(password, load_policy())
+
+    def list_profiles(self, request: Request):
+        return {
+            "default": self.default_profile,
+            "profiles": list_profiles(self.profiles.root),
+            "open": len(self.profiles),
+        }
+
+    # ---------- маршрутизация и кеш ----------
+    async def select_profile(self, request: Request) -> Profile:
+        name = request.headers.get("x-profile") or request.query.pop("profile", None)
+        name = name or self.default_profile
+        if name in self.profiles:
+            return self.profiles.get(name)
+        try:
+            validate_name(name)
+        except ProfileError as e:
+            raise ApiError(400, str(e))
+        # Новый профиль читается с диска в пуле потоков, не останавливая цикл
+        profile = await run_blocking(self.profiles.factory, name, self.profiles.root)
+        if name in self.profiles:  # открыт параллельным запросом
+            return self.profiles.get(name)
+        return self.profiles.put(profile)
+
+    async def refresh(self, profile: Profile):
+        """Перечитывает файлы профиля, измененные другими процессами"""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            for manager in (profile.task_manager, profile.calendar_manager):
+                if manager.store.changed():
+                    await manager.load_data_async()
+
+    def _match(self, request: Request):
+        allowed = False
+        for route in self.routes:
+            match = route.pattern.match(request.path)
+            if match is None:
+                continue
+            if route.method == request.method or (
+                route.method == "GET" and request.method == "HEAD"
+            ):
+                return route, match.groupdict()
+            allowed = True
+        if allowed:
+            raise ApiError(405, "Метод не поддерживается")
+        raise ApiError(404, f"Нет такого адреса: {request.path}")
+
+    @instrument()
+    async def handle(self, request: Request) -> Response:
+        try:
+            route, params = self._match(request)
+            if route.source is None:
+                result = route.handler(request, **params)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                return Response(200, encode_json(result), {"Cache-Control": "no-store"})
+            request.profile = await self.select_profile(request)
+            await self.refresh(request.profile)
+            return await self._cached(request, route, params)
+        except ApiError as e:
+            return Response(e.status, encode_json({"error": str(e)}))
+        except Exception as e:
+            return Response(500, encode_json({"error": f"Внутренняя ошибка: {e}"}))
+
+    async def _cached(self, request: Request, route: Route, params) -> Response:
+        profile = request.profile
+        version = self.versions[route.source](profile)
+        # serial отличает профили и повторные открытия одного профиля после вытеснения
+        etag = f'"{route.source}-{self._boot}-{profile.serial}-{version}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "X-Profile"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            self.not_modified += 1
+            return Response(304, b"", headers)
+
+        key = (profile.name, request.path, tuple(sorted(request.query.items())))
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == etag:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return Response(200, entry[1], headers)
+
+        self.misses += 1
+        result = route.handler(request, **params)
+        if asyncio.iscoroutine(result):
+            result = await result
+        body = encode_json(result)
+        if self.versions[route.source](profile) == version and self.cache_size:
+            # Версия не сменилась, пока готовился ответ - его можно переиспользовать
+            self._cache[key] = (etag, body)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return Response(200, body, headers)
+
+    # ---------- HTTP ----------
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Запрос, None при закрытом соединении; ApiError - некорректный запрос"""
+        line = await reader.readline()
+        if not line:
+            return None, False
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise ApiError(400, "Некорректная строка запроса")
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise ApiError(431, "Слишком много заголовков")
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise ApiError(400, "Некорректный Content-Length")
+        if length > MAX_BODY:
+            raise ApiError(413, "Слишком большое тело запроса")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method, target, headers, body), keep_alive
+
+    def _write_response(
+        self, writer, response: Response, keep_alive: bool, head: bool = False
+    ):
+        status = HTTPStatus(response.status)
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        if response.status != 304:
+            lines.append("Content-Type: application/json; charset=utf-8")
+            lines.append(f"Content-Length: {len(response.body)}")
+        lines += [f"{name}: {value}" for name, value in response.headers.items()]
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        head_bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        writer.write(
+            head_bytes if head or response.status == 304 else head_bytes + response.body
+        )
+
+    async def handle_connection(self, reader, writer):
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request, keep_alive = await asyncio.wait_for(
+                        self._read_request(reader), KEEPALIVE_TIMEOUT
+                    )
+                except ApiError as e:
+                    response = Response(e.status, encode_json({"error": str(e)}))
+                    self._write_response(writer, response, False)
+                    break
+                if request is None:
+                    break
+                response = await self.handle(request)
+                self._write_response(
+                    writer, response, keep_alive, head=request.method == "HEAD"
+                )
+                await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Блокирующий запуск до Ctrl+C"""
+
+        async def main():
+            server = await self.start(host, port)
+            address = server.sockets[0].getsockname()
+            print(f"API: http://{address[0]}:{address[1]}/api/ (Ctrl+C - выход)")
+            async with server:
+                await server.serve_forever()
+
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            pass
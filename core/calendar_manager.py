@@ -1,27 +1,93 @@
-import json
+import bisect
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.aio import run_blocking
+from core.ical import EVENT_TYPES, event_uid, iter_ics_records, write_ics
+from core.profiling import instrument
+from core.storage import SyncedFile
+from core.timestamps import from_timestamp, now_timestamp, to_timestamp
+from core.undo import RemoveEvents, UndoHistory
+
+_EVENT_TYPES = {event_type: event_type for event_type in EVENT_TYPES}
 
 
 class CalendarEvent:
+    # Компактная модель: без __dict__, дата и тип интернированы,
+    # время создания - целые микросекунды
+    __slots__ = (
+        "title",
+        "_date",
+        "description",
+        "_event_type",
+        "_created_ts",
+        "remind_before",
+        "uid",
+    )
+
     def __init__(
-        self, title: str, date: str, description: str = "", event_type: str = "personal"
+        self,
+        title: str,
+        date: str,
+        description: str = "",
+        event_type: str = "personal",
+        remind_before: Optional[int] = None,
+        uid: Optional[str] = None,
     ):
         self.title = title
         self.date = date  # формат: YYYY-MM-DD
         self.description = description
         self.event_type = event_type  # personal, work, holiday
-        self.created_at = datetime.now().isoformat()
+        self._created_ts = now_timestamp()
+        self.remind_before = remind_before  # минут до начала, None - без напоминания
+        self.uid = uid  # UID из импортированного .ics, у своих событий - None
+
+    @property
+    def date(self) -> str:
+        return self._date
+
+    @date.setter
+    def date(self, value: str):
+        self._date = sys.intern(value)
+
+    @property
+    def event_type(self) -> str:
+        return self._event_type
+
+    @event_type.setter
+    def event_type(self, value: str):
+        self._event_type = _EVENT_TYPES.get(value) or sys.intern(value)
+
+    @property
+    def created_at(self) -> str:
+        return from_timestamp(self._created_ts)
+
+    @created_at.setter
+    def created_at(self, value: str):
+        self._created_ts = to_timestamp(value)
 
     def to_dict(self):
-        return {
+        data = {
             "title": self.title,
             "date": self.date,
             "description": self.description,
             "event_type": self.event_type,
             "created_at": self.created_at,
         }
+        if self.remind_before is not None:
+            data["remind_before"] = self.remind_before
+        if self.uid:
+            data["uid"] = self.uid
+        return data
+
+    @property
+    def key(self):
+        """Ключ события в процессе: UID, а у своих событий - название, дата и время"""
+        return self.uid or (self.title, self.date, self._created_ts)
 
     @classmethod
     def from_dict(cls, data):
@@ -30,56 +96,271 @@ class CalendarEvent:
             data["date"],
             data.get("description", ""),
             data.get("event_type", "personal"),
+            data.get("remind_before"),
+            data.get("uid"),
         )
-        event.created_at = data.get("created_at", datetime.now().isoformat())
+        if data.get("created_at"):
+            event.created_at = data["created_at"]
         return event
 
 
+def _event_key(record: dict):
+    uid = record.get("uid")
+    if uid:
+        return uid
+    return record["title"], record["date"], record.get("created_at")
+
+
 class CalendarManager:
-    def __init__(self, data_file: str = "data/calendar.json"):
+    def __init__(
+        self,
+        data_file: str = "data/calendar.json",
+        undo_history: Optional[UndoHistory] = None,
+    ):
         self.data_file = data_file
+        # Удаление событий можно отменить; история может быть общей с задачами
+        self.undo_history = undo_history if undo_history is not None else UndoHistory()
         self.events: List[CalendarEvent] = []
+        # Растет при каждом изменении событий; по нему сбрасываются кеши отрисовки
+        self.version = 0
+        # Индекс по дням: дата -> события и отсортированный список дат.
+        # Поддерживается при каждом изменении, запросы по периоду - bisect
+        self._days: Dict[str, List[CalendarEvent]] = {}
+        self._dates: List[str] = []
+        # Подписчики на изменения: listener("added" | "removed" | "reset", события)
+        self.listeners: List[Callable[[str, List[CalendarEvent]], None]] = []
+        self.store = SyncedFile(data_file, key=_event_key)
+        # Файловые операции из пула потоков (async-методы) идут по одной
+        self._io_lock = threading.Lock()
+        # Пока идет save_data_async, сохранения не ждут _io_lock: они ставят
+        # флаг, и она записывает файл еще раз (флаги меняются в потоке цикла)
+        self._saving = False
+        self._save_pending = False
         self.load_data()
 
+    @instrument()
     def load_data(self):
+        self._apply_loaded(self._read_events())
+
+    @instrument()
+    async def load_data_async(self, executor=None):
+        """load_data без блокировки цикла: чтение и разбор файла в пуле потоков"""
+        self._apply_loaded(await run_blocking(self._read_events, executor=executor))
+
+    def _read_events(self) -> Optional[List[CalendarEvent]]:
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.events = [
-                        CalendarEvent.from_dict(event_data) for event_data in data
-                    ]
-            except Exception as e:
-                print(f"Ошибка загрузки данных календаря: {e}")
+        try:
+            # События создаются по мере разбора файла
+            with self._io_lock:
+                return [CalendarEvent.from_dict(data) for data in self.store.load()]
+        except Exception as e:
+            print(f"Ошибка загрузки данных календаря: {e}")
+            return None
+
+    def _apply_loaded(self, events: Optional[List[CalendarEvent]]):
+        if events is None:
+            return
+        self.events = events
+        self._rebuild_index()
+        self.version += 1
+
+    def reload_if_changed(self) -> bool:
+        """Перечитывает файл, только если его изменил другой процесс"""
+        if not self.store.changed():
+            return False
+        self.load_data()
+        return True
 
+    @instrument()
     def save_data(self):
+        self.version += 1
+        if self._saving:
+            # Запись в пуле еще идет: после нее save_data_async запишет и это
+            self._save_pending = True
+            return
         try:
-            data = [event.to_dict() for event in self.events]
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._apply_merged(
+                self._write_records(event.to_dict() for event in self.events)
+            )
         except Exception as e:
             print(f"Ошибка сохранения данных календаря: {e}")
 
+    @instrument()
+    async def save_data_async(self, executor=None):
+        """save_data без блокировки цикла: сериализация и запись в пуле потоков"""
+        self.version += 1
+        if self._saving:
+            self._save_pending = True
+            return
+        self._saving = True
+        try:
+            while True:
+                self._save_pending = False
+                # Словари строятся в цикле: пул получает готовый снимок
+                records = [event.to_dict() for event in self.events]
+                try:
+                    merged = await run_blocking(
+                        self._write_records, records, executor=executor
+                    )
+                    self._apply_merged(merged)
+                except Exception as e:
+                    print(f"Ошибка сохранения данных календаря: {e}")
+                if not self._save_pending:
+                    break
+        finally:
+            self._saving = False
+
+    def _write_records(self, records: Iterable[dict]) -> Optional[List[dict]]:
+        with self._io_lock:
+            return self.store.save(records)
+
+    def _apply_merged(self, merged: Optional[List[dict]]):
+        if merged is not None:
+            # Файл изменил другой процесс - принимаем результат слияния
+            self.events = [CalendarEvent.from_dict(data) for data in merged]
+            self._rebuild_index()
+
+    def _rebuild_index(self):
+        self._days = {}
+        for event in self.events:
+            self._days.setdefault(event.date, []).append(event)
+        self._dates = sorted(self._days)
+        self._notify("reset", self.events)
+
+    def _notify(self, change: str, events: List[CalendarEvent]):
+        for listener in self.listeners:
+            listener(change, events)
+
+    def _index_event(self, event: CalendarEvent):
+        day = self._days.get(event.date)
+        if day is None:
+            day = self._days[event.date] = []
+            bisect.insort(self._dates, event.date)
+        day.append(event)
+
+    def _unindex_event(self, event: CalendarEvent):
+        day = self._days[event.date]
+        day.remove(event)
+        if not day:
+            del self._days[event.date]
+            del self._dates[bisect.bisect_left(self._dates, event.date)]
+
+    def _date_range(self, start: str, end: str) -> List[str]:
+        """Даты с событиями в полуинтервале [start, end)"""
+        return self._dates[
+            bisect.bisect_left(self._dates, start) : bisect.bisect_left(
+                self._dates, end
+            )
+        ]
+
     def add_event(
-        self, title: str, date: str, description: str = "", event_type: str = "personal"
+        self,
+        title: str,
+        date: str,
+        description: str = "",
+        event_type: str = "personal",
+        remind_before: Optional[int] = None,
     ):
-        event = CalendarEvent(title, date, description, event_type)
+        event = CalendarEvent(title, date, description, event_type, remind_before)
         self.events.append(event)
+        self._index_event(event)
+        self._notify("added", [event])
         self.save_data()
         return True
 
+    def add_events(self, events: Iterable[CalendarEvent]) -> int:
+        """Массовое добавление событий с одной записью на диск"""
+        initial_count = len(self.events)
+        try:
+            self.events.extend(events)
+        except Exception:
+            # Не оставляем в памяти частично импортированные данные
+            del self.events[initial_count:]
+            raise
+        count = len(self.events) - initial_count
+        if count:
+            added = self.events[initial_count:]
+            for event in added:
+                self._index_event(event)
+            self._notify("added", added)
+            self.save_data()
+        return count
+
+    @instrument()
+    def import_ics(self, path: str) -> Dict[str, float]:
+        """Импорт событий из файла .ics, возвращает количество и скорость
+
+        События с уже известным UID пропускаются: повторный импорт того же
+        файла (или своего же экспорта) ничего не дублирует.
+        """
+        start = time.perf_counter()
+        known = {event_uid(event.to_dict()) for event in self.events}
+
+        def fresh(records):
+            for record in records:
+                uid = event_uid(record)
+                if uid in known:
+                    continue
+                known.add(uid)
+                record["uid"] = uid
+                yield CalendarEvent.from_dict(record)
+
+        with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            count = self.add_events(fresh(iter_ics_records(f)))
+        return self._throughput(count, time.perf_counter() - start)
+
+    @instrument()
+    def export_ics(self, path: str) -> Dict[str, float]:
+        """Экспорт всех событий в файл .ics, возвращает количество и скорость"""
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            count = write_ics(f, (event.to_dict() for event in self.events))
+        return self._throughput(count, time.perf_counter() - start)
+
+    @staticmethod
+    def _throughput(count: int, seconds: float) -> Dict[str, float]:
+        return {
+            "count": count,
+            "seconds": seconds,
+            "events_per_sec": count / seconds if seconds > 0 else 0.0,
+        }
+
+    @instrument()
     def get_events_by_date(self, date: str) -> List[CalendarEvent]:
-        return [event for event in self.events if event.date == date]
+        return list(self._days.get(date, ()))
 
+    @instrument()
     def get_events_by_month(self, year: int, month: int) -> List[CalendarEvent]:
         events = []
-        for event in self.events:
-            event_date = datetime.strptime(event.date, "%Y-%m-%d")
-            if event_date.year == year and event_date.month == month:
-                events.append(event)
+        for date in self._month_dates(year, month):
+            events.extend(self._days[date])
         return events
 
+    def _month_dates(self, year: int, month: int) -> List[str]:
+        prefix = f"{year:04d}-{month:02d}-"
+        # "/" следует за "-" в ASCII: верхняя граница всех дней месяца
+        return self._date_range(prefix, prefix[:-1] + "/")
+
+    @instrument()
+    def get_day_counts(self, year: int) -> Dict[str, int]:
+        """Количество событий по дням года {дата: число} из индекса"""
+        return {
+            date: len(self._days[date])
+            for date in self._date_range(f"{year:04d}-", f"{year:04d}/")
+        }
+
+    @instrument()
+    def get_agenda(
+        self, start: str, skip: int = 0, limit: int = 10
+    ) -> List[Tuple[str, List[CalendarEvent]]]:
+        """Дни с событиями, начиная с даты start (со сдвигом skip дней с событиями)"""
+        index = max(bisect.bisect_left(self._dates, start) + skip, 0)
+        return [
+            (date, list(self._days[date]))
+            for date in self._dates[index : index + limit]
+        ]
+
+    @instrument()
     def get_upcoming_events(self, days: int = 7) -> List[CalendarEvent]:
         """Получить события на ближайшие N дней"""
         upcoming = []
@@ -91,25 +372,41 @@ class CalendarManager:
         return sorted(upcoming, key=lambda x: x.date)
 
     def remove_event(self, title: str, date: str) -> bool:
-        initial_count = len(self.events)
-        self.events = [
-            event
-            for event in self.events
-            if not (event.title == title and event.date == date)
-        ]
-        if len(self.events) < initial_count:
-            self.save_data()
-            return True
-        return False
+        removed = [event for event in self._days.get(date, ()) if event.title == title]
+        if not removed:
+            return False
+        self.undo_history.record(RemoveEvents(self, removed))
+        self.discard_events(removed)
+        return True
 
+    def discard_events(self, events: List[CalendarEvent]) -> bool:
+        """Удаляет эти события без записи в историю отмены; False - их уже нет.
+
+        Сравнение по ключу события: после перечитывания файла в памяти уже
+        другие объекты с теми же ключами.
+        """
+        keys = {event.key for event in events}
+        removed = [event for event in self.events if event.key in keys]
+        if not removed:
+            return False
+        self.events = [event for event in self.events if event.key not in keys]
+        for event in removed:
+            self._unindex_event(event)
+        self._notify("removed", removed)
+        self.save_data()
+        return True
+
+    def restore_events(self, events: List[CalendarEvent]):
+        """Отмена удаления: те же объекты событий возвращаются на место"""
+        self.events.extend(events)
+        for event in events:
+            self._index_event(event)
+        self._notify("added", events)
+        self.save_data()
+
+    @instrument()
     def get_events_for_calendar(
         self, year: int, month: int
     ) -> Dict[str, List[CalendarEvent]]:
         """Возвращает словарь {дата: [события]} для календаря"""
-        events_dict = {}
-        events = self.get_events_by_month(year, month)
-        for event in events:
-            if event.date not in events_dict:
-                events_dict[event.date] = []
-            events_dict[event.date].append(event)
-        return events_dict
+        return {date: list(self._days[date]) for date in self._month_dates(year, month)}
@@ -1,11 +1,13 @@
-import random
-from typing import List, Tuple
+from typing import List, Optional
+
+from core.rng import GameRng, MoveStream, SevenBag
 
 
 class TicTacToe:
     def __init__(self):
         self.board = [" "] * 9
         self.current_player = "X"
+        self.moves = MoveStream()
 
     def display_board(self):
         board_str = f"""
@@ -24,6 +26,7 @@ ___|___|___
     def make_move(self, position: int) -> bool:
         if 0 <= position <= 8 and self.board[position] == " ":
             self.board[position] = self.current_player
+            self.moves.record(position)
             return True
         return False
 
@@ -56,44 +59,237 @@ ___|___|___
 
         return None
 
+    def apply(self, position: int) -> bool:
+        """Ход текущего игрока и передача хода"""
+        if not self.make_move(position):
+            return False
+        self.switch_player()
+        return True
+
+    @classmethod
+    def replay(cls, moves: MoveStream) -> "TicTacToe":
+        """Партия, восстановленная по записанным ходам"""
+        game = cls()
+        for position in moves:
+            if not game.apply(position):
+                raise ValueError(f"Недопустимый ход в записи: {position}")
+        return game
+
+    def snapshot(self):
+        """Состояние партии без истории ходов"""
+        return tuple(self.board), self.current_player
+
+    def restore(self, state):
+        board, self.current_player = state
+        self.board = list(board)
+
+
+# Семь тетрамино: форма в начальном положении и цвет
+TETROMINOES = {
+    "I": ([[1, 1, 1, 1]], "cyan"),
+    "O": ([[1, 1], [1, 1]], "yellow"),
+    "T": ([[1, 1, 1], [0, 1, 0]], "magenta"),
+    "L": ([[1, 1, 1], [1, 0, 0]], "dark_orange"),
+    "J": ([[1, 1, 1], [0, 0, 1]], "blue"),
+    "S": ([[0, 1, 1], [1, 1, 0]], "green"),
+    "Z": ([[1, 1, 0], [0, 1, 1]], "red"),
+}
+# Очки за одновременно убранные линии
+LINE_SCORES = {1: 100, 2: 300, 3: 500, 4: 800}
+# Сдвиги, которые пробуем, если повернутая фигура уперлась в стену
+WALL_KICKS = (0, -1, 1, -2, 2)
+TETRIS_ACTIONS = ("left", "right", "rotate", "down", "drop", "tick")
+
 
 class TetrisPiece:
-    def __init__(self, shape: List[List[int]], color: str):
+    def __init__(self, shape: List[List[int]], color: str, kind: str = ""):
         self.shape = shape
         self.color = color
+        self.kind = kind
         self.x = 0
         self.y = 0
 
+    def cells(self, shape=None, x=None, y=None):
+        """Координаты (x, y) занятых клеток фигуры"""
+        shape = self.shape if shape is None else shape
+        x = self.x if x is None else x
+        y = self.y if y is None else y
+        for row_index, row in enumerate(shape):
+            for column, filled in enumerate(row):
+                if filled:
+                    yield x + column, y + row_index
+
 
 class SimpleTetris:
-    def __init__(self):
+    """Движок Тетриса; фигуры выдает 7-bag на GameRng с зерном seed
+
+    Все изменения состояния идут через apply(action) и записываются в
+    moves, поэтому SimpleTetris.replay(moves) повторяет партию бит в бит.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
         self.board_width = 10
         self.board_height = 15
         self.board = [
             [" " for _ in range(self.board_width)] for _ in range(self.board_height)
         ]
+        self.rng = GameRng(seed)
+        self.bag = SevenBag(self.rng, list(TETROMINOES))
+        self.moves = MoveStream(self.rng.seed)
         self.current_piece = None
         self.game_over = False
         self.score = 0
+        self.lines = 0
+        self.spawn()
 
     def create_random_piece(self):
-        pieces = [
-            [[1, 1, 1, 1]],  # I
-            [[1, 1], [1, 1]],  # O
-            [[1, 1, 1], [0, 1, 0]],  # T
-            [[1, 1, 1], [1, 0, 0]],  # L
-            [[1, 1, 1], [0, 0, 1]],  # J
-        ]
-        colors = ["cyan", "yellow", "purple", "orange", "blue"]
-        piece_data = random.choice(pieces)
-        color = random.choice(colors)
-        return TetrisPiece(piece_data, color)
+        kind = self.bag.next()
+        shape, color = TETROMINOES[kind]
+        return TetrisPiece([list(row) for row in shape], color, kind)
+
+    @property
+    def next_kind(self) -> str:
+        return self.bag.peek()
+
+    @property
+    def level(self) -> int:
+        return self.lines // 10 + 1
+
+    def tick_interval(self) -> float:
+        """Секунд между тиками гравитации на текущем уровне"""
+        return max(0.1, 0.8 * 0.85 ** (self.level - 1))
+
+    # ---------- механика ----------
+    def fits(self, piece: TetrisPiece, shape=None, x=None, y=None) -> bool:
+        for cell_x, cell_y in piece.cells(shape, x, y):
+            if not (0 <= cell_x < self.board_width and 0 <= cell_y < self.board_height):
+                return False
+            if self.board[cell_y][cell_x] != " ":
+                return False
+        return True
+
+    def spawn(self):
+        piece = self.create_random_piece()
+        piece.x = (self.board_width - len(piece.shape[0])) // 2
+        piece.y = 0
+        self.current_piece = piece
+        if not self.fits(piece):
+            self.game_over = True
+
+    def _shift(self, dx: int, dy: int) -> bool:
+        piece = self.current_piece
+        if self.fits(piece, x=piece.x + dx, y=piece.y + dy):
+            piece.x += dx
+            piece.y += dy
+            return True
+        return False
+
+    def _rotate(self) -> bool:
+        piece = self.current_piece
+        rotated = [list(row) for row in zip(*piece.shape[::-1])]
+        for kick in WALL_KICKS:
+            if self.fits(piece, rotated, x=piece.x + kick):
+                piece.shape = rotated
+                piece.x += kick
+                return True
+        return False
+
+    def _lock(self):
+        piece = self.current_piece
+        for x, y in piece.cells():
+            self.board[y][x] = piece.kind or "#"
+        full = [row for row in self.board if " " not in row]
+        if full:
+            self.board = [
+                [" " for _ in range(self.board_width)] for _ in range(len(full))
+            ] + [row for row in self.board if " " in row]
+            self.lines += len(full)
+            self.score += LINE_SCORES.get(len(full), 0)
+        self.spawn()
+
+    def apply(self, action: str) -> bool:
+        """Выполняет действие игрока или тик гравитации; False - ничего не изменилось"""
+        if action not in TETRIS_ACTIONS:
+            raise ValueError(f"Неизвестное действие: {action}")
+        if self.game_over:
+            return False
+        self.moves.record(action)
+        if action == "left":
+            return self._shift(-1, 0)
+        if action == "right":
+            return self._shift(1, 0)
+        if action == "rotate":
+            return self._rotate()
+        if action == "drop":
+            while self._shift(0, 1):
+                self.score += 2
+            self._lock()
+            return True
+        # "down" (ускорение, +1 очко) и "tick" (гравитация) опускают на клетку
+        if self._shift(0, 1):
+            if action == "down":
+                self.score += 1
+        else:
+            self._lock()
+        return True
+
+    @classmethod
+    def replay(cls, moves: MoveStream) -> "SimpleTetris":
+        """Партия, восстановленная по зерну и записанным действиям"""
+        game = cls(moves.seed)
+        for action in moves:
+            game.apply(action)
+        return game
+
+    def snapshot(self):
+        """Состояние партии без истории ходов (для перемотки повторов)"""
+        piece = self.current_piece
+        return (
+            [list(row) for row in self.board],
+            (
+                None
+                if piece is None
+                else (
+                    piece.kind,
+                    piece.color,
+                    [list(row) for row in piece.shape],
+                    piece.x,
+                    piece.y,
+                )
+            ),
+            list(self.bag._bag),
+            self.rng.getstate(),
+            self.score,
+            self.lines,
+            self.game_over,
+        )
+
+    def restore(self, state):
+        board, piece, bag, rng_state, self.score, self.lines, self.game_over = state
+        self.board = [list(row) for row in board]
+        self.current_piece = None
+        if piece is not None:
+            kind, color, shape, x, y = piece
+            self.current_piece = TetrisPiece([list(row) for row in shape], color, kind)
+            self.current_piece.x, self.current_piece.y = x, y
+        self.bag._bag = list(bag)
+        self.rng.setstate(rng_state)
+
+    # ---------- отображение ----------
+    def rows(self) -> List[List[str]]:
+        """Поле с текущей фигурой поверх уложенных"""
+        rows = [list(row) for row in self.board]
+        piece = self.current_piece
+        if piece is not None and not self.game_over:
+            for x, y in piece.cells():
+                rows[y][x] = piece.kind or "#"
+        return rows
 
     def display_board(self):
         # Упрощенное отображение для консоли
-        display = "Тетрис (упрощенная версия):\n"
+        display = "Тетрис:\n"
         display += "+" + "-" * self.board_width + "+\n"
-        for row in self.board:
+        for row in self.rows():
             display += (
                 "|" + "".join(["█" if cell != " " else " " for cell in row]) + "|\n"
             )
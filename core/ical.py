@@ -0,0 +1,258 @@
+"""Потоковое чтение и запись календаря в формате iCalendar (RFC 5545).
+
+Модуль работает со словарями в формате ``CalendarEvent.to_dict`` и
+обрабатывает файл построчно, поэтому память не зависит от размера фида.
+"""
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+EVENT_TYPES = ("personal", "work", "holiday")
+PRODID = "-//shoriext//console-util//RU"
+MAX_LINE_OCTETS = 75
+_DURATION = re.compile(
+    r"^([+-]?)P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Склеивает перенесенные строки (продолжение начинается с пробела или таба)"""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def _split_content_line(line: str):
+    """Разбирает строку вида NAME;PARAM=...:VALUE на имя, параметры и значение"""
+    in_quotes = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ":" and not in_quotes:
+            head, value = line[:i], line[i + 1 :]
+            break
+    else:
+        return None
+
+    parts = head.split(";")
+    params = {}
+    for param in parts[1:]:
+        key, _, val = param.partition("=")
+        params[key.upper()] = val.strip('"')
+    return parts[0].upper(), params, value
+
+
+def _unescape(value: str) -> str:
+    result = []
+    chars = iter(value)
+    for ch in chars:
+        if ch == "\\":
+            nxt = next(chars, "")
+            result.append("\n" if nxt in ("n", "N") else nxt)
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _parse_date(value: str) -> Optional[str]:
+    digits = value[:8]
+    if len(digits) != 8 or not digits.isdigit():
+        return None
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:8]}"
+
+
+def _parse_timestamp(value: str) -> Optional[str]:
+    try:
+        if value.endswith("Z"):
+            dt = datetime.strptime(value, "%Y%m%dT%H%M%SZ")
+            dt = dt.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        else:
+            dt = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    except ValueError:
+        return None
+    return dt.isoformat()
+
+
+def _parse_trigger(value: str) -> Optional[int]:
+    """TRIGGER напоминания (-PT15M, -P1D) в минуты до начала события"""
+    match = _DURATION.match(value.strip().upper())
+    if match is None:
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    total = (
+        int(weeks or 0) * 7 * 24 * 60
+        + int(days or 0) * 24 * 60
+        + int(hours or 0) * 60
+        + int(minutes or 0)
+        + int(seconds or 0) // 60
+    )
+    if sign != "-" and total:
+        return None  # напоминание после начала не поддерживается
+    return total
+
+
+def _vevent_to_record(props: Dict[str, str]) -> Optional[dict]:
+    date = _parse_date(props.get("DTSTART", ""))
+    if date is None:
+        return None
+
+    event_type = "personal"
+    for category in props.get("CATEGORIES", "").split(","):
+        category = category.strip().lower()
+        if category in EVENT_TYPES:
+            event_type = category
+            break
+
+    record = {
+        "title": _unescape(props.get("SUMMARY", "")) or "(без названия)",
+        "date": date,
+        "description": _unescape(props.get("DESCRIPTION", "")),
+        "event_type": event_type,
+    }
+    # DTSTAMP не годится во время создания: многие программы пишут одно
+    # значение во все события файла
+    created_at = _parse_timestamp(props.get("CREATED", ""))
+    if created_at:
+        record["created_at"] = created_at
+    uid = props.get("UID")
+    if uid:
+        # Переопределения повторяющегося события делят UID с исходным
+        recurrence = props.get("RECURRENCE-ID")
+        record["uid"] = f"{uid}/{recurrence}" if recurrence else uid
+    remind_before = _parse_trigger(props.get("TRIGGER", ""))
+    if remind_before is not None:
+        record["remind_before"] = remind_before
+    return record
+
+
+def iter_ics_records(lines: Iterable[str]) -> Iterator[dict]:
+    """Последовательно возвращает события VEVENT из потока строк .ics
+
+    Повторяющиеся события (RRULE) не разворачиваются: берется первое вхождение.
+    События без корректной даты DTSTART пропускаются.
+    """
+    stack = []
+    props: Dict[str, str] = {}
+
+    for line in _unfold(lines):
+        if not line:
+            continue
+        parsed = _split_content_line(line)
+        if parsed is None:
+            continue
+        name, _params, value = parsed
+
+        if name == "BEGIN":
+            stack.append(value.upper())
+            if stack[-1] == "VEVENT":
+                props = {}
+        elif name == "END":
+            component = stack.pop() if stack else None
+            if component == "VEVENT":
+                record = _vevent_to_record(props)
+                if record is not None:
+                    yield record
+        elif stack and stack[-1] == "VEVENT" and name not in props:
+            props[name] = value
+        elif stack[-2:] == ["VEVENT", "VALARM"] and name == "TRIGGER":
+            # Из напоминаний события берем первое
+            props.setdefault("TRIGGER", value)
+
+
+def _fold(line: str) -> str:
+    """Переносит строку длиннее 75 октетов, не разрывая символы UTF-8"""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+
+    chunks = []
+    current = ""
+    size = 0
+    limit = MAX_LINE_OCTETS
+    for ch in line:
+        ch_size = len(ch.encode("utf-8"))
+        if size + ch_size > limit:
+            chunks.append(current)
+            current = ""
+            size = 0
+            limit = MAX_LINE_OCTETS - 1  # первый символ продолжения - пробел
+        current += ch
+        size += ch_size
+    chunks.append(current)
+    return "\r\n ".join(chunks) + "\r\n"
+
+
+def _format_timestamp(iso_value: Optional[str]) -> str:
+    try:
+        dt = datetime.fromisoformat(iso_value) if iso_value else datetime.now()
+    except ValueError:
+        dt = datetime.now()
+    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def event_uid(record: dict) -> str:
+    """UID события: из импортированного файла или вычисленный по содержимому"""
+    if record.get("uid"):
+        return record["uid"]
+    uid_source = f"{record['title']}|{record['date']}|{record.get('created_at', '')}"
+    return hashlib.sha1(uid_source.encode("utf-8")).hexdigest() + "@shoriext"
+
+
+def _record_to_vevent(record: dict) -> str:
+    stamp = _format_timestamp(record.get("created_at"))
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event_uid(record)}",
+        f"DTSTAMP:{stamp}",
+        f"CREATED:{stamp}",
+        f"DTSTART;VALUE=DATE:{record['date'].replace('-', '')}",
+        f"SUMMARY:{_escape(record['title'])}",
+    ]
+    if record.get("description"):
+        lines.append(f"DESCRIPTION:{_escape(record['description'])}")
+    lines.append(f"CATEGORIES:{record.get('event_type', 'personal')}")
+    if record.get("remind_before") is not None:
+        lines.extend(
+            [
+                "BEGIN:VALARM",
+                "ACTION:DISPLAY",
+                f"DESCRIPTION:{_escape(record['title'])}",
+                f"TRIGGER:-PT{record['remind_before']}M",
+                "END:VALARM",
+            ]
+        )
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def write_ics(stream: TextIO, records: Iterable[dict]) -> int:
+    """Записывает события в поток .ics по одному, возвращает их количество"""
+    stream.write(_fold("BEGIN:VCALENDAR"))
+    stream.write(_fold("VERSION:2.0"))
+    stream.write(_fold(f"PRODID:{PRODID}"))
+    count = 0
+    for record in records:
+        stream.write(_record_to_vevent(record))
+        count += 1
+    stream.write(_fold("END:VCALENDAR"))
+    return count
@@ -0,0 +1,299 @@
+"""История метрик монитора в кольцевом файле, отображенном в память.
+
+Файл состоит из заголовка и нескольких уровней (колец) фиксированного
+размера с упакованными записями ``<q`` (время, сек) + ``f`` на метрику:
+
+* ``1s`` - посекундные замеры за последний час;
+* ``1m`` - средние за минуту за последние сутки;
+* ``1h`` - средние за час за последние 30 дней.
+
+Свертка в следующий уровень выполняется при записи, а чтение идет с
+конца кольца и останавливается на границе запрошенного интервала, так
+что файл целиком в память не загружается. Несколько замеров за одну
+секунду усредняются в одну запись ``1s``. Незавершенные интервалы
+старших уровней при открытии файла восстанавливаются по хвосту уровня
+ниже, поэтому перезапуск не теряет и не обрезает их.
+
+Незавершенные интервалы живут в памяти пишущего процесса, поэтому писать
+историю может только один процесс: он держит ``WriterLock``. Остальные
+открытые окна только читают файл и подхватывают запись, когда пишущее
+закроется.
+"""
+
+import mmap
+import os
+import struct
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.system_monitor import METRICS
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировки недоступны, пишет каждый процесс
+    fcntl = None
+
+METRICS_FILE = "data/metrics.bin"
+MAGIC = b"SHXMETR1"
+_HEADER = struct.Struct("<8sHH4x")
+_TIER_HEADER = struct.Struct("<IIII")  # шаг, емкость, количество, позиция записи
+
+DEFAULT_TIERS = (
+    ("1s", 1, 3600),
+    ("1m", 60, 24 * 60),
+    ("1h", 3600, 30 * 24),
+)
+
+
+class _Rollup:
+    """Накопитель средних значений для следующего уровня"""
+
+    __slots__ = ("bucket", "count", "sums")
+
+    def __init__(self, size: int):
+        self.bucket: Optional[int] = None
+        self.count = 0
+        self.sums = [0.0] * size
+
+
+class WriterLock:
+    """Право писать историю: неблокирующая flock на ``<path>.writer``"""
+
+    __slots__ = ("path", "_file")
+
+    def __init__(self, path: str = METRICS_FILE):
+        self.path = f"{path}.writer"
+        self._file = None
+
+    def acquire(self) -> bool:
+        """True - этот процесс пишет историю; False - ее уже пишет другой"""
+        if self._file is not None:
+            return True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lock_file = open(self.path, "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is not None:
+            self._file.close()  # закрытие снимает flock
+            self._file = None
+
+
+class MetricsRecorder:
+    def __init__(
+        self,
+        path: str = METRICS_FILE,
+        metrics: Sequence[str] = METRICS,
+        tiers: Sequence[Tuple[str, int, int]] = DEFAULT_TIERS,
+    ):
+        self.path = path
+        self.metrics = tuple(metrics)
+        self.tiers = tuple(tiers)
+        self.record_struct = struct.Struct("<q" + "f" * len(self.metrics))
+        self._tier_index = {name: i for i, (name, _, _) in enumerate(self.tiers)}
+        self._rollups = [_Rollup(len(self.metrics)) for _ in self.tiers[1:]]
+        # Последняя посекундная запись: замеры той же секунды усредняются в нее
+        self._second: Optional[int] = None
+        self._second_samples = 0
+        self._second_values: List[float] = []
+
+        self._offsets = []
+        offset = _HEADER.size + _TIER_HEADER.size * len(self.tiers)
+        for _, _, capacity in self.tiers:
+            self._offsets.append(offset)
+            offset += capacity * self.record_struct.size
+        self.size = offset
+
+        self._open()
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fresh = not self._compatible()
+        self._file = open(self.path, "w+b" if fresh else "r+b")
+        if fresh:
+            self._file.truncate(self.size)
+        self._map = mmap.mmap(self._file.fileno(), self.size)
+        if fresh:
+            _HEADER.pack_into(self._map, 0, MAGIC, 1, len(self.metrics))
+            for i, (_, step, capacity) in enumerate(self.tiers):
+                self._write_tier_header(i, step, capacity, 0, 0)
+        else:
+            self._restore()
+
+    def _last(self, index: int, k: int = 0):
+        """k-я с конца запись уровня или None"""
+        _step, capacity, count, head = self._tier_header(index)
+        if k >= count:
+            return None
+        position = (head - 1 - k) % capacity
+        return self.record_struct.unpack_from(
+            self._map, self._offsets[index] + position * self.record_struct.size
+        )
+
+    def _restore(self):
+        """Состояние записи после открытия существующего файла"""
+        last = self._last(0)
+        if last is not None:
+            self._second = last[0]
+            self._second_samples = 1
+            self._second_values = list(last[1:])
+        for index in range(1, len(self.tiers)):
+            self._seed_rollup(index)
+
+    def _seed_rollup(self, index: int):
+        # Записи уровня ниже из последнего интервала еще не свернуты в этот
+        # уровень: запись интервала появляется, только когда начнется следующий
+        step = self.tiers[index][1]
+        newest = self._last(index - 1)
+        if newest is None:
+            return
+        bucket = newest[0] // step
+        finished = self._last(index)
+        if finished is not None and finished[0] >= bucket * step:
+            return
+        rollup = self._rollups[index - 1]
+        rollup.bucket = bucket
+        rollup.count = 0
+        rollup.sums = [0.0] * len(self.metrics)
+        k = 0
+        record = newest
+        while record is not None and record[0] // step == bucket:
+            rollup.count += 1
+            for i, value in enumerate(record[1:]):
+                rollup.sums[i] += value
+            k += 1
+            record = self._last(index - 1, k)
+
+    def _compatible(self) -> bool:
+        """Существующий файл с той же раскладкой можно продолжать"""
+        try:
+            if os.path.getsize(self.path) != self.size:
+                return False
+            with open(self.path, "rb") as f:
+                header = f.read(_HEADER.size + _TIER_HEADER.size * len(self.tiers))
+        except OSError:
+            return False
+        magic, _version, metric_count = _HEADER.unpack_from(header, 0)
+        if magic != MAGIC or metric_count != len(self.metrics):
+            return False
+        for i, (_, step, capacity) in enumerate(self.tiers):
+            tier = _TIER_HEADER.unpack_from(
+                header, _HEADER.size + i * _TIER_HEADER.size
+            )
+            if tier[:2] != (step, capacity):
+                return False
+        return True
+
+    def close(self):
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def _tier_header(self, index: int):
+        return _TIER_HEADER.unpack_from(
+            self._map, _HEADER.size + index * _TIER_HEADER.size
+        )
+
+    def _write_tier_header(self, index, step, capacity, count, head):
+        _TIER_HEADER.pack_into(
+            self._map,
+            _HEADER.size + index * _TIER_HEADER.size,
+            step,
+            capacity,
+            count,
+            head,
+        )
+
+    def _append(self, index: int, timestamp: int, values: Sequence[float]):
+        step, capacity, count, head = self._tier_header(index)
+        offset = self._offsets[index] + head * self.record_struct.size
+        self.record_struct.pack_into(self._map, offset, timestamp, *values)
+        self._write_tier_header(
+            index, step, capacity, min(count + 1, capacity), (head + 1) % capacity
+        )
+
+        if index + 1 < len(self.tiers):
+            self._roll_up(index + 1, timestamp, values)
+
+    def _roll_up(self, index: int, timestamp: int, values: Sequence[float]):
+        rollup = self._rollups[index - 1]
+        step = self.tiers[index][1]
+        bucket = timestamp // step
+        if rollup.bucket is not None and bucket != rollup.bucket:
+            # Интервал закончился: его среднее становится записью уровня
+            averages = [total / rollup.count for total in rollup.sums]
+            finished = rollup.bucket * step
+            rollup.bucket = None
+            self._append(index, finished, averages)
+        if rollup.bucket is None:
+            rollup.bucket = bucket
+            rollup.count = 0
+            rollup.sums = [0.0] * len(self.metrics)
+        rollup.count += 1
+        for i, value in enumerate(values):
+            rollup.sums[i] += value
+
+    def record(self, values: Dict[str, float], timestamp: Optional[float] = None):
+        """Записывает замер в посекундный уровень (и сворачивает в старшие)"""
+        timestamp = int(timestamp if timestamp is not None else time.time())
+        row = [values.get(metric, 0.0) for metric in self.metrics]
+        if timestamp == self._second:
+            self._merge_second(row)
+            return
+        self._second = timestamp
+        self._second_samples = 1
+        self._second_values = row
+        self._append(0, timestamp, row)
+
+    def _merge_second(self, row: List[float]):
+        """Еще один замер той же секунды: последняя запись становится средним"""
+        count = self._second_samples
+        previous = self._second_values
+        merged = [(old * count + new) / (count + 1) for old, new in zip(previous, row)]
+        _step, capacity, _count, head = self._tier_header(0)
+        offset = self._offsets[0] + (head - 1) % capacity * self.record_struct.size
+        self.record_struct.pack_into(self._map, offset, self._second, *merged)
+        self._second_samples = count + 1
+        self._second_values = merged
+        # Запись уже учтена в незавершенном интервале старшего уровня
+        if self._rollups and self._rollups[0].bucket is not None:
+            sums = self._rollups[0].sums
+            for i, (old, new) in enumerate(zip(previous, merged)):
+                sums[i] += new - old
+
+    def read(
+        self, tier: str, seconds: float, now: Optional[float] = None
+    ) -> List[Tuple[int, Tuple[float, ...]]]:
+        """Записи уровня за последние seconds секунд в хронологическом порядке"""
+        index = self._tier_index[tier]
+        _step, capacity, count, head = self._tier_header(index)
+        since = (now if now is not None else time.time()) - seconds
+        base = self._offsets[index]
+        size = self.record_struct.size
+
+        records = []
+        for k in range(count):
+            position = (head - 1 - k) % capacity
+            record = self.record_struct.unpack_from(self._map, base + position * size)
+            if record[0] < since:
+                break
+            records.append((record[0], record[1:]))
+        records.reverse()
+        return records
+
+    def series(
+        self, tier: str, metric: str, seconds: float, now: Optional[float] = None
+    ) -> List[float]:
+        column = self.metrics.index(metric)
+        return [values[column] for _, values in self.read(tier, seconds, now)]
@@ -1,14 +1,25 @@
-import random
+import math
 import string
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from core.password_policy import DEFAULT_SPECIAL, PasswordPolicy, PolicySampler
+from core.rng import secure_rng
+from core.wordlist import get_wordlist
+
+# Регистр слов парольной фразы; "random" - каждое слово случайно (+1 бит)
+CAPITALIZE_MODES = ("lower", "title", "upper", "random")
+SAMPLER_CACHE_SIZE = 32
 
 
 class PasswordGenerator:
     def __init__(self):
+        # Только криптостойкий ГСЧ: воспроизводимый GameRng для паролей не годится
+        self.rng = secure_rng()
         self.lowercase = string.ascii_lowercase
         self.uppercase = string.ascii_uppercase
         self.digits = string.digits
-        self.special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        self.special_chars = DEFAULT_SPECIAL
+        self._samplers: Dict[tuple, PolicySampler] = {}
 
     def generate_password(
         self,
@@ -17,47 +28,96 @@ class PasswordGenerator:
         use_lowercase: bool = True,
         use_digits: bool = True,
         use_special: bool = True,
+        policy: Optional[PasswordPolicy] = None,
     ) -> str:
-        if length < 4:
-            length = 4
-
-        char_sets = []
-        all_chars = ""
-
-        if use_lowercase:
-            char_sets.append(self.lowercase)
-            all_chars += self.lowercase
-        if use_uppercase:
-            char_sets.append(self.uppercase)
-            all_chars += self.uppercase
-        if use_digits:
-            char_sets.append(self.digits)
-            all_chars += self.digits
-        if use_special:
-            char_sets.append(self.special_chars)
-            all_chars += self.special_chars
-
-        if not char_sets:
-            char_sets = [self.lowercase]
-            all_chars = self.lowercase
-
-        # Гарантируем наличие хотя бы одного символа из каждой выбранной категории
-        password = []
-        for char_set in char_sets:
-            password.append(random.choice(char_set))
-
-        # Заполняем оставшиеся символы
-        for _ in range(length - len(password)):
-            password.append(random.choice(all_chars))
-
-        # Перемешиваем
-        random.shuffle(password)
-        return "".join(password)
-
-    def generate_multiple_passwords(self, count: int = 5, **kwargs) -> List[str]:
-        return [self.generate_password(**kwargs) for _ in range(count)]
-
-    def check_password_strength(self, password: str) -> Dict[str, any]:
+        """Пароль по политике; без нее - хотя бы один символ каждого класса"""
+        if policy is not None:
+            return self.sampler(policy).sample(self.rng)
+        enabled = (use_lowercase, use_uppercase, use_digits, use_special)
+        if not any(enabled):
+            enabled = (True, False, False, False)
+        key = (max(length, 4),) + enabled
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            policy = PasswordPolicy(
+                key[0],
+                *(1 if flag else None for flag in enabled),
+                special_chars=self.special_chars,
+            )
+            sampler = self._cache_sampler(key, policy)
+        return sampler.sample(self.rng)
+
+    def sampler(self, policy: PasswordPolicy) -> PolicySampler:
+        """Скомпилированная политика; компилируется один раз на набор полей"""
+        key = policy.key()
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            sampler = self._cache_sampler(key, policy)
+        return sampler
+
+    def _cache_sampler(self, key: tuple, policy: PasswordPolicy) -> PolicySampler:
+        if len(self._samplers) >= SAMPLER_CACHE_SIZE:
+            self._samplers.clear()
+        sampler = self._samplers[key] = policy.compile()
+        return sampler
+
+    def generate_passphrase(
+        self,
+        words: int = 6,
+        language: str = "en",
+        separator: str = "-",
+        capitalize: str = "lower",
+        add_digit: bool = False,
+    ) -> str:
+        """Парольная фраза из случайных слов списка (diceware)"""
+        if capitalize not in CAPITALIZE_MODES:
+            raise ValueError(f"Неизвестный режим регистра: {capitalize}")
+        words = max(words, 1)
+        wordlist = get_wordlist(language)
+        chosen = [wordlist[self.rng.randrange(len(wordlist))] for _ in range(words)]
+        for i, word in enumerate(chosen):
+            if capitalize == "title" or (
+                capitalize == "random" and self.rng.randrange(2)
+            ):
+                chosen[i] = word[:1].upper() + word[1:]
+            elif capitalize == "upper":
+                chosen[i] = word.upper()
+        if add_digit:
+            i = self.rng.randrange(words)
+            chosen[i] += str(self.rng.randrange(10))
+        return separator.join(chosen)
+
+    def passphrase_entropy(
+        self,
+        words: int = 6,
+        language: str = "en",
+        capitalize: str = "lower",
+        add_digit: bool = False,
+        **_,
+    ) -> float:
+        """Энтропия фразы в битах
+
+        Точная при непустом разделителе, которого нет в словах: тогда
+        разные выборы слов дают разные фразы. Без разделителя - верхняя
+        оценка (склейки слов могут совпасть).
+        """
+        words = max(words, 1)
+        bits = words * get_wordlist(language).entropy_per_word
+        if capitalize == "random":
+            bits += words
+        if add_digit:
+            bits += math.log2(10 * words)
+        return bits
+
+    def generate_multiple_passwords(
+        self, count: int = 5, passphrase: bool = False, **kwargs
+    ) -> List[str]:
+        generate = self.generate_passphrase if passphrase else self.generate_password
+        return [generate(**kwargs) for _ in range(count)]
+
+    def check_password_strength(
+        self, password: str, policy: Optional[PasswordPolicy] = None
+    ) -> Dict[str, any]:
         score = 0
         feedback = []
 
@@ -99,4 +159,5 @@ class PasswordGenerator:
             "score": score,
             "strength": strength_levels[score],
             "feedback": feedback,
+            "violations": policy.violations(password) if policy else [],
         }
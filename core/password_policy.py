@@ -0,0 +1,212 @@
+"""Политика паролей и прямой генератор по ней, без перебора с отбраковкой.
+
+Политика задается декларативно (словарем или JSON в ``POLICY_FILE``):
+длина, минимум символов каждого класса (None - класс запрещен),
+исключенные символы, запрет похожих символов и максимальная длина серии
+одинаковых символов.
+
+``compile()`` один раз строит алфавиты классов и проверяет выполнимость.
+Генерация: список классов позиций (обязательные + свободные) случайно
+перемешивается, затем символ каждой позиции берется из алфавита ее
+класса; если он продлил бы серию сверх max_repeat, повторяемый символ
+исключается из выбора индексом (без повторной попытки). Поэтому цена
+генерации не зависит от строгости политики.
+"""
+
+import json
+import os
+import string
+from typing import Dict, List, Optional
+
+POLICY_FILE = "data/password_policy.json"
+DEFAULT_SPECIAL = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+# Символы, которые легко перепутать при чтении и вводе
+AMBIGUOUS = "Il1|O0o`'\""
+CLASSES = ("lower", "upper", "digits", "special")
+CLASS_NAMES = {
+    "lower": "строчных букв",
+    "upper": "заглавных букв",
+    "digits": "цифр",
+    "special": "специальных символов",
+}
+
+
+class PolicyError(ValueError):
+    pass
+
+
+class PasswordPolicy:
+    def __init__(
+        self,
+        length: int = 12,
+        lower: Optional[int] = 1,
+        upper: Optional[int] = 1,
+        digits: Optional[int] = 1,
+        special: Optional[int] = 1,
+        special_chars: str = DEFAULT_SPECIAL,
+        exclude: str = "",
+        exclude_ambiguous: bool = False,
+        max_repeat: Optional[int] = None,
+    ):
+        self.length = length
+        self.minimums = {
+            "lower": lower,
+            "upper": upper,
+            "digits": digits,
+            "special": special,
+        }
+        self.special_chars = special_chars
+        self.exclude = exclude
+        self.exclude_ambiguous = exclude_ambiguous
+        self.max_repeat = max_repeat
+
+    def to_dict(self) -> dict:
+        data = {"length": self.length}
+        data.update(self.minimums)
+        data.update(
+            special_chars=self.special_chars,
+            exclude=self.exclude,
+            exclude_ambiguous=self.exclude_ambiguous,
+            max_repeat=self.max_repeat,
+        )
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PasswordPolicy":
+        unknown = set(data) - set(cls().to_dict())
+        if unknown:
+            raise PolicyError(
+                f"Неизвестные поля политики: {', '.join(sorted(unknown))}"
+            )
+        return cls(**data)
+
+    def key(self) -> tuple:
+        return tuple(sorted(self.to_dict().items()))
+
+    def alphabets(self) -> Dict[str, str]:
+        """Разрешенные символы каждого включенного класса"""
+        removed = set(self.exclude)
+        if self.exclude_ambiguous:
+            removed.update(AMBIGUOUS)
+        sources = {
+            "lower": string.ascii_lowercase,
+            "upper": string.ascii_uppercase,
+            "digits": string.digits,
+            "special": self.special_chars,
+        }
+        result = {}
+        for name in CLASSES:
+            if self.minimums[name] is not None:
+                chars = dict.fromkeys(c for c in sources[name] if c not in removed)
+                result[name] = "".join(chars)
+        return result
+
+    def compile(self) -> "PolicySampler":
+        return PolicySampler(self)
+
+    def violations(self, password: str) -> List[str]:
+        """Нарушения политики паролем (пустой список - пароль подходит)"""
+        problems = []
+        if len(password) < self.length:
+            problems.append(f"Длина меньше {self.length}")
+        alphabets = self.alphabets()
+        allowed = set("".join(alphabets.values()))
+        for name, chars in alphabets.items():
+            count = sum(1 for c in password if c in chars)
+            if count < self.minimums[name]:
+                problems.append(
+                    f"Нужно не меньше {self.minimums[name]} {CLASS_NAMES[name]}"
+                )
+        forbidden = sorted(set(c for c in password if c not in allowed))
+        if forbidden:
+            problems.append(f"Запрещенные символы: {''.join(forbidden)}")
+        if self.max_repeat is not None and _longest_run(password) > self.max_repeat:
+            problems.append(f"Больше {self.max_repeat} одинаковых символов подряд")
+        return problems
+
+
+def _longest_run(text: str) -> int:
+    longest = run = 0
+    previous = None
+    for char in text:
+        run = run + 1 if char == previous else 1
+        previous = char
+        longest = max(longest, run)
+    return longest
+
+
+class PolicySampler:
+    """Скомпилированная политика: готовые алфавиты и список классов позиций"""
+
+    def __init__(self, policy: PasswordPolicy):
+        self.policy = policy
+        alphabets = policy.alphabets()
+        if not alphabets:
+            raise PolicyError("Политика запрещает все классы символов")
+        self.any = "".join(dict.fromkeys("".join(alphabets.values())))
+        if not self.any:
+            raise PolicyError("После исключений не осталось символов")
+
+        self.slots: List[str] = []
+        for name, chars in alphabets.items():
+            minimum = policy.minimums[name]
+            if minimum and not chars:
+                raise PolicyError(f"Нет разрешенных {CLASS_NAMES[name]}")
+            self.slots += [chars] * minimum
+        if len(self.slots) > policy.length:
+            raise PolicyError(
+                f"Минимумы классов ({len(self.slots)}) больше длины {policy.length}"
+            )
+        self.slots += [self.any] * (policy.length - len(self.slots))
+
+        self.max_repeat = policy.max_repeat
+        if self.max_repeat is not None:
+            if self.max_repeat < 1:
+                raise PolicyError("max_repeat должен быть не меньше 1")
+            if any(len(chars) < 2 for chars in set(self.slots)):
+                raise PolicyError("Для ограничения повторов в классе нужно 2+ символа")
+        # Индекс символа в алфавите - чтобы исключать его без поиска
+        self._positions = {
+            chars: {c: i for i, c in enumerate(chars)} for chars in set(self.slots)
+        }
+
+    def sample(self, rng) -> str:
+        slots = list(self.slots)
+        rng.shuffle(slots)
+        password: List[str] = []
+        limit = self.max_repeat
+        for chars in slots:
+            banned = None
+            if limit is not None and len(password) >= limit:
+                tail = password[-limit:]
+                if tail.count(tail[0]) == limit:
+                    banned = self._positions[chars].get(tail[0])
+            if banned is None:
+                password.append(chars[rng.randrange(len(chars))])
+            else:
+                # Выбор среди остальных символов: индексы после banned сдвигаются
+                index = rng.randrange(len(chars) - 1)
+                password.append(chars[index + (index >= banned)])
+        return "".join(password)
+
+
+def load_policy(path: str = POLICY_FILE) -> Optional[PasswordPolicy]:
+    """Сохраненная политика или None, если файла нет"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return PasswordPolicy.from_dict(json.load(f))
+
+
+def save_policy(policy: PasswordPolicy, path: str = POLICY_FILE):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(policy.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
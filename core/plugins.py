@@ -0,0 +1,217 @@
+"""Реестр разделов главного меню с ленивой загрузкой.
+
+Раздел - модуль с литералом ``PLUGIN = {...}`` на верхнем уровне. При
+запуске исходник модуля только разбирается (``ast``), без импорта: в меню
+попадают название и порядок, а сам модуль и его тяжелые зависимости
+импортируются при первом выборе пункта.
+
+Поля PLUGIN:
+    title - название пункта меню (обязательно);
+    order - место в меню (по умолчанию 100);
+    kind  - "screen": entry(ui) возвращает экран (или корутину),
+            "dialog": entry(ui) - блокирующий диалог с Prompt;
+    entry - имя функции (по умолчанию "create_screen" или "run");
+    pause - ждать Enter после диалога (по умолчанию True).
+
+Источники: каталоги с модулями (``plugins/`` или каталоги из
+SHORIEXT_PLUGIN_PATH) и точки входа установленных пакетов
+(группа ``shoriext.plugins``). Раздел с уже занятым именем заменяет
+найденный раньше.
+"""
+
+import ast
+import importlib
+import importlib.util
+import os
+import sys
+from typing import Callable, Dict, List, Optional
+
+ENTRY_POINT_GROUP = "shoriext.plugins"
+ENV_PLUGIN_PATH = "SHORIEXT_PLUGIN_PATH"
+PLUGIN_DIR = "plugins"
+DEFAULT_ORDER = 100
+# Функция модуля, вызываемая по умолчанию для каждого вида раздела
+KINDS = {"screen": "create_screen", "dialog": "run"}
+
+
+class PluginError(Exception):
+    pass
+
+
+class PluginInfo:
+    __slots__ = (
+        "name",
+        "title",
+        "order",
+        "kind",
+        "entry",
+        "pause",
+        "module_name",
+        "path",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        title: str,
+        order: int = DEFAULT_ORDER,
+        kind: str = "screen",
+        entry: Optional[str] = None,
+        pause: bool = True,
+        module_name: Optional[str] = None,
+        path: Optional[str] = None,
+    ):
+        self.name = name
+        self.title = title
+        self.order = order
+        self.kind = kind
+        self.entry = entry or KINDS[kind]
+        self.pause = pause
+        self.module_name = module_name  # импорт по имени модуля
+        self.path = path  # или загрузка из файла вне пакетов
+
+
+def read_metadata(path: str) -> Optional[dict]:
+    """Литерал PLUGIN из исходника модуля без его импорта"""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if any(
+            isinstance(target, ast.Name) and target.id == "PLUGIN" for target in targets
+        ):
+            return ast.literal_eval(node.value)
+    return None
+
+
+def plugin_dirs() -> List[str]:
+    value = os.environ.get(ENV_PLUGIN_PATH)
+    if value:
+        return [path for path in value.split(os.pathsep) if path]
+    return [PLUGIN_DIR]
+
+
+class PluginRegistry:
+    def __init__(self):
+        self.plugins: Dict[str, PluginInfo] = {}
+        self.modules: Dict[str, object] = {}
+        self.errors: List[str] = []  # разделы, пропущенные при поиске
+
+    def __len__(self) -> int:
+        return len(self.plugins)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.plugins
+
+    def register(self, name: str, metadata: dict, **source) -> PluginInfo:
+        if not isinstance(metadata, dict) or not isinstance(metadata.get("title"), str):
+            raise PluginError(f"{name}: в PLUGIN нет строки title")
+        kind = metadata.get("kind", "screen")
+        if kind not in KINDS:
+            raise PluginError(f"{name}: неизвестный вид раздела {kind!r}")
+        info = PluginInfo(
+            name,
+            metadata["title"],
+            order=metadata.get("order", DEFAULT_ORDER),
+            kind=kind,
+            entry=metadata.get("entry"),
+            pause=metadata.get("pause", True),
+            **source,
+        )
+        self.plugins[name] = info
+        self.modules.pop(name, None)
+        return info
+
+    # ---------- поиск ----------
+    def discover_directory(self, directory: str, package: Optional[str] = None):
+        """Модули каталога; package - имя пакета, если каталог импортируемый"""
+        if not os.path.isdir(directory):
+            return
+        for filename in sorted(os.listdir(directory)):
+            name, extension = os.path.splitext(filename)
+            if extension != ".py" or name.startswith("_"):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                metadata = read_metadata(path)
+                if metadata is None:
+                    continue  # вспомогательный модуль, а не раздел
+                if package:
+                    self.register(name, metadata, module_name=f"{package}.{name}")
+                else:
+                    self.register(name, metadata, path=path)
+            except (OSError, SyntaxError, ValueError, PluginError) as e:
+                self.errors.append(f"{path}: {e}")
+
+    def discover_entry_points(self, group: str = ENTRY_POINT_GROUP):
+        """Разделы установленных пакетов: name = module[:function]"""
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python 3.7
+            return
+        found = entry_points()
+        if hasattr(found, "select"):
+            found = found.select(group=group)
+        else:
+            found = found.get(group, ())
+        for entry_point in found:
+            module_name, _, function = entry_point.value.partition(":")
+            module_name = module_name.strip()
+            try:
+                metadata = self._module_metadata(module_name)
+                if metadata is None:
+                    metadata = {"title": entry_point.name}
+                if function.strip():
+                    metadata = dict(metadata, entry=function.strip())
+                self.register(entry_point.name, metadata, module_name=module_name)
+            except (ImportError, OSError, SyntaxError, ValueError, PluginError) as e:
+                self.errors.append(f"{entry_point.value}: {e}")
+
+    def _module_metadata(self, module_name: str) -> Optional[dict]:
+        # find_spec импортирует только родительские пакеты, не сам модуль
+        spec = importlib.util.find_spec(module_name)
+        if spec is None:
+            raise ImportError(f"модуль {module_name} не найден")
+        if spec.origin and spec.origin.endswith(".py"):
+            return read_metadata(spec.origin)
+        return None
+
+    # ---------- использование ----------
+    def sorted(self) -> List[PluginInfo]:
+        return sorted(self.plugins.values(), key=lambda info: (info.order, info.title))
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.modules
+
+    def load(self, name: str):
+        """Модуль раздела; импортируется при первом обращении"""
+        module = self.modules.get(name)
+        if module is not None:
+            return module
+        info = self.plugins[name]
+        if info.module_name:
+            module = importlib.import_module(info.module_name)
+        else:
+            module_name = f"shoriext_plugins.{name}"
+            spec = importlib.util.spec_from_file_location(module_name, info.path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+        self.modules[name] = module
+        return module
+
+    def entry(self, name: str) -> Callable:
+        info = self.plugins[name]
+        function = getattr(self.load(name), info.entry, None)
+        if not callable(function):
+            raise PluginError(f"в разделе {name} нет функции {info.entry}")
+        return function
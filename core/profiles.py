@@ -0,0 +1,137 @@
+"""Профили: отдельные каталоги данных задач и календаря.
+
+Профиль по умолчанию хранит данные прямо в ``data/`` (как раньше),
+остальные - в ``data/profiles/<имя>/``. Профиль выбирается при запуске
+флагом ``--profile`` или переменной ``SHORIEXT_PROFILE``.
+
+В долгоживущем процессе (HTTP API) открытые профили держит
+``ProfileCache``: LRU ограниченного размера. Повторное обращение к
+профилю не читает файлы заново, а давно не использованные профили
+вытесняются - данные уже на диске, потому что менеджеры сохраняют
+каждое изменение.
+"""
+
+import itertools
+import os
+import re
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from core.calendar_manager import CalendarManager
+from core.task_manager import TaskManager
+from core.undo import UndoHistory
+
+ENV_PROFILE = "SHORIEXT_PROFILE"
+DATA_DIR = "data"
+DEFAULT_PROFILE = "default"
+PROFILE_NAME = re.compile(r"^[\w.-]{1,64}$")
+_serials = itertools.count(1)
+
+
+class ProfileError(ValueError):
+    pass
+
+
+def validate_name(name: str) -> str:
+    # Имя становится именем каталога: без разделителей пути и ".."
+    if not PROFILE_NAME.match(name) or name in (".", ".."):
+        raise ProfileError(f"Недопустимое имя профиля: {name!r}")
+    return name
+
+
+def profile_dir(name: str = DEFAULT_PROFILE, root: str = DATA_DIR) -> str:
+    if validate_name(name) == DEFAULT_PROFILE:
+        return root
+    return os.path.join(root, "profiles", name)
+
+
+def current_profile() -> str:
+    return os.environ.get(ENV_PROFILE) or DEFAULT_PROFILE
+
+
+def list_profiles(root: str = DATA_DIR) -> List[str]:
+    """Профили, у которых есть каталог данных; профиль по умолчанию - первым"""
+    directory = os.path.join(root, "profiles")
+    names = []
+    if os.path.isdir(directory):
+        names = sorted(
+            name
+            for name in os.listdir(directory)
+            if PROFILE_NAME.match(name) and os.path.isdir(os.path.join(directory, name))
+        )
+    return [DEFAULT_PROFILE] + [name for name in names if name != DEFAULT_PROFILE]
+
+
+class Profile:
+    """Менеджеры данных одного профиля"""
+
+    __slots__ = (
+        "name",
+        "directory",
+        "serial",
+        "undo_history",
+        "task_manager",
+        "calendar_manager",
+    )
+
+    def __init__(self, name: str = DEFAULT_PROFILE, root: str = DATA_DIR):
+        self.name = name
+        # Номер открытия в процессе: версии менеджеров после повторного
+        # открытия начинаются заново, а serial - нет
+        self.serial = next(_serials)
+        self.directory = profile_dir(name, root)
+        # Одна история на профиль: отмена идет в порядке действий по обоим разделам
+        self.undo_history = UndoHistory()
+        self.task_manager = TaskManager(
+            os.path.join(self.directory, "tasks.json"), self.undo_history
+        )
+        self.calendar_manager = CalendarManager(
+            os.path.join(self.directory, "calendar.json"), self.undo_history
+        )
+
+
+class ProfileCache:
+    """LRU открытых профилей"""
+
+    def __init__(
+        self,
+        maxsize: int = 32,
+        root: str = DATA_DIR,
+        factory: Optional[Callable[[str, str], Profile]] = None,
+    ):
+        self.maxsize = max(maxsize, 1)
+        self.root = root
+        self.factory = factory or Profile
+        self.hits = self.misses = self.evictions = 0
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._profiles
+
+    def get(self, name: str = DEFAULT_PROFILE) -> Profile:
+        profile = self._profiles.get(name)
+        if profile is not None:
+            self.hits += 1
+            self._profiles.move_to_end(name)
+            return profile
+
+        return self.put(self.factory(validate_name(name), self.root))
+
+    def put(self, profile: Profile) -> Profile:
+        """Добавляет профиль, открытый вызывающим кодом (например, в пуле потоков)"""
+        self.misses += 1
+        self._profiles[profile.name] = profile
+        self._profiles.move_to_end(profile.name)
+        if len(self._profiles) > self.maxsize:
+            self._profiles.popitem(last=False)
+            self.evictions += 1
+        return profile
+
+    def evict(self, name: str) -> bool:
+        return self._profiles.pop(name, None) is not None
+
+    def clear(self):
+        self._profiles.clear()
@@ -0,0 +1,199 @@
+"""Легковесные замеры времени: счетчики вызовов и гистограммы задержек.
+
+Замеры выключены по умолчанию; в выключенном состоянии обертка стоит
+одну проверку флага. Включаются переменной окружения ``SHORIEXT_TIMINGS=1``
+или флагом ``--timings`` в main.py. ``SHORIEXT_CPROFILE=<файл.prof>``
+(флаг ``--cprofile``) запускает всю сессию под cProfile.
+"""
+
+import atexit
+import cProfile
+import functools
+import inspect
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+ENV_TIMINGS = "SHORIEXT_TIMINGS"
+ENV_CPROFILE = "SHORIEXT_CPROFILE"
+BUCKETS = 32  # корзины по степеням двойки микросекунд: [2^(i-1), 2^i)
+
+_enabled = os.environ.get(ENV_TIMINGS, "") not in ("", "0")
+
+
+class _Stat:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        bucket = min(int(seconds * 1_000_000).bit_length(), BUCKETS - 1)
+        self.buckets[bucket] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Верхняя граница корзины, в которую попадает перцентиль (секунды)"""
+        threshold = self.count * fraction
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= threshold:
+                return min((1 << bucket) / 1_000_000, self.max)
+        return self.max
+
+
+_stats: Dict[str, _Stat] = {}
+
+
+def enable(flag: bool = True):
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    _stats.clear()
+
+
+def record(name: str, seconds: float):
+    stat = _stats.get(name)
+    if stat is None:
+        stat = _stats[name] = _Stat()
+    stat.add(seconds)
+
+
+@contextmanager
+def timed(name: str):
+    """Контекстный менеджер для замера произвольного блока"""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def instrument(name: Optional[str] = None) -> Callable:
+    """Декоратор замера функции; имя по умолчанию - ``Класс.метод``"""
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            # Для корутин замеряется время до результата, включая ожидание
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(label, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def summary() -> List[Dict[str, float]]:
+    rows = []
+    for name, stat in _stats.items():
+        rows.append(
+            {
+                "name": name,
+                "count": stat.count,
+                "total_ms": stat.total * 1000,
+                "mean_ms": stat.total / stat.count * 1000,
+                "p50_ms": stat.percentile(0.5) * 1000,
+                "p95_ms": stat.percentile(0.95) * 1000,
+                "max_ms": stat.max * 1000,
+            }
+        )
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+
+def format_summary() -> str:
+    rows = summary()
+    if not rows:
+        return "Замеры: нет данных"
+    lines = [
+        f"{'операция':45} {'вызовов':>8} {'всего, мс':>11} {'сред.':>9} "
+        f"{'p50':>9} {'p95':>9} {'макс.':>9}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['name']:45} {row['count']:8} {row['total_ms']:11.2f} "
+            f"{row['mean_ms']:9.3f} {row['p50_ms']:9.3f} {row['p95_ms']:9.3f} "
+            f"{row['max_ms']:9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def print_summary_at_exit(stream=None):
+    """Печатает сводку замеров при завершении процесса"""
+    atexit.register(lambda: print(format_summary(), file=stream or sys.stderr))
+
+
+def run_with_cprofile(func: Callable, path: str):
+    """Выполняет func под cProfile и сохраняет статистику в файл .prof
+
+    В профиль попадают и другие потоки: диалоги интерфейса, пул
+    run_blocking, фоновые обновления. До Python 3.12 cProfile видит только
+    поток, в котором включен, поэтому каждый новый поток получает свой
+    профилировщик, а статистика объединяется при сохранении.
+    """
+    profiler = cProfile.Profile()
+    thread_profilers: List[cProfile.Profile] = []
+    lock = threading.Lock()
+
+    def profile_thread(frame, event, arg):
+        # Первое событие нового потока; enable() заменяет этот обработчик
+        thread_profiler = cProfile.Profile()
+        with lock:
+            thread_profilers.append(thread_profiler)
+        thread_profiler.enable()
+
+    per_thread = sys.version_info < (3, 12)
+    if per_thread:
+        threading.setprofile(profile_thread)
+    try:
+        return profiler.runcall(func)
+    finally:
+        if per_thread:
+            threading.setprofile(None)
+        stats = pstats.Stats(profiler)
+        with lock:
+            for thread_profiler in thread_profilers:
+                stats.add(thread_profiler)
+        stats.dump_stats(path)
+        print(f"Профиль сохранен: {path}", file=sys.stderr)
@@ -0,0 +1,272 @@
+"""Планировщик напоминаний о событиях календаря и сроках задач.
+
+Напоминания лежат в куче по времени срабатывания. Фоновый поток спит на
+``threading.Condition`` ровно до ближайшего срока и просыпается раньше,
+только если добавлено более раннее напоминание. Добавление - O(log n),
+отмена ленивая: запись помечается и выбрасывается, когда доходит до
+вершины кучи (или при уплотнении, если отмененных стало больше половины).
+"""
+
+import heapq
+import itertools
+import os
+import shlex
+import subprocess
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import time as day_time
+from typing import Callable, Dict, Hashable, List, Optional
+
+ENV_HOOK = "SHORIEXT_REMINDER_HOOK"
+# События хранятся без времени: считаем, что они начинаются в 9:00
+EVENT_START = day_time(9, 0)
+# Страховка от перевода часов и сна системы: ожидание не дольше минуты
+MAX_SLEEP = 60.0
+_COMPACT_MIN = 64
+
+
+class Reminder:
+    __slots__ = ("key", "due", "title", "message", "cancelled")
+
+    def __init__(self, key: Hashable, due: float, title: str, message: str = ""):
+        self.key = key
+        self.due = due  # время срабатывания, секунды epoch
+        self.title = title
+        self.message = message
+        self.cancelled = False
+
+
+class ReminderScheduler:
+    def __init__(
+        self,
+        notify: Callable[[Reminder], None],
+        clock: Callable[[], float] = time.time,
+    ):
+        self.notify = notify
+        self.clock = clock
+        self._heap: List[tuple] = []
+        self._active: Dict[Hashable, Reminder] = {}
+        self._cancelled = 0
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def schedule(self, key: Hashable, due: float, title: str, message: str = ""):
+        """Добавляет напоминание; напоминание с тем же ключом заменяется"""
+        reminder = Reminder(key, due, title, message)
+        with self._condition:
+            self._cancel_locked(key)
+            self._active[key] = reminder
+            heapq.heappush(self._heap, (due, next(self._counter), reminder))
+            # Будим поток, только если новое напоминание раньше текущего
+            if self._heap[0][2] is reminder:
+                self._condition.notify()
+        return reminder
+
+    def cancel(self, key: Hashable) -> bool:
+        with self._condition:
+            return self._cancel_locked(key)
+
+    def _cancel_locked(self, key: Hashable) -> bool:
+        reminder = self._active.pop(key, None)
+        if reminder is None:
+            return False
+        reminder.cancelled = True
+        self._cancelled += 1
+        if self._cancelled > _COMPACT_MIN and self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        return True
+
+    def next_due(self) -> Optional[float]:
+        with self._condition:
+            self._drop_cancelled()
+            return self._heap[0][0] if self._heap else None
+
+    def _drop_cancelled(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+    def pop_due(self, now: Optional[float] = None) -> List[Reminder]:
+        """Снимает с кучи все напоминания, срок которых наступил"""
+        now = self.clock() if now is None else now
+        due = []
+        with self._condition:
+            self._drop_cancelled()
+            while self._heap and self._heap[0][0] <= now:
+                reminder = heapq.heappop(self._heap)[2]
+                del self._active[reminder.key]
+                due.append(reminder)
+                self._drop_cancelled()
+        return due
+
+    # ---------- фоновый поток ----------
+    def start(self):
+        if self._thread is None:
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="reminders", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    self._drop_cancelled()
+                    if self._heap and self._heap[0][0] <= self.clock():
+                        break
+                    timeout = (
+                        min(self._heap[0][0] - self.clock(), MAX_SLEEP)
+                        if self._heap
+                        else None
+                    )
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+            # Уведомляем вне блокировки: обработчик может планировать новые
+            for reminder in self.pop_due():
+                try:
+                    self.notify(reminder)
+                except Exception as e:
+                    print(f"Ошибка уведомления: {e}")
+
+
+# ---------- источники напоминаний ----------
+def _day_start(date: str) -> Optional[datetime]:
+    try:
+        return datetime.combine(datetime.strptime(date, "%Y-%m-%d").date(), EVENT_START)
+    except (TypeError, ValueError):
+        return None
+
+
+def event_due(event) -> Optional[float]:
+    """Время напоминания о событии календаря или None"""
+    if event.remind_before is None:
+        return None
+    start = _day_start(event.date)
+    if start is None:
+        return None
+    return (start - timedelta(minutes=event.remind_before)).timestamp()
+
+
+def task_due(task) -> Optional[float]:
+    """Напоминание о сроке незавершенной задачи - утром в день срока"""
+    if not task.due_date or task.is_completed:
+        return None
+    start = _day_start(task.due_date)
+    return start.timestamp() if start is not None else None
+
+
+class ReminderSource:
+    """Синхронизирует напоминания с менеджером по его уведомлениям об изменениях
+
+    Менеджер вызывает listener(change, items), где change - "added",
+    "updated", "removed" или "reset" (полная перезагрузка).
+    """
+
+    def __init__(self, scheduler: ReminderScheduler, manager, items):
+        self.scheduler = scheduler
+        self.keys = set()
+        manager.listeners.append(self.on_change)
+        self.on_change("reset", items)
+
+    def key(self, item):
+        raise NotImplementedError
+
+    def due(self, item) -> Optional[float]:
+        raise NotImplementedError
+
+    def describe(self, item):
+        """Заголовок и текст напоминания"""
+        raise NotImplementedError
+
+    def on_change(self, change: str, items):
+        if change == "reset":
+            for key in self.keys:
+                self.scheduler.cancel(key)
+            self.keys.clear()
+
+        now = self.scheduler.clock()
+        for item in items:
+            key = self.key(item)
+            due = None if change == "removed" else self.due(item)
+            if due is None or due < now:
+                # Удалено, напоминание не нужно или уже прошло (не догоняем)
+                if key in self.keys:
+                    self.scheduler.cancel(key)
+                    self.keys.discard(key)
+                continue
+            self.scheduler.schedule(key, due, *self.describe(item))
+            self.keys.add(key)
+
+
+class CalendarReminders(ReminderSource):
+    def __init__(self, scheduler: ReminderScheduler, manager):
+        super().__init__(scheduler, manager, manager.events)
+
+    def key(self, event):
+        return ("event", event.key)
+
+    def due(self, event):
+        return event_due(event)
+
+    def describe(self, event):
+        return event.title, f"{event.date}, через {event.remind_before} мин"
+
+
+class TaskReminders(ReminderSource):
+    def __init__(self, scheduler: ReminderScheduler, manager):
+        super().__init__(scheduler, manager, list(manager.tasks.values()))
+
+    def key(self, task):
+        return ("task", task.name)
+
+    def due(self, task):
+        return task_due(task)
+
+    def describe(self, task):
+        return task.name, f"срок задачи - сегодня ({task.due_date})"
+
+
+# ---------- уведомления ----------
+def print_notifier(reminder: Reminder):
+    print(f"\a🔔 {reminder.title}: {reminder.message}")
+
+
+def hook_notifier(command: str) -> Callable[[Reminder], None]:
+    """Уведомление внешней командой: заголовок и текст - аргументы и переменные"""
+    args = shlex.split(command)
+
+    def notify(reminder: Reminder):
+        env = dict(
+            os.environ,
+            SHORIEXT_REMINDER_TITLE=reminder.title,
+            SHORIEXT_REMINDER_MESSAGE=reminder.message,
+            SHORIEXT_REMINDER_DUE=str(int(reminder.due)),
+        )
+        # Не ждем завершения: медленный хук не задерживает остальные напоминания
+        subprocess.Popen(
+            args + [reminder.title, reminder.message],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    return notify
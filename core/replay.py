@@ -0,0 +1,299 @@
+"""Запись партий в компактный двоичный журнал и их воспроизведение.
+
+Формат файла (.shxr), все числа - беззнаковые varint (LEB128):
+
+* заголовок: ``SHXRPLY1``, длина и имя игры, зерно + 1 (0 - без зерна),
+  шаг индекса N;
+* кадры: один varint на ход - ``(мс с прошлого хода << bits) | код хода``,
+  где bits - разрядность кода хода для игры (3 бита у Тетриса);
+* индекс: число кадров, длительность (мс), число точек и на каждые
+  N кадров тройка (номер кадра, смещение в файле, время до кадра, мс);
+* хвост: ``<Q`` смещение индекса и снова ``SHXRPLY1``.
+
+Файл, не закрытый из-за сбоя, читается без индекса: кадры идут до конца.
+
+``ReplayPlayer`` проигрывает журнал без отрисовки. На точках индекса он
+сохраняет снимки состояния движка, поэтому перемотка назад восстанавливает
+ближайший снимок, а не повторяет партию с начала.
+"""
+
+import bisect
+import os
+import struct
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.game_manager import TETRIS_ACTIONS, SimpleTetris, TicTacToe
+from core.rng import MoveStream
+
+MAGIC = b"SHXRPLY1"
+_TRAILER = struct.Struct("<Q8s")
+DEFAULT_INDEX_EVERY = 256
+REPLAY_DIR = "data/replays"
+REPLAY_EXTENSION = ".shxr"
+
+
+class ReplayError(Exception):
+    pass
+
+
+class GameCodec:
+    """Коды ходов игры и создание движка по зерну"""
+
+    def __init__(self, moves, factory: Callable):
+        self.moves = tuple(moves)
+        self.codes = {move: code for code, move in enumerate(self.moves)}
+        self.bits = max(1, (len(self.moves) - 1).bit_length())
+        self.factory = factory
+
+
+CODECS: Dict[str, GameCodec] = {
+    "tetris": GameCodec(TETRIS_ACTIONS, SimpleTetris),
+    "tictactoe": GameCodec(range(9), lambda seed: TicTacToe()),
+}
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0:
+        raise ValueError("varint не может быть отрицательным")
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data, pos: int) -> Tuple[int, int]:
+    """Значение и позиция следующего байта"""
+    result = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("Обрезанный varint")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class ReplayWriter:
+    def __init__(
+        self,
+        path: str,
+        game: str,
+        seed: Optional[int] = None,
+        index_every: int = DEFAULT_INDEX_EVERY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.codec = CODECS[game]
+        self.path = path
+        self.index_every = index_every
+        self.clock = clock
+        self.frames = 0
+        self.elapsed_ms = 0
+        self.index: List[Tuple[int, int, int]] = []
+        self._synced = 0
+        self._last = clock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        name = game.encode()
+        self._file.write(
+            MAGIC
+            + encode_varint(len(name))
+            + name
+            + encode_varint(0 if seed is None else seed + 1)
+            + encode_varint(index_every)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, move, now: Optional[float] = None):
+        now = self.clock() if now is None else now
+        delta = max(0, int(round((now - self._last) * 1000)))
+        self._last = now
+        if self.frames % self.index_every == 0:
+            self.index.append((self.frames, self._file.tell(), self.elapsed_ms))
+        self.elapsed_ms += delta
+        self._file.write(
+            encode_varint(delta << self.codec.bits | self.codec.codes[move])
+        )
+        self.frames += 1
+
+    def sync(self, moves: MoveStream, now: Optional[float] = None):
+        """Дописывает ходы, сделанные после прошлой синхронизации"""
+        for move in moves.moves[self._synced :]:
+            self.write(move, now)
+        self._synced = len(moves)
+
+    def close(self):
+        if self._file.closed:
+            return
+        offset = self._file.tell()
+        block = bytearray()
+        for value in (self.frames, self.elapsed_ms, len(self.index)):
+            block += encode_varint(value)
+        for entry in self.index:
+            for value in entry:
+                block += encode_varint(value)
+        self._file.write(bytes(block) + _TRAILER.pack(offset, MAGIC))
+        self._file.close()
+
+
+class ReplayReader:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = f.read()
+        data = self.data
+        if data[: len(MAGIC)] != MAGIC:
+            raise ReplayError(f"{path}: не файл повтора")
+        length, pos = decode_varint(data, len(MAGIC))
+        self.game = data[pos : pos + length].decode()
+        if self.game not in CODECS:
+            raise ReplayError(f"{path}: неизвестная игра {self.game!r}")
+        self.codec = CODECS[self.game]
+        seed, pos = decode_varint(data, pos + length)
+        self.seed = seed - 1 if seed else None
+        self.index_every, self.frames_start = decode_varint(data, pos)
+        self.complete = self._read_index()
+        if not self.complete:
+            self.frames_end = len(data)
+            self.index = [(0, self.frames_start, 0)]
+            self.frame_count = self.duration_ms = 0
+            for _, elapsed, _ in self.frames():
+                self.frame_count += 1
+                self.duration_ms = elapsed
+
+    def _read_index(self) -> bool:
+        data = self.data
+        if len(data) < self.frames_start + _TRAILER.size:
+            return False
+        offset, magic = _TRAILER.unpack_from(data, len(data) - _TRAILER.size)
+        if magic != MAGIC or not self.frames_start <= offset < len(data):
+            return False
+        self.frames_end = offset
+        self.frame_count, pos = decode_varint(data, offset)
+        self.duration_ms, pos = decode_varint(data, pos)
+        count, pos = decode_varint(data, pos)
+        self.index = []
+        for _ in range(count):
+            frame, pos = decode_varint(data, pos)
+            frame_offset, pos = decode_varint(data, pos)
+            elapsed, pos = decode_varint(data, pos)
+            self.index.append((frame, frame_offset, elapsed))
+        if not self.index:
+            self.index = [(0, self.frames_start, 0)]
+        return True
+
+    def frames(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, int, object]]:
+        """Кадры (номер, время от начала в мс, ход) с номера start"""
+        point = bisect.bisect_right(self.index, (start, float("inf"))) - 1
+        frame, pos, elapsed = self.index[max(point, 0)]
+        data, end = self.data, self.frames_end
+        bits, moves = self.codec.bits, self.codec.moves
+        mask = (1 << bits) - 1
+        while pos < end and (stop is None or frame < stop):
+            try:
+                value, pos = decode_varint(data, pos)
+            except ReplayError:
+                return  # недописанный последний кадр
+            elapsed += value >> bits
+            if frame >= start:
+                yield frame, elapsed, moves[value & mask]
+            frame += 1
+
+
+class ReplayPlayer:
+    """Проигрывание журнала без отрисовки со снимками для перемотки"""
+
+    def __init__(self, reader: ReplayReader):
+        self.reader = reader
+        self.game = reader.codec.factory(reader.seed)
+        self.position = 0  # сколько кадров применено
+        self.elapsed_ms = 0
+        self._snapshots: Dict[int, Tuple[object, int]] = {0: (self.game.snapshot(), 0)}
+
+    def _apply(self, elapsed: int, move):
+        self.game.apply(move)
+        self.position += 1
+        self.elapsed_ms = elapsed
+        if self.position % self.reader.index_every == 0:
+            self._snapshots.setdefault(self.position, (self.game.snapshot(), elapsed))
+
+    def run(self, until: Optional[int] = None):
+        """Перемотка вперед до кадра until (или до конца); возвращает движок"""
+        for _, elapsed, move in self.reader.frames(self.position, until):
+            self._apply(elapsed, move)
+        return self.game
+
+    def seek(self, frame: int):
+        """Состояние после frame кадров"""
+        frame = max(0, min(frame, self.reader.frame_count))
+        nearest = max(point for point in self._snapshots if point <= frame)
+        if frame < self.position or nearest > self.position:
+            state, elapsed = self._snapshots[nearest]
+            history = self.game.moves.moves
+            if nearest <= len(history):
+                del history[nearest:]
+            else:
+                history.extend(
+                    move for _, _, move in self.reader.frames(len(history), nearest)
+                )
+            self.game.restore(state)
+            self.position, self.elapsed_ms = nearest, elapsed
+        return self.run(frame)
+
+    def play(
+        self,
+        speed: float = 1.0,
+        on_frame: Optional[Callable[[object], None]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Проигрывание в темпе записи, ускоренном в speed раз"""
+        for _, elapsed, move in self.reader.frames(self.position):
+            delay = (elapsed - self.elapsed_ms) / 1000 / speed
+            if delay > 0:
+                sleep(delay)
+            self._apply(elapsed, move)
+            if on_frame is not None:
+                on_frame(self.game)
+        return self.game
+
+
+# ---------- файлы повторов ----------
+def new_replay_path(game: str, directory: str = REPLAY_DIR) -> str:
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    return os.path.join(directory, f"{game}-{stamp}{REPLAY_EXTENSION}")
+
+
+def list_replays(directory: str = REPLAY_DIR) -> List[str]:
+    """Файлы повторов, новые первыми"""
+    if not os.path.isdir(directory):
+        return []
+    paths = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(REPLAY_EXTENSION)
+    ]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
+
+
+def prune_replays(keep: int = 50, directory: str = REPLAY_DIR):
+    """Удаляет старые повторы, оставляя keep последних"""
+    for path in list_replays(directory)[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
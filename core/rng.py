@@ -0,0 +1,94 @@
+"""Источники случайности: воспроизводимый для игр и криптостойкий для паролей.
+
+``GameRng`` - генератор с явным зерном: одно и то же зерно и те же ходы
+дают ту же партию бит в бит (повторы, бенчмарки). Зерно выбирается
+случайно, если не задано, и сохраняется вместе с ходами в ``MoveStream``.
+
+Пароли никогда не используют ``GameRng``: для них есть только
+``secure_rng()`` на ``secrets.SystemRandom`` (ГСЧ операционной системы).
+"""
+
+import random
+import secrets
+from typing import Iterator, List, Optional, Sequence
+
+
+class GameRng:
+    """Детерминированный ГСЧ игр (Mersenne Twister с известным зерном)"""
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = secrets.randbits(63)
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    def randrange(self, *args) -> int:
+        return self._random.randrange(*args)
+
+    def choice(self, items: Sequence):
+        return self._random.choice(items)
+
+    def shuffle(self, items: List):
+        self._random.shuffle(items)
+
+    def getstate(self):
+        return self._random.getstate()
+
+    def setstate(self, state):
+        self._random.setstate(state)
+
+
+class SevenBag:
+    """Рандомизатор «7-bag»: каждые 7 фигур - перестановка всех семи"""
+
+    def __init__(self, rng: GameRng, pieces: Sequence[str]):
+        self.rng = rng
+        self.pieces = list(pieces)
+        self._bag: List[str] = []
+
+    def _refill(self):
+        bag = list(self.pieces)
+        self.rng.shuffle(bag)
+        # Берем с конца списка, поэтому кладем в обратном порядке
+        self._bag = bag[::-1] + self._bag
+
+    def next(self) -> str:
+        if not self._bag:
+            self._refill()
+        return self._bag.pop()
+
+    def peek(self) -> str:
+        if not self._bag:
+            self._refill()
+        return self._bag[-1]
+
+
+class MoveStream:
+    """Запись партии: зерно ГСЧ и ходы по порядку"""
+
+    __slots__ = ("seed", "moves")
+
+    def __init__(self, seed: Optional[int] = None, moves=None):
+        self.seed = seed
+        self.moves = list(moves) if moves else []
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.moves)
+
+    def record(self, move):
+        self.moves.append(move)
+
+    def to_dict(self):
+        return {"seed": self.seed, "moves": list(self.moves)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("seed"), data.get("moves"))
+
+
+def secure_rng() -> random.SystemRandom:
+    """Криптостойкий ГСЧ для паролей; зерно не задается и не воспроизводится"""
+    return secrets.SystemRandom()
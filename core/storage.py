@@ -0,0 +1,291 @@
+"""Потоковое чтение и запись файлов данных.
+
+Записи разбираются по одной прямо из файла, без построения всего дерева
+JSON в памяти. Поддерживаются два формата, выбираемые по расширению:
+
+* ``.json`` - массив или объект записей (прежний формат, indent=2);
+* ``.jsonl`` - компактный формат: одна запись на строку.
+
+``SyncedFile`` позволяет нескольким процессам работать с одним каталогом
+данных: чтение под разделяемой блокировкой, запись под исключительной,
+перечитывание только при изменении файла и слияние параллельных правок.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, TextIO
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировки недоступны, работаем как раньше
+    fcntl = None
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+# Символы, которыми может продолжаться число JSON
+_NUMBER_TAIL = frozenset("0123456789+-.eE")
+
+
+def storage_format(path: str) -> str:
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "json"
+
+
+class _StreamReader:
+    """Инкрементальный разбор JSON-контейнера верхнего уровня"""
+
+    def __init__(self, stream: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(
+                f"Ожидался символ '{char}', найдено '{self.peek() or 'EOF'}'"
+            )
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Число у края буфера могло быть обрезано ("12|34", "67|e3", "1.|5"):
+            # дочитываем, если до конца буфера идут только символы числа
+            if not self.eof and self._number_at_edge(obj, end) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def _number_at_edge(self, obj, end: int) -> bool:
+        if isinstance(obj, bool) or not isinstance(obj, (int, float)):
+            return False
+        buffer = self.buffer
+        while end < len(buffer) and buffer[end] in _NUMBER_TAIL:
+            end += 1
+        return end == len(buffer)
+
+    def items(self) -> Iterator[object]:
+        """Значения массива или объекта верхнего уровня по одному"""
+        opening = self.peek()
+        if not opening:
+            return
+        if opening not in ("[", "{"):
+            raise ValueError("Файл данных должен содержать массив или объект JSON")
+        closing = "]" if opening == "[" else "}"
+        self.pos += 1
+
+        if self.peek() == closing:
+            self.pos += 1
+            return
+        while True:
+            if opening == "{":
+                self.value()  # ключ совпадает с полем записи
+                self.expect(":")
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect(closing)
+            return
+
+
+def iter_json_records(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    yield from _StreamReader(stream, chunk_size).items()
+
+
+def iter_jsonl_records(stream: TextIO) -> Iterator:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def load_records(path: str) -> Iterator:
+    """Записи файла данных по одной; пустой файл - пустая последовательность"""
+    with open(path, "r", encoding="utf-8") as f:
+        if storage_format(path) == "jsonl":
+            yield from iter_jsonl_records(f)
+        else:
+            yield from iter_json_records(f)
+
+
+def _indent(text: str) -> str:
+    # Перевод строки внутри JSON-строк экранируется, поэтому замена безопасна
+    return text.replace("\n", "\n  ")
+
+
+def write_records(
+    stream: TextIO, records: Iterable[dict], fmt: str, keyed_by: Optional[str] = None
+):
+    """Пишет записи по одной
+
+    Для формата json результат совпадает с ``json.dump(..., indent=2)``:
+    объектом по полю ``keyed_by`` или массивом, если поле не задано.
+    """
+    if fmt == "jsonl":
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False))
+            stream.write("\n")
+        return
+
+    opening, closing = ("{", "}") if keyed_by else ("[", "]")
+    first = True
+    for record in records:
+        stream.write(f"{opening}\n  " if first else ",\n  ")
+        first = False
+        if keyed_by:
+            stream.write(json.dumps(record[keyed_by], ensure_ascii=False))
+            stream.write(": ")
+        stream.write(_indent(json.dumps(record, ensure_ascii=False, indent=2)))
+    stream.write(f"{opening}{closing}" if first else f"\n{closing}")
+
+
+def save_records(path: str, records: Iterable[dict], keyed_by: Optional[str] = None):
+    """Атомарно сохраняет записи: пишет во временный файл и подменяет им исходный"""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            write_records(f, records, storage_format(path), keyed_by)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextmanager
+def file_lock(path: str, exclusive: bool = False):
+    """Рекомендательная блокировка через соседний файл ``<path>.lock``"""
+    with open(f"{path}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(
+                lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            )
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def file_signature(path: str):
+    """Признак версии файла: меняется при каждой записи (os.replace меняет inode)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def record_digest(record: dict) -> int:
+    return hash(json.dumps(record, ensure_ascii=False, sort_keys=True))
+
+
+class SyncedFile:
+    """Файл записей, разделяемый между процессами
+
+    Запоминает подпись файла и хеши записей на момент последней
+    синхронизации. Если при сохранении файл изменился, выполняется
+    трехстороннее слияние по ключу записи: чужие изменения сохраняются,
+    при конфликте одной и той же записи побеждает текущий процесс.
+    """
+
+    def __init__(self, path: str, key: Callable[[dict], Hashable]):
+        self.path = path
+        self.key = key
+        self.signature = None
+        self.base: Dict[Hashable, int] = {}
+
+    def changed(self) -> bool:
+        return file_signature(self.path) != self.signature
+
+    def load(self) -> Iterator[dict]:
+        if not os.path.exists(self.path):
+            self.signature = None
+            self.base = {}
+            return
+        with file_lock(self.path):
+            signature = file_signature(self.path)
+            base = {}
+            for record in load_records(self.path):
+                base[self.key(record)] = record_digest(record)
+                yield record
+            # Файл считается прочитанным, только если разбор дошел до конца:
+            # после ошибки или недочитанного генератора changed() остается True
+            self.signature = signature
+            self.base = base
+
+    def save(
+        self, records: Iterable[dict], keyed_by: Optional[str] = None
+    ) -> Optional[List[dict]]:
+        """Сохраняет записи; если пришлось слить чужие правки, возвращает результат"""
+        with file_lock(self.path, exclusive=True):
+            merged = None
+            if self.changed() and os.path.exists(self.path):
+                merged = self._merge(records, load_records(self.path))
+                records = merged
+
+            base = {}
+
+            def tracked(items):
+                for record in items:
+                    base[self.key(record)] = record_digest(record)
+                    yield record
+
+            save_records(self.path, tracked(records), keyed_by)
+            self.signature = file_signature(self.path)
+            self.base = base
+            return merged
+
+    def _merge(self, ours: Iterable[dict], theirs: Iterable[dict]) -> List[dict]:
+        ours_by_key = {self.key(record): record for record in ours}
+        result = []
+        seen = set()
+
+        for their in theirs:
+            key = self.key(their)
+            seen.add(key)
+            base_digest = self.base.get(key)
+            our = ours_by_key.get(key)
+            if our is None:
+                # Новая у них или изменена ими после нашего удаления - оставляем
+                if base_digest is None or record_digest(their) != base_digest:
+                    result.append(their)
+            elif record_digest(our) == base_digest:
+                result.append(their)
+            else:
+                result.append(our)
+
+        for key, our in ours_by_key.items():
+            if key in seen:
+                continue
+            # Удалена ими: сохраняем, только если мы ее создали или изменили
+            if key not in self.base or record_digest(our) != self.base[key]:
+                result.append(our)
+        return result
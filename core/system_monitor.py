@@ -0,0 +1,300 @@
+"""Мониторинг загрузки ПК чтением /proc напрямую (без psutil).
+
+Каждый вызов ``sample()`` читает четыре файла /proc через заранее
+открытые дескрипторы, вычисляет скорости по разнице с прошлым замером
+и кладет значения в кольцевые буферы фиксированного размера.
+
+``ProcessScanner`` строит таблицу процессов: имя и командная строка
+читаются один раз на pid, на каждом шаге перечитывается только
+/proc/<pid>/stat.
+"""
+
+import heapq
+import os
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+PROC = "/proc"
+SECTOR_SIZE = 512
+CMDLINE_LIMIT = 256  # байт командной строки, которые храним на процесс
+# Виртуальные устройства, дублирующие или не отражающие реальный ввод-вывод
+_SKIP_DISKS = ("loop", "ram", "zram", "dm-", "md")
+
+METRICS = (
+    "cpu_percent",
+    "mem_percent",
+    "mem_used",
+    "disk_read_bps",
+    "disk_write_bps",
+    "net_rx_bps",
+    "net_tx_bps",
+)
+
+
+class RingBuffer:
+    """Кольцевой буфер чисел фиксированной емкости"""
+
+    __slots__ = ("capacity", "_data", "_start", "_size")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = array("d", [0.0]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float):
+        index = (self._start + self._size) % self.capacity
+        self._data[index] = value
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def latest(self, default: float = 0.0) -> float:
+        if not self._size:
+            return default
+        return self._data[(self._start + self._size - 1) % self.capacity]
+
+    def __iter__(self) -> Iterator[float]:
+        for i in range(self._size):
+            yield self._data[(self._start + i) % self.capacity]
+
+    def values(self) -> List[float]:
+        return list(self)
+
+
+def available(proc: str = PROC) -> bool:
+    return os.path.exists(os.path.join(proc, "stat"))
+
+
+class SystemMonitor:
+    def __init__(self, history: int = 120, proc: str = PROC):
+        self.proc = proc
+        self.history: Dict[str, RingBuffer] = {
+            metric: RingBuffer(history) for metric in METRICS
+        }
+        self.mem_total = 0
+        self.self_cpu_percent = 0.0
+        self._files = {}
+        self._disks = self._physical_disks()
+        self._prev: Optional[dict] = None
+
+    def _physical_disks(self) -> Optional[set]:
+        block = "/sys/block"
+        if not os.path.isdir(block):
+            return None
+        return {name for name in os.listdir(block) if not name.startswith(_SKIP_DISKS)}
+
+    def _read(self, name: str) -> str:
+        # Файлы /proc держим открытыми: повторное чтение - seek и read
+        f = self._files.get(name)
+        if f is None:
+            f = self._files[name] = open(os.path.join(self.proc, name), "r")
+        f.seek(0)
+        return f.read()
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def _cpu_times(self):
+        fields = self._read("stat").split("\n", 1)[0].split()[1:]
+        values = [int(value) for value in fields[:8]]
+        idle = values[3] + values[4]  # idle + iowait
+        return sum(values), idle
+
+    def _memory(self):
+        info = {}
+        for line in self._read("meminfo").splitlines():
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable", "MemFree"):
+                info[key] = int(rest.split()[0]) * 1024
+        total = info.get("MemTotal", 0)
+        available_bytes = info.get("MemAvailable", info.get("MemFree", 0))
+        return total, total - available_bytes
+
+    def _disk_bytes(self):
+        read = written = 0
+        for line in self._read("diskstats").splitlines():
+            parts = line.split()
+            if len(parts) < 10:
+                continue
+            name = parts[2]
+            if self._disks is not None and name not in self._disks:
+                continue
+            read += int(parts[5])
+            written += int(parts[9])
+        return read * SECTOR_SIZE, written * SECTOR_SIZE
+
+    def _net_bytes(self):
+        rx = tx = 0
+        for line in self._read("net/dev").splitlines()[2:]:
+            name, _, data = line.partition(":")
+            if name.strip() == "lo":
+                continue
+            parts = data.split()
+            rx += int(parts[0])
+            tx += int(parts[8])
+        return rx, tx
+
+    def sample(self) -> Dict[str, float]:
+        """Снимает показания; скорости считаются относительно прошлого вызова"""
+        now = time.monotonic()
+        process_time = time.process_time()
+        cpu_total, cpu_idle = self._cpu_times()
+        self.mem_total, mem_used = self._memory()
+        disk_read, disk_written = self._disk_bytes()
+        net_rx, net_tx = self._net_bytes()
+
+        current = {
+            "time": now,
+            "process_time": process_time,
+            "cpu_total": cpu_total,
+            "cpu_idle": cpu_idle,
+            "disk_read": disk_read,
+            "disk_written": disk_written,
+            "net_rx": net_rx,
+            "net_tx": net_tx,
+        }
+        values = {
+            "mem_used": float(mem_used),
+            "mem_percent": mem_used / self.mem_total * 100 if self.mem_total else 0.0,
+        }
+
+        prev = self._prev
+        if prev is None:
+            values.update(
+                cpu_percent=0.0,
+                disk_read_bps=0.0,
+                disk_write_bps=0.0,
+                net_rx_bps=0.0,
+                net_tx_bps=0.0,
+            )
+        else:
+            elapsed = max(now - prev["time"], 1e-9)
+            total_delta = cpu_total - prev["cpu_total"]
+            idle_delta = cpu_idle - prev["cpu_idle"]
+            values["cpu_percent"] = (
+                (total_delta - idle_delta) / total_delta * 100 if total_delta else 0.0
+            )
+            # Счетчики могут сброситься (например, при смене интерфейса)
+            values["disk_read_bps"] = max(disk_read - prev["disk_read"], 0) / elapsed
+            values["disk_write_bps"] = (
+                max(disk_written - prev["disk_written"], 0) / elapsed
+            )
+            values["net_rx_bps"] = max(net_rx - prev["net_rx"], 0) / elapsed
+            values["net_tx_bps"] = max(net_tx - prev["net_tx"], 0) / elapsed
+            # Собственная нагрузка процесса монитора (включая отрисовку)
+            self.self_cpu_percent = (
+                (process_time - prev["process_time"]) / elapsed * 100
+            )
+
+        self._prev = current
+        for metric, value in values.items():
+            self.history[metric].append(value)
+        return values
+
+
+class ProcessInfo:
+    __slots__ = (
+        "pid",
+        "name",
+        "cmdline",
+        "start_time",
+        "cpu_ticks",
+        "cpu_percent",
+        "rss",
+    )
+
+    def __init__(self, pid: int, name: str, cmdline: str, start_time: int):
+        self.pid = pid
+        self.name = name
+        self.cmdline = cmdline
+        self.start_time = start_time
+        self.cpu_ticks = 0
+        self.cpu_percent = 0.0
+        self.rss = 0
+
+
+class ProcessScanner:
+    """Инкрементальный обход процессов с кешем статических данных по pid"""
+
+    SORT_KEYS = {
+        "cpu": lambda process: process.cpu_percent,
+        "rss": lambda process: process.rss,
+    }
+
+    def __init__(self, proc: str = PROC):
+        self.proc = proc
+        self.processes: Dict[int, ProcessInfo] = {}
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._last_scan: Optional[float] = None
+
+    def _read_stat(self, pid: int):
+        with open(os.path.join(self.proc, str(pid), "stat"), "rb") as f:
+            data = f.read()
+        # Имя процесса в скобках может содержать пробелы и скобки
+        open_paren = data.index(b"(")
+        close_paren = data.rindex(b")")
+        name = data[open_paren + 1 : close_paren].decode("utf-8", "replace")
+        fields = data[close_paren + 2 :].split()
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        start_time = int(fields[19])
+        rss = int(fields[21]) * self._page_size
+        return name, cpu_ticks, start_time, rss
+
+    def _read_cmdline(self, pid: int, default: str) -> str:
+        try:
+            with open(os.path.join(self.proc, str(pid), "cmdline"), "rb") as f:
+                raw = f.read()
+        except OSError:
+            return default
+        # Аргументы разделены нулями; переводы строк внутри аргументов схлопываем
+        cmdline = " ".join(raw[:CMDLINE_LIMIT].decode("utf-8", "replace").split())
+        return cmdline or f"[{default}]"
+
+    def scan(self) -> Dict[int, ProcessInfo]:
+        now = time.monotonic()
+        elapsed = now - self._last_scan if self._last_scan is not None else 0.0
+        self._last_scan = now
+
+        alive = set()
+        for entry in os.listdir(self.proc):
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            try:
+                name, cpu_ticks, start_time, rss = self._read_stat(pid)
+            except (OSError, ValueError, IndexError):
+                continue  # процесс завершился во время обхода
+            alive.add(pid)
+
+            process = self.processes.get(pid)
+            if process is None or process.start_time != start_time:
+                # Новый процесс (или переиспользованный pid)
+                process = ProcessInfo(
+                    pid, name, self._read_cmdline(pid, name), start_time
+                )
+                process.cpu_ticks = cpu_ticks
+                self.processes[pid] = process
+            elif elapsed > 0:
+                delta = cpu_ticks - process.cpu_ticks
+                process.cpu_percent = delta / self._clock_ticks / elapsed * 100
+                process.cpu_ticks = cpu_ticks
+            process.rss = rss
+
+        for pid in self.processes.keys() - alive:
+            del self.processes[pid]
+        return self.processes
+
+    def top(self, count: int = 10, sort_by: str = "cpu") -> List[ProcessInfo]:
+        """Первые count процессов по CPU или RSS (куча вместо полной сортировки)"""
+        return heapq.nlargest(
+            count, self.processes.values(), key=self.SORT_KEYS[sort_by]
+        )
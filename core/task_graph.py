@@ -0,0 +1,206 @@
+"""Граф зависимостей задач и очередь готовых к работе задач.
+
+Для каждой незавершенной задачи хранится число незавершенных
+зависимостей и обратные ребра (кто от нее зависит). Завершение или сброс
+задачи меняет счетчики только у ее зависимых, а готовые задачи лежат в
+куче по (приоритет, срок, время создания). Устаревшие записи кучи не
+удаляются сразу, а пропускаются при чтении (по номеру поколения задачи).
+
+Зависимость от несуществующей задачи считается выполненной.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+NO_DUE_DATE = "9999-12-31"
+
+
+def task_sort_key(task) -> Tuple[int, str, int]:
+    # Время создания - целые микросекунды, без форматирования в ISO-строку
+    return (
+        PRIORITY_RANK.get(task.priority, len(PRIORITY_RANK)),
+        task.due_date or NO_DUE_DATE,
+        task._created_ts,
+    )
+
+
+class TaskGraph:
+    def __init__(self):
+        self.tasks: Dict[str, object] = {}
+        # Обратные ребра: имя (в том числе еще не созданной задачи) -> зависимые
+        self.dependents: Dict[str, Set[str]] = {}
+        self.unmet: Dict[str, int] = {}
+        self.ready: Set[str] = set()
+        self.cycles: List[List[str]] = []
+        self._heap: List[tuple] = []
+        self._generation: Dict[str, int] = {}
+
+    # ---------- построение ----------
+    def rebuild(self, tasks: Iterable):
+        """Полное построение графа (загрузка файла, слияние)"""
+        self.tasks = {task.name: task for task in tasks}
+        self.dependents = {}
+        self.unmet = {}
+        self.ready = set()
+        self._heap = []
+        self._generation = {}
+        for task in self.tasks.values():
+            for dependency in task.depends_on:
+                self.dependents.setdefault(dependency, set()).add(task.name)
+        for task in self.tasks.values():
+            self.unmet[task.name] = self._count_unmet(task)
+            self._update_ready(task.name)
+        self.cycles = self.find_cycles()
+
+    def _is_open(self, name: str) -> bool:
+        task = self.tasks.get(name)
+        return task is not None and not task.is_completed
+
+    def _count_unmet(self, task) -> int:
+        return sum(1 for dependency in task.depends_on if self._is_open(dependency))
+
+    def _update_ready(self, name: str):
+        is_ready = self._is_open(name) and self.unmet.get(name, 0) == 0
+        if is_ready and name not in self.ready:
+            self.ready.add(name)
+            generation = self._generation.get(name, 0) + 1
+            self._generation[name] = generation
+            key = task_sort_key(self.tasks[name])
+            heapq.heappush(self._heap, (key, name, generation))
+        elif not is_ready:
+            self.ready.discard(name)
+
+    def _shift_dependents(self, name: str, delta: int):
+        for dependent in self.dependents.get(name, ()):
+            if dependent in self.unmet:
+                self.unmet[dependent] += delta
+                self._update_ready(dependent)
+
+    # ---------- инкрементальные изменения ----------
+    def add(self, task):
+        self.tasks[task.name] = task
+        for dependency in task.depends_on:
+            self.dependents.setdefault(dependency, set()).add(task.name)
+        self.unmet[task.name] = self._count_unmet(task)
+        self._update_ready(task.name)
+        if not task.is_completed:
+            # Задачи, ссылавшиеся на еще не существовавшую, теперь ее ждут
+            self._shift_dependents(task.name, 1)
+
+    def remove(self, name: str):
+        task = self.tasks.pop(name, None)
+        if task is None:
+            return
+        for dependency in task.depends_on:
+            self.dependents.get(dependency, set()).discard(name)
+        self.unmet.pop(name, None)
+        self.ready.discard(name)
+        if not task.is_completed:
+            self._shift_dependents(name, -1)
+        self.cycles = [cycle for cycle in self.cycles if name not in cycle]
+
+    def completed(self, name: str):
+        """Задача завершена: ее зависимые могут стать готовыми"""
+        self.ready.discard(name)
+        self._shift_dependents(name, -1)
+
+    def reopened(self, name: str):
+        """Задача снова не завершена (сброс): зависимые блокируются"""
+        self._update_ready(name)
+        self._shift_dependents(name, 1)
+
+    def refresh(self, name: str):
+        """Изменились приоритет или срок: перекладываем задачу в куче"""
+        if name in self.ready:
+            self.ready.discard(name)
+            self._update_ready(name)
+
+    # ---------- запросы ----------
+    def next_tasks(self, count: int = 10) -> List[object]:
+        """Первые count готовых задач по приоритету и сроку"""
+        taken = []
+        result = []
+        while self._heap and len(result) < count:
+            entry = heapq.heappop(self._heap)
+            _, name, generation = entry
+            if name not in self.ready or self._generation.get(name) != generation:
+                continue  # устаревшая запись
+            taken.append(entry)
+            result.append(self.tasks[name])
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return result
+
+    def blocked_by(self, name: str) -> List[str]:
+        task = self.tasks[name]
+        return [
+            dependency for dependency in task.depends_on if self._is_open(dependency)
+        ]
+
+    def plan(self) -> List[object]:
+        """Порядок выполнения всех незавершенных задач (алгоритм Кана с кучей)"""
+        unmet = {
+            name: count for name, count in self.unmet.items() if self._is_open(name)
+        }
+        heap = [
+            (task_sort_key(self.tasks[name]), name)
+            for name, count in unmet.items()
+            if count == 0
+        ]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            _, name = heapq.heappop(heap)
+            order.append(self.tasks[name])
+            for dependent in self.dependents.get(name, ()):
+                if dependent in unmet:
+                    unmet[dependent] -= 1
+                    if unmet[dependent] == 0:
+                        heapq.heappush(
+                            heap, (task_sort_key(self.tasks[dependent]), dependent)
+                        )
+        return order
+
+    def find_cycles(self) -> List[List[str]]:
+        """Циклы среди незавершенных задач (итеративный DFS)"""
+        white, gray, black = 0, 1, 2
+        color = {name: white for name in self.tasks if self._is_open(name)}
+        cycles = []
+        for root in color:
+            if color[root] != white:
+                continue
+            path = [root]
+            stack = [iter(self.tasks[root].depends_on)]
+            color[root] = gray
+            while stack:
+                dependency = next(stack[-1], None)
+                if dependency is None:
+                    color[path.pop()] = black
+                    stack.pop()
+                elif color.get(dependency) == white:
+                    color[dependency] = gray
+                    path.append(dependency)
+                    stack.append(iter(self.tasks[dependency].depends_on))
+                elif color.get(dependency) == gray:
+                    cycles.append(path[path.index(dependency) :] + [dependency])
+        return cycles
+
+    def path_between(self, start: str, target: str) -> Optional[List[str]]:
+        """Цепочка зависимостей от start до target, если она есть"""
+        parents = {start: None}
+        stack = [start]
+        while stack:
+            name = stack.pop()
+            if name == target:
+                path = []
+                while name is not None:
+                    path.append(name)
+                    name = parents[name]
+                return path[::-1]
+            task = self.tasks.get(name)
+            for dependency in task.depends_on if task is not None else ():
+                if dependency not in parents:
+                    parents[dependency] = name
+                    stack.append(dependency)
+        return None
@@ -0,0 +1,185 @@
+"""Потоковый импорт и экспорт задач в форматах JSONL и CSV.
+
+Записи читаются и пишутся по одной, в формате ``Task.to_dict``.
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Iterable, Iterator, TextIO, Union
+
+from core.timestamps import to_timestamp
+
+PRIORITIES = ("low", "medium", "high")
+CSV_FIELDS = [
+    "name",
+    "description",
+    "target_count",
+    "current_count",
+    "priority",
+    "created_at",
+    "completed_at",
+    "due_date",
+    "depends_on",
+]
+# Разделитель списка зависимостей в ячейке CSV
+DEPENDS_SEPARATOR = ";"
+FORMATS = ("jsonl", "csv")
+
+
+def detect_format(path: str) -> str:
+    """Определяет формат по расширению файла"""
+    extension = path.rsplit(".", 1)[-1].lower()
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension == "csv":
+        return "csv"
+    raise ValueError(f"Неизвестный формат файла: {path}")
+
+
+class RecordError(ValueError):
+    """Нечитаемая строка файла: итератор отдает ее вместо записи и читает дальше"""
+
+
+def _to_int(value, field: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Поле '{field}' должно быть целым числом: {value!r}")
+
+
+def _check_timestamp(value, field: str, name: str):
+    try:
+        to_timestamp(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Поле '{field}' должно быть датой ISO 8601: {name}")
+    return value
+
+
+def _check_history(history, name: str) -> list:
+    if not isinstance(history, list):
+        raise ValueError(f"История задачи должна быть списком: {name}")
+    for entry in history:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Запись истории должна быть объектом: {name}")
+        action = entry.get("action")
+        if not isinstance(action, str) or not action:
+            raise ValueError(f"Запись истории без действия: {name}")
+        if entry.get("timestamp") is None:
+            raise ValueError(f"Запись истории без времени: {name}")
+        _check_timestamp(entry["timestamp"], "history.timestamp", name)
+    return history
+
+
+def validate_task_record(record: dict) -> dict:
+    """Проверяет и нормализует запись задачи, при ошибке бросает ValueError"""
+    if not isinstance(record, dict):
+        raise ValueError("Запись задачи должна быть объектом")
+
+    name = record.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("Название задачи не может быть пустым")
+
+    target_count = _to_int(record.get("target_count") or 1, "target_count")
+    current_count = _to_int(record.get("current_count") or 0, "current_count")
+    if target_count < 1:
+        raise ValueError(f"Целевое количество должно быть положительным: {name}")
+    if not 0 <= current_count <= target_count:
+        raise ValueError(f"Прогресс вне диапазона 0..{target_count}: {name}")
+
+    priority = record.get("priority") or "medium"
+    if priority not in PRIORITIES:
+        raise ValueError(f"Неизвестный приоритет '{priority}': {name}")
+
+    due_date = record.get("due_date") or None
+    if due_date is not None:
+        try:
+            datetime.strptime(due_date, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            raise ValueError(f"Срок должен быть в формате ГГГГ-ММ-ДД: {name}")
+
+    depends_on = parse_depends_on(record.get("depends_on"))
+    if name in depends_on:
+        raise ValueError(f"Задача не может зависеть от самой себя: {name}")
+
+    history = _check_history(record.get("history") or [], name)
+    completed_at = record.get("completed_at") or None
+    if completed_at is not None:
+        _check_timestamp(completed_at, "completed_at", name)
+
+    normalized = {
+        "name": name,
+        "description": record.get("description") or "",
+        "target_count": target_count,
+        "current_count": current_count,
+        "priority": priority,
+        "completed_at": completed_at,
+        "history": history,
+        "due_date": due_date,
+        "depends_on": depends_on,
+    }
+    if record.get("created_at"):
+        normalized["created_at"] = _check_timestamp(
+            record["created_at"], "created_at", name
+        )
+    return normalized
+
+
+def parse_depends_on(value) -> list:
+    """Список зависимостей из списка или строки "a; b" (CSV, ввод)"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(DEPENDS_SEPARATOR)
+    if not isinstance(value, list):
+        raise ValueError(f"Зависимости должны быть списком: {value!r}")
+    return [str(name).strip() for name in value if str(name).strip()]
+
+
+def iter_jsonl_records(stream: TextIO) -> Iterator[Union[dict, RecordError]]:
+    """Записи по строкам; битая строка отдается как RecordError"""
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield RecordError(f"Строка {line_number}: некорректный JSON ({e})")
+            continue
+        yield record
+
+
+def iter_csv_records(stream: TextIO) -> Iterator[dict]:
+    yield from csv.DictReader(stream)
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Union[dict, RecordError]]:
+    if fmt == "jsonl":
+        return iter_jsonl_records(stream)
+    if fmt == "csv":
+        return iter_csv_records(stream)
+    raise ValueError(f"Неизвестный формат: {fmt}")
+
+
+def write_records(stream: TextIO, records: Iterable[dict], fmt: str) -> int:
+    """Записывает записи в поток по одной, возвращает их количество"""
+    count = 0
+    if fmt == "jsonl":
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False))
+            stream.write("\n")
+            count += 1
+    elif fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for record in records:
+            if record.get("depends_on"):
+                record = dict(
+                    record, depends_on=DEPENDS_SEPARATOR.join(record["depends_on"])
+                )
+            writer.writerow(record)
+            count += 1
+    else:
+        raise ValueError(f"Неизвестный формат: {fmt}")
+    return count
@@ -1,46 +1,173 @@
-import json
 import os
-from datetime import datetime
-from typing import Dict, List
+import sys
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.aio import run_blocking
+from core.profiling import instrument
+from core.storage import SyncedFile
+from core.task_graph import TaskGraph
+from core.task_io import (
+    PRIORITIES,
+    RecordError,
+    detect_format,
+    iter_records,
+    validate_task_record,
+    write_records,
+)
+from core.timestamps import from_timestamp, now_timestamp, to_timestamp
+from core.undo import RemoveTask, ResetTask, UndoError, UndoHistory
+
+_PRIORITIES = {priority: priority for priority in PRIORITIES}
+# Коды действий истории: индекс в списке хранится в bytearray задачи
+_HISTORY_ACTIONS: List[str] = ["increment", "reset"]
+_HISTORY_CODES: Dict[str, int] = {
+    action: code for code, action in enumerate(_HISTORY_ACTIONS)
+}
+
+
+def _history_code(action: str) -> int:
+    code = _HISTORY_CODES.get(action)
+    if code is None:
+        if len(_HISTORY_ACTIONS) > 255:
+            raise ValueError(f"Слишком много типов действий в истории: {action}")
+        code = len(_HISTORY_ACTIONS)
+        _HISTORY_ACTIONS.append(sys.intern(action))
+        _HISTORY_CODES[action] = code
+    return code
 
 
 class Task:
+    # Компактная модель: без __dict__, метки времени - целые микросекунды,
+    # история - два плоских массива вместо списка словарей
+    __slots__ = (
+        "name",
+        "description",
+        "target_count",
+        "current_count",
+        "_priority",
+        "_created_ts",
+        "_completed_ts",
+        "_history_ts",
+        "_history_actions",
+        "due_date",
+        "_depends_on",
+    )
+
     def __init__(
         self,
         name: str,
         description: str = "",
         target_count: int = 1,
         priority: str = "medium",
+        due_date: Optional[str] = None,
+        depends_on: Iterable[str] = (),
     ):
         self.name = name
         self.description = description
         self.target_count = target_count
         self.current_count = 0
         self.priority = priority  # low, medium, high
-        self.created_at = datetime.now().isoformat()
-        self.completed_at = None
-        self.history = []
+        self._created_ts = now_timestamp()
+        self._completed_ts = None
+        self._history_ts = None
+        self._history_actions = None
+        self.due_date = due_date  # формат: YYYY-MM-DD
+        self.depends_on = depends_on
+
+    @property
+    def priority(self) -> str:
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: str):
+        self._priority = _PRIORITIES.get(value) or sys.intern(value)
+
+    @property
+    def depends_on(self) -> Tuple[str, ...]:
+        return self._depends_on
+
+    @depends_on.setter
+    def depends_on(self, names: Iterable[str]):
+        # Без повторов и с сохранением порядка
+        self._depends_on = tuple(dict.fromkeys(sys.intern(name) for name in names))
+
+    @property
+    def is_completed(self) -> bool:
+        return self._completed_ts is not None
+
+    @property
+    def created_at(self) -> str:
+        return from_timestamp(self._created_ts)
+
+    @created_at.setter
+    def created_at(self, value: str):
+        self._created_ts = to_timestamp(value)
+
+    @property
+    def completed_at(self) -> Optional[str]:
+        return from_timestamp(self._completed_ts)
+
+    @completed_at.setter
+    def completed_at(self, value: Optional[str]):
+        self._completed_ts = to_timestamp(value)
+
+    @property
+    def history(self) -> List[dict]:
+        if not self._history_ts:
+            return []
+        return [
+            {"timestamp": from_timestamp(ts), "action": _HISTORY_ACTIONS[code]}
+            for ts, code in zip(self._history_ts, self._history_actions)
+        ]
+
+    @history.setter
+    def history(self, entries: List[dict]):
+        self._history_ts = None
+        self._history_actions = None
+        for entry in entries:
+            self._record(entry["action"], to_timestamp(entry["timestamp"]))
+
+    @property
+    def history_length(self) -> int:
+        return len(self._history_ts) if self._history_ts else 0
+
+    def _record(self, action: str, timestamp: int):
+        if self._history_ts is None:
+            self._history_ts = array("q")
+            self._history_actions = bytearray()
+        self._history_ts.append(timestamp)
+        self._history_actions.append(_history_code(action))
 
     def increment(self):
         if self.current_count < self.target_count:
             self.current_count += 1
-            self.history.append(
-                {"timestamp": datetime.now().isoformat(), "action": "increment"}
-            )
+            now = now_timestamp()
+            self._record("increment", now)
             if self.current_count >= self.target_count:
-                self.completed_at = datetime.now().isoformat()
+                self._completed_ts = now
             return True
         return False
 
     def reset(self):
         self.current_count = 0
-        self.completed_at = None
-        self.history.append(
-            {"timestamp": datetime.now().isoformat(), "action": "reset"}
-        )
+        self._completed_ts = None
+        self._record("reset", now_timestamp())
 
-    def to_dict(self):
-        return {
+    def undo_reset(self, count: int, completed_ts: Optional[int]):
+        """Возвращает прогресс до reset и убирает его запись из истории"""
+        self.current_count = count
+        self._completed_ts = completed_ts
+        if self._history_actions and self._history_actions[-1] == _history_code(
+            "reset"
+        ):
+            self._history_ts.pop()
+            self._history_actions.pop()
+
+    def to_dict(self, include_history: bool = True):
+        data = {
             "name": self.name,
             "description": self.description,
             "target_count": self.target_count,
@@ -48,8 +175,15 @@ class Task:
             "priority": self.priority,
             "created_at": self.created_at,
             "completed_at": self.completed_at,
-            "history": self.history,
         }
+        # Новые поля пишутся только если заданы: старые файлы не меняются
+        if self.due_date:
+            data["due_date"] = self.due_date
+        if self.depends_on:
+            data["depends_on"] = list(self.depends_on)
+        if include_history:
+            data["history"] = self.history
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -58,82 +192,348 @@ class Task:
             data.get("description", ""),
             data.get("target_count", 1),
             data.get("priority", "medium"),
+            data.get("due_date"),
+            data.get("depends_on", ()),
         )
         task.current_count = data.get("current_count", 0)
-        task.created_at = data.get("created_at", datetime.now().isoformat())
+        if data.get("created_at"):
+            task.created_at = data["created_at"]
         task.completed_at = data.get("completed_at")
         task.history = data.get("history", [])
         return task
 
 
 class TaskManager:
-    def __init__(self, data_file: str = "data/tasks.json"):
+    def __init__(
+        self,
+        data_file: str = "data/tasks.json",
+        undo_history: Optional[UndoHistory] = None,
+    ):
         self.data_file = data_file
+        # Сброс и удаление задач можно отменить; история может быть общей с календарем
+        self.undo_history = undo_history if undo_history is not None else UndoHistory()
         self.tasks: Dict[str, Task] = {}
+        self.graph = TaskGraph()
+        # Растет при каждой загрузке и сохранении; по нему сбрасываются кеши ответов
+        self.version = 0
+        # Подписчики на изменения: listener("added" | "removed" | "updated" | "reset", задачи)
+        self.listeners: List[Callable[[str, List[Task]], None]] = []
+        self.store = SyncedFile(data_file, key=lambda record: record["name"])
+        # Файловые операции из пула потоков (async-методы) идут по одной
+        self._io_lock = threading.Lock()
+        # Пока идет save_data_async, сохранения не ждут _io_lock: они ставят
+        # флаг, и она записывает файл еще раз (флаги меняются в потоке цикла)
+        self._saving = False
+        self._save_pending = False
         self.load_data()
 
+    @instrument()
     def load_data(self):
+        self._apply_loaded(self._read_tasks())
+
+    @instrument()
+    async def load_data_async(self, executor=None):
+        """load_data без блокировки цикла: разбор файла и граф строит пул потоков"""
+        loaded = await run_blocking(self._read_indexed, executor=executor)
+        if loaded is None:
+            return
+        self.tasks, self.graph = loaded
+        self.version += 1
+        self._notify("reset", list(self.tasks.values()))
+
+    def _read_tasks(self) -> Optional[Dict[str, Task]]:
+        """Задачи из файла; None - файл не разобран, текущие данные остаются"""
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for task_name, task_data in data.items():
-                        self.tasks[task_name] = Task.from_dict(task_data)
-            except Exception as e:
-                print(f"Ошибка загрузки данных: {e}")
+        tasks: Dict[str, Task] = {}
+        try:
+            # Записи преобразуются в Task по мере разбора файла
+            with self._io_lock:
+                for task_data in self.store.load():
+                    tasks[task_data["name"]] = Task.from_dict(task_data)
+        except Exception as e:
+            print(f"Ошибка загрузки данных: {e}")
+            return None
+        return tasks
+
+    def _read_indexed(self) -> Optional[Tuple[Dict[str, Task], TaskGraph]]:
+        tasks = self._read_tasks()
+        if tasks is None:
+            return None
+        graph = TaskGraph()
+        graph.rebuild(tasks.values())
+        return tasks, graph
+
+    def _apply_loaded(self, tasks: Optional[Dict[str, Task]]):
+        if tasks is None:
+            return
+        self.tasks = tasks
+        self.version += 1
+        self._rebuild_graph()
+
+    def _rebuild_graph(self):
+        self.graph.rebuild(self.tasks.values())
+        self._notify("reset", list(self.tasks.values()))
+
+    def _notify(self, change: str, tasks: List[Task]):
+        for listener in self.listeners:
+            listener(change, tasks)
+
+    def reload_if_changed(self) -> bool:
+        """Перечитывает файл, только если его изменил другой процесс"""
+        if not self.store.changed():
+            return False
+        self.load_data()
+        return True
 
+    @instrument()
     def save_data(self):
+        self.version += 1
+        if self._saving:
+            # Запись в пуле еще идет: после нее save_data_async запишет и это
+            self._save_pending = True
+            return
         try:
-            data = {name: task.to_dict() for name, task in self.tasks.items()}
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._apply_merged(
+                self._write_records(task.to_dict() for task in self.tasks.values())
+            )
         except Exception as e:
             print(f"Ошибка сохранения данных: {e}")
 
+    @instrument()
+    async def save_data_async(self, executor=None):
+        """save_data без блокировки цикла: сериализация и запись в пуле потоков"""
+        self.version += 1
+        if self._saving:
+            self._save_pending = True
+            return
+        self._saving = True
+        try:
+            while True:
+                self._save_pending = False
+                # Словари строятся в цикле: пул получает готовый снимок
+                records = [task.to_dict() for task in self.tasks.values()]
+                try:
+                    merged = await run_blocking(
+                        self._write_records, records, executor=executor
+                    )
+                    self._apply_merged(merged)
+                except Exception as e:
+                    print(f"Ошибка сохранения данных: {e}")
+                if not self._save_pending:
+                    break
+        finally:
+            self._saving = False
+
+    def _write_records(self, records: Iterable[dict]) -> Optional[List[dict]]:
+        with self._io_lock:
+            return self.store.save(records, keyed_by="name")
+
+    def _apply_merged(self, merged: Optional[List[dict]]):
+        if merged is not None:
+            # Файл изменил другой процесс - принимаем результат слияния
+            self.tasks = {data["name"]: Task.from_dict(data) for data in merged}
+            self._rebuild_graph()
+
     def add_task(
         self,
         name: str,
         description: str = "",
         target_count: int = 1,
         priority: str = "medium",
+        due_date: Optional[str] = None,
+        depends_on: Iterable[str] = (),
     ):
         if name in self.tasks:
             return False
-        self.tasks[name] = Task(name, description, target_count, priority)
+        task = Task(name, description, target_count, priority, due_date, depends_on)
+        for dependency in task.depends_on:
+            # Кто-то уже ссылается на новое имя: зависимость может замкнуть цикл
+            path = self.graph.path_between(dependency, name)
+            if path is not None:
+                cycle = " → ".join([name] + path)
+                raise ValueError(f"Циклическая зависимость: {cycle}")
+        self.tasks[name] = task
+        self.graph.add(task)
+        self._notify("added", [task])
         self.save_data()
         return True
 
+    def add_tasks(self, tasks: Iterable[Task], overwrite: bool = False) -> int:
+        """Массовое добавление задач с одной записью на диск"""
+        count = 0
+        for task in tasks:
+            if task.name in self.tasks and not overwrite:
+                continue
+            self.tasks[task.name] = task
+            count += 1
+        if count:
+            # Массовая загрузка: граф строится заново за O(V + E), циклы - в graph.cycles
+            self._rebuild_graph()
+            self.save_data()
+        return count
+
+    @instrument()
+    def import_tasks(
+        self, path: str, fmt: Optional[str] = None, overwrite: bool = False
+    ) -> Dict[str, object]:
+        """Импорт задач из JSONL/CSV: записи проверяются и применяются одной записью"""
+        fmt = fmt or detect_format(path)
+        start = time.perf_counter()
+        pending: Dict[str, Task] = {}
+        skipped = 0
+        errors: List[str] = []
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for record in iter_records(f, fmt):
+                if isinstance(record, RecordError):
+                    errors.append(str(record))  # битая строка не прерывает импорт
+                    continue
+                try:
+                    task = Task.from_dict(validate_task_record(record))
+                except ValueError as e:
+                    errors.append(str(e))
+                    continue
+                if task.name in pending or (task.name in self.tasks and not overwrite):
+                    skipped += 1
+                    continue
+                pending[task.name] = task
+
+        imported = self.add_tasks(pending.values(), overwrite=overwrite)
+        elapsed = time.perf_counter() - start
+        return {
+            "imported": imported,
+            "skipped": skipped,
+            "errors": errors,
+            "seconds": elapsed,
+            "tasks_per_sec": imported / elapsed if elapsed > 0 else 0.0,
+        }
+
+    @instrument()
+    def export_tasks(
+        self,
+        path: str,
+        fmt: Optional[str] = None,
+        predicate: Optional[Callable[[Task], bool]] = None,
+        include_history: bool = False,
+    ) -> int:
+        """Экспорт задач (или подмножества по predicate) в JSONL/CSV"""
+        fmt = fmt or detect_format(path)
+        include_history = include_history and fmt == "jsonl"
+        records = (
+            task.to_dict(include_history=include_history)
+            for task in self.tasks.values()
+            if predicate is None or predicate(task)
+        )
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            return write_records(f, records, fmt)
+
     def increment_task(self, name: str):
         if name in self.tasks:
-            result = self.tasks[name].increment()
+            task = self.tasks[name]
+            was_completed = task.is_completed
+            result = task.increment()
+            if task.is_completed and not was_completed:
+                # Пересчитываются только задачи, зависящие от завершенной
+                self.graph.completed(name)
+                self._notify("updated", [task])
             self.save_data()
             return result
         return False
 
     def reset_task(self, name: str):
         if name in self.tasks:
-            self.tasks[name].reset()
+            task = self.tasks[name]
+            was_completed = task.is_completed
+            self.undo_history.record(ResetTask(self, task))
+            task.reset()
+            if was_completed:
+                self.graph.reopened(name)
+                self._notify("updated", [task])
             self.save_data()
             return True
         return False
 
+    def restore_progress(
+        self, name: str, count: int, completed_ts: Optional[int], history_length: int
+    ):
+        """Отмена сброса: прежние счетчик и время завершения.
+
+        Только пока задача в том состоянии, в каком ее оставил сброс, иначе
+        отмена затерла бы отметки, сделанные после него (здесь или в другом
+        процессе).
+        """
+        task = self.tasks.get(name)
+        if task is None:
+            raise UndoError(f"задачи «{name}» больше нет")
+        if task.current_count != 0 or task.history_length != history_length:
+            raise UndoError(f"после сброса задачу «{name}» уже изменили")
+        was_completed = task.is_completed
+        task.undo_reset(count, completed_ts)
+        if task.is_completed and not was_completed:
+            self.graph.completed(name)
+            self._notify("updated", [task])
+        self.save_data()
+
     def remove_task(self, name: str):
-        if name in self.tasks:
-            del self.tasks[name]
-            self.save_data()
-            return True
-        return False
+        task = self.tasks.get(name)
+        if task is None:
+            return False
+        # Для отмены хватает ссылки на удаленный объект - копия не нужна
+        self.undo_history.record(RemoveTask(self, task))
+        self.discard_task(name)
+        return True
+
+    def discard_task(self, name: str) -> bool:
+        """Удаляет задачу без записи в историю отмены; False - ее уже нет"""
+        task = self.tasks.pop(name, None)
+        if task is None:
+            return False
+        self.graph.remove(name)
+        self._notify("removed", [task])
+        self.save_data()
+        return True
+
+    def restore_task(self, task: Task):
+        """Отмена удаления: тот же объект задачи возвращается в хранилище"""
+        if task.name in self.tasks:
+            raise UndoError(f"задача «{task.name}» уже существует")
+        self.tasks[task.name] = task
+        self.graph.add(task)
+        if any(self.graph.path_between(dep, task.name) for dep in task.depends_on):
+            # Задача замыкала цикл из файла: remove убрал его из graph.cycles
+            self.graph.cycles = self.graph.find_cycles()
+        self._notify("added", [task])
+        self.save_data()
 
     def get_task(self, name: str):
         return self.tasks.get(name)
 
+    @instrument()
     def get_all_tasks(self):
         return list(self.tasks.values())
 
+    @instrument()
+    def get_next_tasks(self, count: int = 10) -> List[Task]:
+        """Готовые к работе задачи: все зависимости завершены"""
+        return self.graph.next_tasks(count)
+
+    @instrument()
+    def get_plan(self) -> List[Task]:
+        """Все незавершенные задачи в порядке выполнения с учетом зависимостей"""
+        return self.graph.plan()
+
+    def get_blocked_tasks(self) -> Dict[str, List[str]]:
+        """Незавершенные задачи, ожидающие зависимостей: {задача: [зависимости]}"""
+        return {
+            name: self.graph.blocked_by(name)
+            for name, count in self.graph.unmet.items()
+            if count and not self.tasks[name].is_completed
+        }
+
+    @instrument()
     def get_statistics(self):
         total_tasks = len(self.tasks)
-        completed_tasks = sum(1 for task in self.tasks.values() if task.completed_at)
+        completed_tasks = sum(1 for task in self.tasks.values() if task.is_completed)
         total_progress = sum(task.current_count for task in self.tasks.values())
         total_target = sum(task.target_count for task in self.tasks.values())
 
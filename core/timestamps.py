@@ -0,0 +1,36 @@
+"""Компактное хранение меток времени как целых микросекунд от эпохи.
+
+Модели держат в памяти ``int`` вместо ISO-строки и переводят значение
+обратно в ``datetime.isoformat()`` только при сериализации.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def now_timestamp() -> int:
+    return (datetime.now() - _EPOCH) // _MICROSECOND
+
+
+def to_timestamp(value: Optional[str]) -> Optional[int]:
+    """ISO-строка -> микросекунды (локальное время без часового пояса)"""
+    if value is None:
+        return None
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def from_timestamp(value: Optional[int]) -> Optional[str]:
+    """Микросекунды -> ISO-строка в том же виде, что и datetime.isoformat()"""
+    if value is None:
+        return None
+    return (_EPOCH + timedelta(microseconds=value)).isoformat()
+
+
+def to_datetime(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
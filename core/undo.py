@@ -0,0 +1,192 @@
+"""Отмена и повтор изменений данных (undo/redo).
+
+Каждое необратимое действие менеджера (сброс и удаление задачи,
+удаление события) записывает в ``UndoHistory`` объект-команду. Команда
+хранит ровно то, что нужно для отмены: удаленные объекты - ссылками на
+те же экземпляры (без копий), сброс - прежние счетчики. Поэтому шаг
+истории стоит сотни байт, и даже для большого хранилища можно держать
+сотни шагов.
+
+Данные находятся по ключам (имя задачи, ключ события), а не по объектам:
+файл могли перечитать. Если шаг уже неприменим - объекта нет или задачу
+отмечали после сброса, - ``UndoError`` объясняет причину, и шаг забывается.
+
+Память истории ограничена бюджетом: при превышении забываются самые
+старые шаги. Размер шага оценивается по ``sys.getsizeof`` полей команды
+и удерживаемых объектов.
+"""
+
+import sys
+from collections import deque
+from typing import Deque, List, Optional
+
+DEFAULT_BUDGET = 4 * 1024 * 1024
+
+
+def approx_size(obj) -> int:
+    """Оценка памяти объекта со слотами и его непосредственных полей"""
+    size = sys.getsizeof(obj)
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            value = getattr(obj, slot, None)
+            if value is not None:
+                size += sys.getsizeof(value)
+    return size
+
+
+class UndoError(Exception):
+    """Шаг нельзя применить: данные изменились после него"""
+
+
+class Command:
+    """Отменяемое действие: undo возвращает состояние, redo повторяет действие"""
+
+    __slots__ = ("manager", "label", "size")
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.label = ""
+        self.size = 0
+
+    def measure(self, *held):
+        """Размер шага: сама команда, ее поля и удерживаемые объекты данных"""
+        # Менеджер общий для всех шагов - в бюджет шага он не входит
+        self.size = approx_size(self) - sys.getsizeof(self.manager)
+        self.size += sum(approx_size(obj) for obj in held)
+
+    def undo(self):
+        raise NotImplementedError
+
+    def redo(self):
+        raise NotImplementedError
+
+
+class RemoveTask(Command):
+    __slots__ = ("task",)
+
+    def __init__(self, manager, task):
+        super().__init__(manager)
+        self.task = task  # тот же объект, что был в хранилище
+        self.label = f"удаление задачи «{task.name}»"
+        self.measure(task)
+
+    def undo(self):
+        self.manager.restore_task(self.task)
+
+    def redo(self):
+        # По имени: после перечитывания файла в хранилище уже другой объект
+        if not self.manager.discard_task(self.task.name):
+            raise UndoError(f"задачи «{self.task.name}» уже нет")
+
+
+class ResetTask(Command):
+    __slots__ = ("name", "count", "completed_ts", "history_length")
+
+    def __init__(self, manager, task):
+        super().__init__(manager)
+        self.name = task.name
+        self.label = f"сброс задачи «{task.name}»"
+        self.capture(task)
+        self.measure()
+
+    def capture(self, task):
+        """Прогресс до сброса и длина истории сразу после него"""
+        self.count = task.current_count
+        self.completed_ts = task._completed_ts
+        self.history_length = task.history_length + 1  # + запись reset
+
+    def undo(self):
+        self.manager.restore_progress(
+            self.name, self.count, self.completed_ts, self.history_length
+        )
+
+    def redo(self):
+        task = self.manager.get_task(self.name)
+        if task is None:
+            raise UndoError(f"задачи «{self.name}» больше нет")
+        self.capture(task)
+        self.manager.reset_task(self.name)
+
+
+class RemoveEvents(Command):
+    __slots__ = ("events",)
+
+    def __init__(self, manager, events: List):
+        super().__init__(manager)
+        self.events = events
+        first = events[0]
+        self.label = f"удаление события «{first.title}» ({first.date})"
+        self.measure(*events)
+
+    def undo(self):
+        self.manager.restore_events(self.events)
+
+    def redo(self):
+        # Ровно те же события (по ключу), а не все с таким названием и датой
+        if not self.manager.discard_events(self.events):
+            first = self.events[0]
+            raise UndoError(f"события «{first.title}» ({first.date}) уже нет")
+
+
+class UndoHistory:
+    """Стеки отмены и повтора с общим бюджетом памяти"""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self._undo: Deque[Command] = deque()
+        self._redo: List[Command] = []
+        self._applying = False
+
+    def record(self, command: Command):
+        # Во время undo/redo менеджер вызывает обычные методы - их не пишем
+        if self._applying:
+            return
+        self.used -= sum(done.size for done in self._redo)
+        self._redo.clear()
+        self._undo.append(command)
+        self.used += command.size
+        # Последний шаг остается, даже если один превышает бюджет
+        while self.used > self.budget and len(self._undo) > 1:
+            self.used -= self._undo.popleft().size
+
+    def _apply(self, source, target, method: str) -> Optional[Command]:
+        if not source:
+            return None
+        command = source.pop()
+        self._applying = True
+        try:
+            getattr(command, method)()
+        except Exception:
+            self.used -= command.size  # состояние изменилось извне - шаг забыт
+            raise
+        finally:
+            self._applying = False
+        target.append(command)
+        return command
+
+    def undo(self) -> Optional[Command]:
+        """Отменяет последнее действие; None - отменять нечего.
+
+        UndoError - данные изменились после шага: он забывается.
+        """
+        return self._apply(self._undo, self._redo, "undo")
+
+    def redo(self) -> Optional[Command]:
+        return self._apply(self._redo, self._undo, "redo")
+
+    @property
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].label if self._undo else None
+
+    @property
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self.used = 0
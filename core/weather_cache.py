@@ -0,0 +1,254 @@
+"""Кеш прогнозов погоды и фоновое обновление.
+
+``WeatherRefresher`` - фоновый поток: заранее, за ``REFRESH_AHEAD`` до
+истечения срока годности, запрашивает прогнозы настроенных городов и
+сохраняет их в ``data/weather_cache.json``. Раздел погоды показывает
+последний удачный прогноз из кеша сразу, с возрастом данных, и не ждет
+поставщика, даже если тот медленный или недоступен. Кеш переживает
+перезапуск: после старта сразу есть что показать, а поток запрашивает
+только устаревшие города.
+
+Неудачный запрос повторяется с растущей паузой (от ``RETRY_MIN`` до
+срока годности), старый прогноз при этом остается в кеше. Раздел может
+поторопить обновление устаревшего города (``request``), но не раньше,
+чем закончится пауза после ошибки.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from core.weather_service import DEFAULT_CITY, FORECAST_DAYS, WeatherService
+
+ENV_CITIES = "SHORIEXT_WEATHER_CITIES"
+CACHE_FILE = "data/weather_cache.json"
+WEATHER_TTL = 30 * 60  # секунд, пока прогноз считается свежим
+REFRESH_AHEAD = 5 * 60  # обновление начинается заранее
+RETRY_MIN = 30.0
+STOP_TIMEOUT = 1.0
+# Страховка от перевода часов и сна системы: ожидание не дольше минуты
+MAX_SLEEP = 60.0
+
+
+def configured_cities() -> List[str]:
+    """Города из SHORIEXT_WEATHER_CITIES (через запятую), по умолчанию - Москва"""
+    cities = [city.strip() for city in os.environ.get(ENV_CITIES, "").split(",")]
+    return list(dict.fromkeys(city for city in cities if city)) or [DEFAULT_CITY]
+
+
+def format_age(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "только что"
+    if minutes < 60:
+        return f"{minutes} мин назад"
+    hours = minutes // 60
+    if hours < 48:
+        return f"{hours} ч назад"
+    return f"{hours // 24} дн назад"
+
+
+def describe_error(error: Exception) -> str:
+    """Короткое описание ошибки запроса для строки под прогнозом"""
+    response = getattr(error, "response", None)
+    if response is not None:
+        return f"поставщик ответил {response.status_code}"
+    message = str(error)
+    if not message or len(message) > 80:
+        return f"поставщик недоступен ({type(error).__name__})"
+    return message
+
+
+class CachedForecast:
+    __slots__ = ("city", "days", "fetched_at")
+
+    def __init__(self, city: str, days: List[Dict], fetched_at: float):
+        self.city = city
+        self.days = days  # ответ поставщика без преобразований
+        self.fetched_at = fetched_at  # секунды epoch
+
+    def age(self, now: Optional[float] = None) -> float:
+        return max((time.time() if now is None else now) - self.fetched_at, 0.0)
+
+    def to_dict(self):
+        return {"city": self.city, "days": self.days, "fetched_at": self.fetched_at}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["city"], data["days"], data["fetched_at"])
+
+
+class WeatherCache:
+    """Последний удачный прогноз по каждому городу; файл пишется атомарно"""
+
+    def __init__(self, path: str = CACHE_FILE):
+        self.path = path
+        self._entries: Dict[str, CachedForecast] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                records = json.load(f)
+            entries = [CachedForecast.from_dict(record) for record in records]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Нет файла или он поврежден: кеш просто заполнится заново
+            entries = []
+        with self._lock:
+            self._entries = {entry.city: entry for entry in entries}
+
+    def get(self, city: str) -> Optional[CachedForecast]:
+        return self._entries.get(city)
+
+    def put(self, entry: CachedForecast):
+        with self._lock:
+            self._entries[entry.city] = entry
+            records = [item.to_dict() for item in self._entries.values()]
+            self._write(records)
+
+    def _write(self, records: List[dict]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class WeatherRefresher:
+    def __init__(
+        self,
+        service: Optional[WeatherService] = None,
+        cache: Optional[WeatherCache] = None,
+        cities: Optional[List[str]] = None,
+        ttl: float = WEATHER_TTL,
+        ahead: float = REFRESH_AHEAD,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.service = service or WeatherService()
+        self.cache = cache if cache is not None else WeatherCache()
+        self.cities = cities or configured_cities()
+        self.ttl = ttl
+        self.ahead = min(ahead, ttl)
+        self.clock = clock
+        # Последняя ошибка по городу; сбрасывается первым удачным запросом
+        self.errors: Dict[str, str] = {}
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    @property
+    def enabled(self) -> bool:
+        # Имитированный прогноз строится мгновенно - кешировать нечего
+        return bool(self.service.base_url)
+
+    def is_stale(self, entry: CachedForecast) -> bool:
+        return entry.age(self.clock()) >= self.ttl
+
+    def forecast(self, city: str = DEFAULT_CITY):
+        """Прогноз для отображения и запись кеша, из которой он взят.
+
+        Никогда не обращается к поставщику: (None, None) - данных еще нет.
+        """
+        if not self.enabled:
+            return self.service.get_forecast(city), None
+        entry = self.cache.get(city)
+        if entry is None:
+            return None, None
+        return self.service.normalize(entry.days), entry
+
+    def due(self, city: str) -> float:
+        """Когда город нужно обновить, секунды epoch"""
+        retry = self._retry_at.get(city)
+        if retry is not None:
+            return retry
+        entry = self.cache.get(city)
+        if entry is None:
+            return 0.0  # прогноза еще нет - нужен сейчас
+        return entry.fetched_at + self.ttl - self.ahead
+
+    def refresh(self, city: str) -> bool:
+        """Запрашивает прогноз города; вызывается из фонового потока"""
+        try:
+            days = self.service.fetch_days(city, FORECAST_DAYS)
+        except Exception as e:
+            failures = self._failures.get(city, 0) + 1
+            self._failures[city] = failures
+            delay = min(RETRY_MIN * 2 ** (failures - 1), self.ttl)
+            self._retry_at[city] = self.clock() + delay
+            self.errors[city] = describe_error(e)
+            ok = False
+        else:
+            self.cache.put(CachedForecast(city, days, self.clock()))
+            self._failures.pop(city, None)
+            self._retry_at.pop(city, None)
+            self.errors.pop(city, None)
+            ok = True
+        with self._condition:
+            self._condition.notify_all()
+        return ok
+
+    def request(self, city: str) -> bool:
+        """Будит поток, если городу пора обновиться; паузу после ошибки не сокращает"""
+        if self.due(city) > self.clock():
+            return False
+        with self._condition:
+            self._condition.notify_all()
+        return True
+
+    def wait(self, city: str, timeout: float) -> bool:
+        """Ждет первого результата по городу (прогноза или ошибки) до timeout"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.cache.get(city) is not None or city in self.errors,
+                timeout,
+            )
+
+    # ---------- фоновый поток ----------
+    def start(self):
+        if self._thread is None and self.enabled:
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="weather", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            # Запрос к медленному поставщику не прерывается и не держит выход:
+            # поток-демон завершится сам, кеш пишется атомарно
+            self._thread.join(STOP_TIMEOUT)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    delay = min(self.due(city) for city in self.cities) - self.clock()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(min(delay, MAX_SLEEP))
+                if self._stopped:
+                    return
+            now = self.clock()
+            for city in self.cities:
+                if self._stopped:
+                    return
+                if self.due(city) <= now:
+                    self.refresh(city)
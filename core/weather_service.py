@@ -1,16 +1,91 @@
-import requests
+import os
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from core.aio import DEFAULT_TIMEOUT, fetch_json
+from core.profiling import instrument
+
+# Адрес поставщика прогнозов: GET <url>/forecast?city=...&days=... ->
+# [{"date": "YYYY-MM-DD", "condition": ..., "temp_min": ..., "temp_max": ...}]
+ENV_WEATHER_URL = "SHORIEXT_WEATHER_URL"
+DEFAULT_CITY = "Москва"
+FORECAST_DAYS = 7
 
 
 class WeatherService:
-    def __init__(self):
-        # В реальной реализации здесь был бы API ключ
-        # self.api_key = "your_api_key"
-        pass
+    def __init__(
+        self, base_url: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT
+    ):
+        # Без адреса поставщика прогноз имитируется
+        base_url = base_url or os.environ.get(ENV_WEATHER_URL, "")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
 
+    @instrument()
     def get_moscow_weather_forecast(self):
-        """Имитация получения погоды для Москвы на неделю"""
-        # Это имитация данных - в реальном приложении здесь был бы API вызов
+        """Прогноз погоды для Москвы на неделю"""
+        return self.get_forecast(DEFAULT_CITY)
+
+    @instrument()
+    def get_forecast(self, city: str = DEFAULT_CITY, days: int = FORECAST_DAYS):
+        if not self.base_url:
+            return self._simulated_forecast(days)
+        return self.normalize(self.fetch_days(city, days))
+
+    def fetch_days(self, city: str = DEFAULT_CITY, days: int = FORECAST_DAYS):
+        """Ответ поставщика как есть - в таком виде прогноз хранится в кеше"""
+        # Импорт requests занимает ~0.1 с: без поставщика он не нужен вовсе,
+        # а интерфейс создает сервис при запуске
+        import requests
+
+        response = requests.get(
+            f"{self.base_url}/forecast",
+            params={"city": city, "days": days},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @instrument()
+    async def get_forecast_async(
+        self, city: str = DEFAULT_CITY, days: int = FORECAST_DAYS
+    ):
+        """То же, что get_forecast, но HTTP-запрос не блокирует цикл событий"""
+        if not self.base_url:
+            return self._simulated_forecast(days)
+        raw = await fetch_json(
+            f"{self.base_url}/forecast",
+            {"city": city, "days": days},
+            timeout=self.timeout,
+        )
+        return self.normalize(raw)
+
+    def normalize(self, raw_days: List[Dict]) -> List[Dict]:
+        """Ответ поставщика в формате, который отображает интерфейс.
+
+        День недели и отметка «сегодня» считаются на момент вызова, а
+        прошедшие дни пропускаются: прогноз из кеша верен и на следующий день.
+        """
+        today = datetime.now().date()
+        days = []
+        for raw in raw_days:
+            day = datetime.strptime(raw["date"], "%Y-%m-%d").date()
+            if day < today:
+                continue  # прошедшие дни из старого прогноза
+            days.append(
+                {
+                    "date": day.strftime("%d.%m.%Y"),
+                    "day_of_week": self.get_day_of_week(day.weekday()),
+                    "condition": raw["condition"],
+                    "temp_min": raw["temp_min"],
+                    "temp_max": raw["temp_max"],
+                    "is_today": day == today,
+                }
+            )
+        return days
+
+    def _simulated_forecast(self, count: int = FORECAST_DAYS):
+        """Имитация данных - когда поставщик прогнозов не настроен"""
         days = []
         today = datetime.now()
 
@@ -18,7 +93,7 @@ class WeatherService:
         weather_conditions = ["Солнечно", "Облачно", "Дождь", "Снег", "Гроза"]
         temperatures = [(-5, 2), (0, 5), (5, 12), (10, 18), (15, 25), (20, 30)]
 
-        for i in range(7):
+        for i in range(count):
             date = today + timedelta(days=i)
             temp_range = temperatures[i % len(temperatures)]
 
@@ -0,0 +1,135 @@
+"""Списки слов для парольных фраз в файлах с индексом смещений.
+
+Текстовый список (по слову на строку) один раз компилируется в файл:
+заголовок ``<8sI`` (MAGIC, число слов), таблица ``<I`` из count + 1
+смещений и слова в UTF-8 подряд. Файл отображается в память (mmap), и
+i-е слово читается по двум соседним смещениям за O(1) без загрузки всего
+списка. Скомпилированный файл пересобирается, если исходный новее.
+
+Встроенные списки лежат в ``core/wordlists`` (en, ru); вместо имени
+языка можно передать путь к своему текстовому списку.
+"""
+
+import math
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from typing import Dict
+
+MAGIC = b"SHXWORD1"
+_HEADER = struct.Struct("<8sI")
+_OFFSET = struct.Struct("<I")
+WORDLIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wordlists")
+CACHE_DIR = "data/wordlists"
+LANGUAGES = ("en", "ru")
+
+
+def compile_wordlist(source: str, target: str) -> int:
+    """Компилирует текстовый список в файл с индексом; возвращает число слов"""
+    offsets = array("I", [0])
+    blob = bytearray()
+    seen = set()
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            word = line.strip()
+            if not word or word.startswith("#") or word in seen:
+                continue
+            seen.add(word)  # повтор слова исказил бы оценку энтропии
+            blob += word.encode("utf-8")
+            offsets.append(len(blob))
+    if len(offsets) < 2:
+        raise ValueError(f"{source}: список слов пуст")
+
+    directory = os.path.dirname(target)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{target}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(offsets) - 1))
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            f.write(blob)
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(offsets) - 1
+
+
+class Wordlist:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # пустой файл
+            self._file.close()
+            raise ValueError(f"{path}: поврежденный список слов")
+        magic, self.count = _HEADER.unpack_from(self._map, 0)
+        self._words_start = _HEADER.size + (self.count + 1) * _OFFSET.size
+        if magic != MAGIC or len(self._map) < self._words_start:
+            self.close()
+            raise ValueError(f"{path}: поврежденный список слов")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        position = _HEADER.size + index * _OFFSET.size
+        start, end = struct.unpack_from("<II", self._map, position)
+        base = self._words_start
+        return self._map[base + start : base + end].decode("utf-8")
+
+    @property
+    def entropy_per_word(self) -> float:
+        return math.log2(self.count)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def wordlist_source(name: str) -> str:
+    if name in LANGUAGES:
+        return os.path.join(WORDLIST_DIR, f"{name}.txt")
+    return name
+
+
+def open_wordlist(name: str = "en", cache_dir: str = CACHE_DIR) -> Wordlist:
+    """Список по имени языка или пути к текстовому файлу"""
+    source = wordlist_source(name)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(cache_dir, f"{stem}.words")
+    if name not in LANGUAGES:
+        # Свои списки с одинаковыми именами файлов не должны пересекаться
+        target = os.path.join(
+            cache_dir,
+            f"{stem}-{zlib.crc32(os.path.abspath(source).encode()):08x}.words",
+        )
+    stale = not os.path.exists(target)
+    if not stale:
+        stale = os.path.getmtime(target) < os.path.getmtime(source)
+    if stale:
+        compile_wordlist(source, target)
+    return Wordlist(target)
+
+
+_open: Dict[str, Wordlist] = {}
+
+
+def get_wordlist(name: str = "en") -> Wordlist:
+    """Открытый список слов; один на процесс для каждого имени"""
+    wordlist = _open.get(name)
+    if wordlist is None:
+        wordlist = _open[name] = open_wordlist(name)
+    return wordlist
@@ -1,10 +1,72 @@
 #!/usr/bin/env python3
-from ui.interface import ShoriextUI
+import argparse
+import functools
+import os
+
+from core import profiling
+from core.profiles import ENV_PROFILE, ProfileError, current_profile, validate_name
+from core.reminders import ENV_HOOK
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="shoriext - консольная утилита")
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="собирать замеры времени и вывести сводку при выходе",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="FILE",
+        default=os.environ.get(profiling.ENV_CPROFILE),
+        help="запустить сессию под cProfile и сохранить профиль в FILE (.prof)",
+    )
+    parser.add_argument(
+        "--reminder-hook",
+        metavar="CMD",
+        default=os.environ.get(ENV_HOOK),
+        help="команда для напоминаний (получает заголовок и текст аргументами)",
+    )
+    parser.add_argument(
+        "--profile",
+        default=current_profile(),
+        help=f"профиль данных (каталог data/profiles/<имя>; также {ENV_PROFILE})",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="запустить HTTP/JSON API вместо интерфейса",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="адрес API")
+    parser.add_argument("--port", type=int, default=8080, help="порт API")
+    args = parser.parse_args()
+    try:
+        validate_name(args.profile)
+    except ProfileError as e:
+        parser.error(str(e))
+    return args
 
 
 def main():
-    ui = ShoriextUI()
-    ui.run()
+    args = parse_args()
+    if args.timings:
+        profiling.enable()
+    if profiling.is_enabled():
+        profiling.print_summary_at_exit()
+
+    if args.serve:
+        from core.api_server import ApiServer
+
+        api = ApiServer(default_profile=args.profile)
+        run = functools.partial(api.serve, args.host, args.port)
+    else:
+        from ui.interface import ShoriextUI
+
+        run = ShoriextUI(reminder_hook=args.reminder_hook, profile=args.profile).run
+    if args.cprofile:
+        profiling.run_with_cprofile(run, args.cprofile)
+    else:
+        run()
 
 
 if __name__ == "__main__":
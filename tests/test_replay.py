@@ -0,0 +1,126 @@
+"""Запись партии в журнал и воспроизведение: то же поле и тот же счет."""
+
+import itertools
+
+from core.game_manager import SimpleTetris, TicTacToe
+from core.replay import ReplayPlayer, ReplayReader, ReplayWriter
+
+SEED = 20240611
+
+
+def fake_clock(step: float = 0.05):
+    ticks = itertools.count()
+    return lambda: next(ticks) * step
+
+
+def stack_badness(game: SimpleTetris):
+    """Чем меньше, тем лучше: конец игры, затем убранные линии, дыры и высота"""
+    holes = height = 0
+    for x in range(game.board_width):
+        column = [row[x] != " " for row in game.board]
+        top = column.index(True) if True in column else game.board_height
+        height += game.board_height - top
+        holes += column[top:].count(False)
+    return game.game_over, -game.lines, holes * 4 + height
+
+
+def best_placement(game: SimpleTetris):
+    """Ходы до лучшей позиции текущей фигуры; пробует их на снимке движка"""
+    best = None
+    for turns in range(4):
+        for shift in range(-5, 6):
+            moves = ["rotate"] * turns
+            moves += ["left" if shift < 0 else "right"] * abs(shift) + ["drop"]
+            state, made = game.snapshot(), len(game.moves)
+            for move in moves:
+                game.apply(move)
+            key = stack_badness(game)
+            game.restore(state)
+            del game.moves.moves[made:]
+            if best is None or key < best[0]:
+                best = key, moves
+    return best[1]
+
+
+def play_tetris(path, index_every: int = 16) -> SimpleTetris:
+    """Партия до конца игры с записью в журнал после каждого хода"""
+    game = SimpleTetris(SEED)
+    with ReplayWriter(
+        str(path), "tetris", game.moves.seed, index_every, clock=fake_clock()
+    ) as writer:
+        while not game.game_over:
+            for move in best_placement(game):
+                game.apply(move)
+                writer.sync(game.moves)
+    return game
+
+
+def assert_same_tetris(replayed: SimpleTetris, original: SimpleTetris):
+    assert replayed.board == original.board
+    assert replayed.score == original.score
+    assert replayed.lines == original.lines
+    assert replayed.game_over == original.game_over
+    assert replayed.next_kind == original.next_kind
+
+
+def test_tetris_replay_matches_recorded_game(tmp_path):
+    path = tmp_path / "tetris.shxr"
+    original = play_tetris(path)
+    assert original.lines > 0  # партия с убранными линиями, а не пустое поле
+
+    reader = ReplayReader(str(path))
+    assert reader.complete
+    assert reader.game == "tetris"
+    assert reader.seed == SEED
+    assert reader.frame_count == len(original.moves)
+    assert len(reader.index) > 1
+
+    replayed = ReplayPlayer(reader).run()
+    assert_same_tetris(replayed, original)
+    assert replayed.moves.moves == original.moves.moves
+
+
+def test_tetris_seek_restores_intermediate_states(tmp_path):
+    path = tmp_path / "tetris.shxr"
+    original = play_tetris(path)
+    reader = ReplayReader(str(path))
+    player = ReplayPlayer(reader)
+    player.run()
+
+    for frame in (reader.frame_count // 2, 10, 0, reader.frame_count - 1):
+        expected = SimpleTetris(SEED)
+        for move in original.moves.moves[:frame]:
+            expected.apply(move)
+        assert_same_tetris(player.seek(frame), expected)
+
+    assert_same_tetris(player.seek(reader.frame_count), original)
+
+
+def test_unfinished_replay_is_read_without_index(tmp_path):
+    path = tmp_path / "tetris.shxr"
+    original = play_tetris(path)
+    data = path.read_bytes()
+    reader = ReplayReader(str(path))
+    # Файл, оборванный сбоем: нет индекса и хвоста
+    path.write_bytes(data[: reader.frames_end])
+
+    truncated = ReplayReader(str(path))
+    assert not truncated.complete
+    assert truncated.frame_count == len(original.moves)
+    assert_same_tetris(ReplayPlayer(truncated).run(), original)
+
+
+def test_tictactoe_replay_matches_recorded_game(tmp_path):
+    path = tmp_path / "tictactoe.shxr"
+    game = TicTacToe()
+    with ReplayWriter(str(path), "tictactoe", clock=fake_clock()) as writer:
+        for position in (4, 0, 2, 6, 3, 5, 1, 7, 8):
+            assert game.apply(position)
+            writer.sync(game.moves)
+            if game.check_winner():
+                break
+
+    replayed = ReplayPlayer(ReplayReader(str(path))).run()
+    assert replayed.board == game.board
+    assert replayed.current_player == game.current_player
+    assert replayed.check_winner() == game.check_winner()
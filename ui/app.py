@@ -0,0 +1,445 @@
+"""Событийный цикл интерфейса на asyncio.
+
+``App`` держит стек экранов, читает клавиши в отдельном потоке и
+перерисовывает только устаревшие регионы верхнего экрана не чаще
+``FRAME_INTERVAL``. Фоновые задачи (обновление данных, замеры монитора)
+запускаются через ``App.spawn`` и не блокируются вводом.
+
+Действия, построенные на ``Prompt.ask`` (добавление задачи, игры и т.п.),
+выполняются как диалоги: отрисовка приостанавливается, функция работает
+в отдельном потоке, а цикл событий продолжает обслуживать фоновые задачи.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import os
+import sys
+import threading
+from typing import Callable, Dict, List, Optional
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.prompt import Prompt
+
+from core.profiling import instrument
+
+try:
+    import select
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+_ESCAPE_SEQUENCES = {
+    "\x1b[A": "up",
+    "\x1b[B": "down",
+    "\x1b[C": "right",
+    "\x1b[D": "left",
+    "\x1bOA": "up",
+    "\x1bOB": "down",
+    "\x1bOC": "right",
+    "\x1bOD": "left",
+}
+_WINDOWS_KEYS = {"H": "up", "P": "down", "M": "right", "K": "left"}
+BACK_KEYS = ("0", "escape", "backspace", "q")
+
+
+class KeyReader(threading.Thread):
+    """Поток чтения клавиш: одна клавиша за раз, следующая - после resume()
+
+    Пока обрабатывается клавиша (в том числе открыт диалог с Prompt),
+    поток не читает stdin, поэтому ввод диалога ему не достается. Чтение
+    идет под ``stdin_lock``: диалог держит его до конца, так что поток и
+    диалог не читают stdin одновременно, даже если диалог открыт не по
+    нажатию клавиши.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__(name="key-reader", daemon=True)
+        self.loop = loop
+        self.queue = queue
+        self.stream = sys.stdin
+        self._resume = threading.Event()
+        self._resume.set()
+        self.stdin_lock = threading.Lock()
+        self._raw = termios is not None and self.stream.isatty()
+        self._saved_mode = (
+            termios.tcgetattr(self.stream.fileno()) if self._raw else None
+        )
+
+    def resume(self):
+        self._resume.set()
+
+    def restore_terminal(self):
+        if self._saved_mode is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_mode)
+
+    def run(self):
+        while True:
+            self._resume.wait()
+            self._resume.clear()
+            with self.stdin_lock:
+                try:
+                    key = self.read_key()
+                except (OSError, ValueError):
+                    key = "eof"
+            try:
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, key)
+            except RuntimeError:
+                return  # цикл событий уже закрыт
+            if key == "eof":
+                return
+
+    def read_key(self) -> str:
+        if self._raw:
+            return self._read_raw()
+        if msvcrt is not None and self.stream.isatty():
+            return self._read_windows()
+        # Ввод не из терминала (например, из канала): одна строка - одна клавиша
+        line = self.stream.readline()
+        if not line:
+            return "eof"
+        return line.strip() or "enter"
+
+    def _read_raw(self) -> str:
+        fd = self.stream.fileno()
+        try:
+            tty.setcbreak(fd)
+            data = os.read(fd, 1)
+            if not data:
+                return "eof"
+            if data == b"\x1b":
+                # Стрелки приходят escape-последовательностью; одиночный Esc - нет
+                while len(data) < 3 and select.select([fd], [], [], 0.02)[0]:
+                    data += os.read(fd, 1)
+            elif data[0] >= 0xC0:
+                # Остальные байты символа UTF-8 (кириллица и т.п.)
+                size = 4 if data[0] >= 0xF0 else 3 if data[0] >= 0xE0 else 2
+                while len(data) < size:
+                    chunk = os.read(fd, size - len(data))
+                    if not chunk:
+                        break
+                    data += chunk
+        finally:
+            self.restore_terminal()
+        return self._normalize(data.decode("utf-8", "replace"))
+
+    def _read_windows(self) -> str:
+        char = msvcrt.getwch()
+        if char in ("\x00", "\xe0"):
+            return _WINDOWS_KEYS.get(msvcrt.getwch(), "")
+        return self._normalize(char)
+
+    @staticmethod
+    def _normalize(char: str) -> str:
+        if char in ("\r", "\n"):
+            return "enter"
+        if char == "\x1b":
+            return "escape"
+        if char in ("\x7f", "\x08"):
+            return "backspace"
+        if char == "\x03":
+            return "interrupt"
+        return _ESCAPE_SEQUENCES.get(char, char)
+
+
+class Screen:
+    """Экран: набор регионов, каждый перерисовывается только если устарел"""
+
+    regions = ("header", "body", "footer")
+
+    def __init__(self):
+        self.app: Optional["App"] = None
+        self.message = ""
+        self._cache: Dict[str, object] = {}
+        self._dirty = set(self.regions)
+
+    def render_header(self):
+        return ""
+
+    def render_body(self):
+        return ""
+
+    def render_footer(self):
+        return ""
+
+    def bindings(self) -> Dict[str, Callable]:
+        return {}
+
+    def on_mount(self):
+        pass
+
+    def on_unmount(self):
+        pass
+
+    def invalidate(self, *regions: str):
+        self._dirty.update(regions or self.regions)
+        if self.app is not None:
+            self.app.request_render()
+
+    def set_message(self, message: str):
+        self.message = message
+        if self.app is not None:
+            self.app.request_render()
+
+    def frame(self):
+        for region in self.regions:
+            if region in self._dirty or region not in self._cache:
+                self._cache[region] = getattr(self, f"render_{region}")()
+        self._dirty.clear()
+        parts = [self._cache[region] for region in self.regions]
+        if self.message:
+            parts.append(self.message)
+        return Group(*parts)
+
+
+class MenuItem:
+    __slots__ = ("key", "label", "action")
+
+    def __init__(self, key: str, label: str, action: Callable):
+        self.key = key
+        self.label = label
+        self.action = action
+
+
+class MenuScreen(Screen):
+    """Меню с пунктами по цифрам; 0/Esc - назад"""
+
+    def __init__(
+        self,
+        title: str,
+        items: List[MenuItem],
+        style: str = "bold blue",
+        back_label: str = "🔙 Назад",
+    ):
+        super().__init__()
+        self.title = title
+        self.items = items
+        self.style = style
+        self.back_label = back_label
+
+    def render_header(self):
+        return Panel(f"[{self.style}]{self.title}[/{self.style}]", expand=False)
+
+    def render_body(self):
+        lines = [f"{item.key}. {item.label}" for item in self.items]
+        lines.append(f"0. {self.back_label}")
+        return "\n".join(lines)
+
+    def render_footer(self):
+        return "\n[dim]Нажмите цифру пункта меню[/dim]"
+
+    def bindings(self) -> Dict[str, Callable]:
+        keys = {key: self.app.pop for key in BACK_KEYS}
+        keys.update({item.key: item.action for item in self.items})
+        return keys
+
+
+class App:
+    FRAME_INTERVAL = 1 / 30
+
+    def __init__(self, console: Optional[Console] = None):
+        self.console = console or Console()
+        self.stack: List[Screen] = []
+        self.running = False
+        self._tasks = set()
+        self._live: Optional[Live] = None
+        self.dialog_active = False
+        self._render_requested: Optional[asyncio.Event] = None
+        self._keys: Optional[KeyReader] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def screen(self) -> Optional[Screen]:
+        return self.stack[-1] if self.stack else None
+
+    # ---------- стек экранов ----------
+    def push(self, screen: Screen):
+        screen.app = self
+        self.stack.append(screen)
+        screen.on_mount()
+        screen.invalidate()
+
+    def pop(self):
+        screen = self.stack.pop()
+        screen.on_unmount()
+        if self.stack:
+            self.screen.invalidate()
+        else:
+            self.exit()
+
+    def exit(self):
+        self.running = False
+        while self.stack:
+            self.stack.pop().on_unmount()
+        if self._render_requested is not None:
+            self._render_requested.set()
+
+    # ---------- фоновые задачи ----------
+    def spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def notify(self, message: str):
+        """Уведомление из любого потока: звонок и сообщение на текущем экране"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self.console.print(message)
+            return
+        loop.call_soon_threadsafe(self._show_notification, message)
+
+    def _show_notification(self, message: str):
+        self.console.bell()
+        if self.screen is not None:
+            self.screen.set_message(message)
+
+    # ---------- отрисовка ----------
+    def request_render(self):
+        if self._render_requested is not None:
+            self._render_requested.set()
+
+    def _start_display(self):
+        if self.console.is_terminal:
+            self._live = Live(
+                console=self.console, screen=True, auto_refresh=False, transient=True
+            )
+            self._live.start()
+
+    def _stop_display(self):
+        if self._live is not None:
+            self._live.stop()
+            self._live = None
+
+    @instrument("App.render")
+    def render(self):
+        screen = self.screen
+        if screen is None:
+            return
+        frame = screen.frame()
+        if self._live is not None:
+            self._live.update(frame, refresh=True)
+        else:
+            # Вывод не в терминал: печатаем кадр целиком
+            self.console.print(frame)
+
+    async def _render_loop(self):
+        while self.running:
+            await self._render_requested.wait()
+            # Копим запросы в пределах кадра: одна отрисовка на пачку изменений
+            await asyncio.sleep(self.FRAME_INTERVAL)
+            self._render_requested.clear()
+            if self.running and not self.dialog_active:
+                self.render()
+
+    # ---------- диалоги ----------
+    async def run_dialog(self, func: Callable, *args, pause: bool = True):
+        """Выполняет блокирующую функцию с Prompt в отдельном потоке"""
+        self.dialog_active = True
+        self._stop_display()
+        self.console.clear()
+        if self.screen is not None:
+            self.console.print(self.screen.frame())
+
+        def dialog():
+            with self._hold_input():
+                try:
+                    result = func(*args)
+                except EOFError:
+                    raise
+                except Exception as e:
+                    self.console.print(f"[red]Ошибка: {e}[/red]")
+                    result = None
+                if pause:
+                    Prompt.ask("\nНажмите Enter для продолжения...")
+                return result
+
+        try:
+            return await self._in_thread(dialog)
+        except EOFError:
+            self.exit()
+        finally:
+            self.dialog_active = False
+            if self.running:
+                self._start_display()
+                if self.screen is not None:
+                    self.screen.invalidate()
+
+    def _hold_input(self):
+        """Не дает потоку клавиш читать stdin, пока диалог ждет ввода"""
+        if self._keys is None:
+            return contextlib.nullcontext()
+        return self._keys.stdin_lock
+
+    async def _in_thread(self, func: Callable):
+        # Поток-демон, а не пул: незавершенный ввод не задерживает выход
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(method, value):
+            if not future.done():
+                method(value)
+
+        def target():
+            try:
+                result = func()
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(settle, future.set_result, result)
+
+        threading.Thread(target=target, name="dialog", daemon=True).start()
+        return await future
+
+    # ---------- обработка клавиш ----------
+    async def _dispatch(self, key: str):
+        screen = self.screen
+        if screen.message:
+            # Сообщение (ошибка, напоминание) видно до следующего нажатия
+            screen.set_message("")
+        handler = screen.bindings().get(key)
+        if handler is None:
+            return
+        try:
+            result = handler()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            if self.screen is not None:
+                self.screen.set_message(f"[red]Ошибка: {e}[/red]")
+
+    async def run(self, root: Screen):
+        loop = self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        self._render_requested = asyncio.Event()
+        self._keys = KeyReader(loop, queue)
+        self.running = True
+
+        self.push(root)
+        self._start_display()
+        self.spawn(self._render_loop())
+        self._keys.start()
+        try:
+            while self.running:
+                key = await queue.get()
+                if key == "eof":
+                    self.exit()
+                    break
+                if key == "interrupt":
+                    raise KeyboardInterrupt
+                await self._dispatch(key)
+                self._keys.resume()
+        finally:
+            self.running = False
+            for task in list(self._tasks):
+                task.cancel()
+            self._stop_display()
+            self._keys.restore_terminal()
@@ -0,0 +1,47 @@
+"""Кеш заранее отрисованных renderable.
+
+Готовый renderable переводится в строки сегментов rich под текущую
+ширину терминала, поэтому повторный вывод не форматирует разметку и не
+пересчитывает содержимое. Ключ задает вызывающий код (например,
+месяц и версия событий), ширина добавляется автоматически.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+
+from rich.console import Console, RenderableType
+from rich.segment import SegmentLines
+
+
+class RenderCache:
+    def __init__(self, console: Console, maxsize: int = 64):
+        self.console = console
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, SegmentLines]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[Hashable, ...], build: Callable[[], RenderableType]):
+        """Готовые строки по ключу; build вызывается только при промахе"""
+        options = self.console.options
+        full_key = key + (options.max_width,)
+        lines = self._entries.get(full_key)
+        if lines is not None:
+            self.hits += 1
+            self._entries.move_to_end(full_key)
+            return lines
+
+        self.misses += 1
+        lines = SegmentLines(
+            self.console.render_lines(build(), options, pad=False), new_lines=True
+        )
+        self._entries[full_key] = lines
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return lines
+
+    def clear(self):
+        self._entries.clear()
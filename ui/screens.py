@@ -0,0 +1,16 @@
+"""Экраны shoriext поверх событийного цикла ``ui.app``."""
+
+from rich.console import Group
+
+from ui.app import MenuScreen
+
+
+class MainMenuScreen(MenuScreen):
+    """Главное меню: баннер и список разделов"""
+
+    def __init__(self, ui, items):
+        super().__init__("🎯 Главное меню shoriext", items, back_label="🚪 Выйти")
+        self.ui = ui
+
+    def render_header(self):
+        return Group(self.ui.render_banner(), super().render_header())
@@ -0,0 +1,542 @@
+"""Раздел «Календарь»: события, месяц, год целиком и повестка."""
+
+import calendar
+from datetime import datetime
+from typing import Callable, Dict
+
+from rich.console import Group
+from rich.panel import Panel
+from rich.prompt import IntPrompt, Prompt
+from rich.table import Table
+
+from core.profiling import instrument
+from ui.app import BACK_KEYS, MenuItem, MenuScreen, Screen
+
+PLUGIN = {"title": "📅 Календарь", "order": 30}
+
+WEEKDAYS = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
+# Цвет дня в годовом календаре по числу событий (от большего порога)
+DENSITY_STYLES = ((4, "bold red"), (2, "bold yellow"), (1, "yellow"))
+EVENT_TYPE_STYLES = {"personal": "blue", "work": "red", "holiday": "green"}
+
+
+def create_screen(ui):
+    return MenuScreen(
+        "📅 Календарь",
+        [
+            MenuItem(
+                "1",
+                "📅 Просмотр календаря",
+                ui.opens(lambda: CalendarScreen(ui)),
+            ),
+            MenuItem(
+                "2",
+                "📋 Показать все события",
+                ui.dialog(show_calendar_events, ui),
+            ),
+            MenuItem("3", "➕ Добавить событие", ui.dialog(add_calendar_event, ui)),
+            MenuItem("4", "🗑️  Удалить событие", ui.dialog(remove_calendar_event, ui)),
+            MenuItem("5", "🔮 Ближайшие события", ui.dialog(show_upcoming_events, ui)),
+            MenuItem("6", "📥 Импорт из .ics", ui.dialog(import_calendar_ics, ui)),
+            MenuItem("7", "📤 Экспорт в .ics", ui.dialog(export_calendar_ics, ui)),
+            MenuItem("8", "🗓️  Год целиком", ui.opens(lambda: YearScreen(ui))),
+            MenuItem("9", "📜 Повестка", ui.opens(lambda: AgendaScreen(ui))),
+            *ui.undo_items(),
+        ],
+        style="bold magenta",
+    )
+
+
+@instrument()
+def show_calendar_events(ui):
+    events = ui.calendar_manager.events
+    if not events:
+        ui.console.print("[yellow]Нет запланированных событий[/yellow]")
+        return
+
+    table = Table(title="📅 Все события", show_header=True, header_style="bold magenta")
+    table.add_column("Дата", style="cyan")
+    table.add_column("Название", style="white")
+    table.add_column("Описание", style="green")
+    table.add_column("Тип", style="yellow")
+
+    # Сортируем события по дате
+    sorted_events = sorted(events, key=lambda x: x.date)
+
+    for event in sorted_events:
+        event_type_style = {
+            "personal": "blue",
+            "work": "red",
+            "holiday": "green",
+        }.get(event.event_type, "white")
+        type_text = f"[{event_type_style}]{event.event_type}[/{event_type_style}]"
+
+        table.add_row(event.date, event.title, event.description or "-", type_text)
+
+    ui.console.print(table)
+
+
+def add_calendar_event(ui):
+    ui.console.print("\n[bold]➕ Добавление нового события[/bold]")
+    title = Prompt.ask("Название события")
+    if not title:
+        ui.console.print("[red]Название не может быть пустым![/red]")
+        return
+
+    date = Prompt.ask("Дата (ГГГГ-ММ-ДД)")
+    description = Prompt.ask("Описание (необязательно)", default="")
+    event_type = Prompt.ask(
+        "Тип события", choices=["personal", "work", "holiday"], default="personal"
+    )
+    remind_before = ask_remind_before(ui)
+
+    try:
+        ui.calendar_manager.add_event(
+            title, date, description, event_type, remind_before
+        )
+        ui.console.print("[green]✅ Событие успешно добавлено![/green]")
+    except Exception as e:
+        ui.console.print(f"[red]Ошибка добавления события: {e}[/red]")
+
+
+def ask_remind_before(ui):
+    """Запрос времени напоминания; пустой ввод - без напоминания"""
+    while True:
+        answer = Prompt.ask(
+            "Напомнить за сколько минут до начала (9:00, пусто - не напоминать)",
+            default="",
+        ).strip()
+        if not answer:
+            return None
+        if answer.isdigit():
+            return int(answer)
+        ui.console.print("[red]Введите целое число минут[/red]")
+
+
+def remove_calendar_event(ui):
+    events = ui.calendar_manager.events
+    if not events:
+        ui.console.print("[yellow]Нет событий для удаления[/yellow]")
+        return
+
+    ui.console.print("\n[bold]Выберите событие для удаления:[/bold]")
+    for i, event in enumerate(events, 1):
+        ui.console.print(f"{i}. {event.date} - {event.title}")
+
+    try:
+        choice = IntPrompt.ask(
+            "Введите номер события",
+            choices=[str(i) for i in range(1, len(events) + 1)],
+        )
+        selected_event = events[choice - 1]
+
+        confirm = Prompt.ask(
+            f"Вы уверены, что хотите удалить '{selected_event.title}'? (y/N)",
+            default="n",
+        )
+        if confirm.lower() == "y":
+            ui.calendar_manager.remove_event(selected_event.title, selected_event.date)
+            ui.console.print("[green]✅ Событие удалено![/green]")
+        else:
+            ui.console.print("[yellow]Удаление отменено[/yellow]")
+
+    except (ValueError, IndexError):
+        ui.console.print("[red]Неверный выбор[/red]")
+
+
+@instrument()
+def show_upcoming_events(ui):
+    upcoming = ui.calendar_manager.get_upcoming_events(7)
+    if not upcoming:
+        ui.console.print("[yellow]Нет событий на ближайшие 7 дней[/yellow]")
+        return
+
+    ui.console.print("\n[bold]🔮 События на ближайшие 7 дней:[/bold]")
+    table = Table(show_header=True, header_style="bold blue")
+    table.add_column("Дата", style="cyan")
+    table.add_column("Название", style="white")
+    table.add_column("Описание", style="green")
+
+    for event in upcoming:
+        table.add_row(event.date, event.title, event.description or "-")
+
+    ui.console.print(table)
+
+
+def import_calendar_ics(ui):
+    ui.console.print("\n[bold]📥 Импорт событий из .ics[/bold]")
+    path = Prompt.ask("Путь к файлу .ics")
+    try:
+        result = ui.calendar_manager.import_ics(path)
+        ui.console.print(
+            f"[green]✅ Импортировано событий: {result['count']} "
+            f"({result['events_per_sec']:.0f} событий/с)[/green]"
+        )
+    except Exception as e:
+        ui.console.print(f"[red]Ошибка импорта: {e}[/red]")
+
+
+def export_calendar_ics(ui):
+    ui.console.print("\n[bold]📤 Экспорт событий в .ics[/bold]")
+    path = Prompt.ask("Путь к файлу .ics", default="data/calendar.ics")
+    try:
+        result = ui.calendar_manager.export_ics(path)
+        ui.console.print(
+            f"[green]✅ Экспортировано событий: {result['count']} "
+            f"({result['events_per_sec']:.0f} событий/с)[/green]"
+        )
+    except Exception as e:
+        ui.console.print(f"[red]Ошибка экспорта: {e}[/red]")
+
+
+def render_month_calendar(ui, year: int, month: int):
+    """Календарь месяца из кеша; сброс - по версии событий и смене дня"""
+    key = (
+        "month",
+        year,
+        month,
+        ui.calendar_manager.version,
+        datetime.now().date(),
+    )
+    return ui.render_cache.get(key, lambda: build_month_calendar(ui, year, month))
+
+
+@instrument()
+def build_month_calendar(ui, year: int, month: int):
+    """Календарь месяца"""
+    # Получаем события для текущего месяца
+    events_dict = ui.calendar_manager.get_events_for_calendar(year, month)
+
+    # Создаем календарь
+    cal = calendar.monthcalendar(year, month)
+
+    # Заголовки дней недели
+    lines = [" ".join(f"[bold]{day:2}[/bold]" for day in WEEKDAYS)]
+
+    today = datetime.now()
+
+    # Отображаем недели
+    for week in cal:
+        week_str = ""
+        for i, day in enumerate(week):
+            if day == 0:
+                week_str += "   "
+            else:
+                date_str = f"{year}-{month:02d}-{day:02d}"
+                has_events = date_str in events_dict
+
+                # Проверяем, является ли сегодняшним днем
+                is_today = (
+                    year == today.year and month == today.month and day == today.day
+                )
+
+                if is_today:
+                    day_str = f"[bold red]{day:2}[/bold red]"
+                elif has_events:
+                    day_str = f"[bold yellow]{day:2}[/bold yellow]"
+                else:
+                    day_str = f"{day:2}"
+
+                week_str += day_str + " "
+
+        lines.append(week_str)
+
+    # Легенда
+    lines.append("\n[bold]Легенда:[/bold]")
+    lines.append("[red]●[/red] Сегодня")
+    lines.append("[yellow]●[/yellow] Есть события")
+    return "\n".join(lines)
+
+
+def render_year_calendar(ui, year: int):
+    key = ("year", year, ui.calendar_manager.version, datetime.now().date())
+    return ui.render_cache.get(key, lambda: build_year_calendar(ui, year))
+
+
+@instrument()
+def build_year_calendar(ui, year: int):
+    """Двенадцать месяцев с раскраской дней по числу событий"""
+    # Один проход по индексу дней вместо двенадцати выборок по месяцам
+    counts = ui.calendar_manager.get_day_counts(year)
+    today = datetime.now()
+
+    grid = Table.grid(padding=(1, 3))
+    for _ in range(3):
+        grid.add_column(no_wrap=True)
+
+    blocks = []
+    for month in range(1, 13):
+        lines = [
+            f"[bold cyan]{get_month_name(month):^20}[/bold cyan]",
+            " ".join(WEEKDAYS),
+        ]
+        for week in calendar.monthcalendar(year, month):
+            cells = []
+            for day in week:
+                if day == 0:
+                    cells.append("  ")
+                    continue
+                count = counts.get(f"{year}-{month:02d}-{day:02d}", 0)
+                style = next(
+                    (style for limit, style in DENSITY_STYLES if count >= limit),
+                    "",
+                )
+                if (year, month, day) == (today.year, today.month, today.day):
+                    style = "bold reverse red"
+                cells.append(f"[{style}]{day:2}[/{style}]" if style else f"{day:2}")
+            lines.append(" ".join(cells))
+        blocks.append("\n".join(lines))
+
+    for row in range(0, 12, 3):
+        grid.add_row(*blocks[row : row + 3])
+
+    legend = (
+        f"\n[bold]Событий за год:[/bold] {sum(counts.values())} · "
+        "[yellow]●[/yellow] 1 · [bold yellow]●[/bold yellow] 2-3 · "
+        "[bold red]●[/bold red] 4+ · [reverse red] [/reverse red] сегодня"
+    )
+    return Group(grid, legend)
+
+
+@instrument()
+def render_agenda(ui, start: str, limit: int = 10):
+    """Ближайшие дни с событиями начиная с даты start"""
+    days = ui.calendar_manager.get_agenda(start, limit=limit)
+    if not days:
+        return "[yellow]Дальше событий нет[/yellow]"
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Дата", style="cyan", no_wrap=True)
+    table.add_column("День", style="white")
+    table.add_column("Название", style="white")
+    table.add_column("Тип", style="yellow")
+    for date, events in days:
+        try:
+            weekday = WEEKDAYS[datetime.strptime(date, "%Y-%m-%d").weekday()]
+        except ValueError:
+            weekday = ""
+        for i, event in enumerate(events):
+            style = EVENT_TYPE_STYLES.get(event.event_type, "white")
+            table.add_row(
+                date if i == 0 else "",
+                weekday if i == 0 else "",
+                event.title,
+                f"[{style}]{event.event_type}[/{style}]",
+                end_section=i == len(events) - 1,
+            )
+    return table
+
+
+def get_month_name(month: int) -> str:
+    """Получить название месяца на русском"""
+    months = {
+        1: "Январь",
+        2: "Февраль",
+        3: "Март",
+        4: "Апрель",
+        5: "Май",
+        6: "Июнь",
+        7: "Июль",
+        8: "Август",
+        9: "Сентябрь",
+        10: "Октябрь",
+        11: "Ноябрь",
+        12: "Декабрь",
+    }
+    return months.get(month, "")
+
+
+def select_day_events(ui, year: int, month: int):
+    """Выбрать день и показать события"""
+    try:
+        day = IntPrompt.ask("Введите день")
+        if day < 1 or day > 31:
+            ui.console.print("[red]Неверный день![/red]")
+            return
+
+        date_str = f"{year}-{month:02d}-{day:02d}"
+        events = ui.calendar_manager.get_events_by_date(date_str)
+
+        ui.clear_screen()
+        ui.console.print(
+            Panel(f"[bold blue]📅 События на {date_str}[/bold blue]", expand=False)
+        )
+
+        if not events:
+            ui.console.print("[yellow]Нет событий на этот день[/yellow]")
+        else:
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Название", style="cyan")
+            table.add_column("Описание", style="white")
+            table.add_column("Тип", style="yellow")
+
+            for event in events:
+                event_type_style = {
+                    "personal": "blue",
+                    "work": "red",
+                    "holiday": "green",
+                }.get(event.event_type, "white")
+                type_text = (
+                    f"[{event_type_style}]{event.event_type}[/{event_type_style}]"
+                )
+
+                table.add_row(event.title, event.description or "-", type_text)
+
+            ui.console.print(table)
+
+        # Возможность добавить событие на этот день
+        add_event = Prompt.ask("Добавить событие на этот день? (y/N)", default="n")
+        if add_event.lower() == "y":
+            title = Prompt.ask("Название события")
+            description = Prompt.ask("Описание (необязательно)", default="")
+            event_type = Prompt.ask(
+                "Тип события",
+                choices=["personal", "work", "holiday"],
+                default="personal",
+            )
+            remind_before = ask_remind_before(ui)
+
+            ui.calendar_manager.add_event(
+                title, date_str, description, event_type, remind_before
+            )
+            ui.console.print("[green]✅ Событие добавлено![/green]")
+
+    except Exception as e:
+        ui.console.print(f"[red]Ошибка: {e}[/red]")
+
+
+class CalendarScreen(Screen):
+    """Месячный календарь с переключением стрелками"""
+
+    def __init__(self, ui):
+        super().__init__()
+        self.ui = ui
+        today = datetime.now()
+        self.year = today.year
+        self.month = today.month
+
+    def render_header(self):
+        return Panel(
+            f"[bold blue]📅 Календарь - {get_month_name(self.month)} "
+            f"{self.year}[/bold blue]",
+            expand=False,
+        )
+
+    def render_body(self):
+        return render_month_calendar(self.ui, self.year, self.month)
+
+    def render_footer(self):
+        return (
+            "\n[bold]Навигация:[/bold]\n"
+            "← → (или 1 / 2): Переключение месяцев\n"
+            "Enter: Выбрать день\n"
+            "0 / Esc: Назад"
+        )
+
+    def shift_month(self, delta: int):
+        index = self.year * 12 + self.month - 1 + delta
+        self.year, self.month = divmod(index, 12)
+        self.month += 1
+        self.invalidate("header", "body")
+
+    def select_day(self):
+        return self.app.run_dialog(
+            select_day_events, self.ui, self.year, self.month, pause=False
+        )
+
+    def bindings(self) -> Dict[str, Callable]:
+        keys = {key: self.app.pop for key in BACK_KEYS}
+        keys.update(
+            {
+                "left": lambda: self.shift_month(-1),
+                "1": lambda: self.shift_month(-1),
+                "right": lambda: self.shift_month(1),
+                "2": lambda: self.shift_month(1),
+                "enter": self.select_day,
+            }
+        )
+        return keys
+
+
+class YearScreen(Screen):
+    """Год целиком: плотность событий по дням"""
+
+    def __init__(self, ui):
+        super().__init__()
+        self.ui = ui
+        self.year = datetime.now().year
+
+    def render_header(self):
+        return Panel(
+            f"[bold blue]🗓️  Календарь на {self.year} год[/bold blue]", expand=False
+        )
+
+    def render_body(self):
+        return render_year_calendar(self.ui, self.year)
+
+    def render_footer(self):
+        return "[dim]← → (или 1 / 2) - год · 0 / Esc - назад[/dim]"
+
+    def shift_year(self, delta: int):
+        self.year += delta
+        self.invalidate("header", "body")
+
+    def bindings(self) -> Dict[str, Callable]:
+        keys = {key: self.app.pop for key in BACK_KEYS}
+        keys.update(
+            {
+                "left": lambda: self.shift_year(-1),
+                "1": lambda: self.shift_year(-1),
+                "right": lambda: self.shift_year(1),
+                "2": lambda: self.shift_year(1),
+            }
+        )
+        return keys
+
+
+class AgendaScreen(Screen):
+    """Повестка: дни с событиями, прокрутка по дням и страницами"""
+
+    PAGE = 10
+
+    def __init__(self, ui):
+        super().__init__()
+        self.ui = ui
+        self.start = datetime.now().strftime("%Y-%m-%d")
+
+    def render_header(self):
+        return Panel(f"[bold blue]📜 Повестка с {self.start}[/bold blue]", expand=False)
+
+    def render_body(self):
+        return render_agenda(self.ui, self.start, self.PAGE)
+
+    def render_footer(self):
+        return (
+            "[dim]↑ ↓ - на день · ← → (или 1 / 2) - на страницу · "
+            "t - сегодня · 0 / Esc - назад[/dim]"
+        )
+
+    def scroll(self, delta: int):
+        days = self.ui.calendar_manager.get_agenda(self.start, skip=delta, limit=1)
+        if days and days[0][0] != self.start:
+            self.start = days[0][0]
+            self.invalidate("header", "body")
+
+    def go_today(self):
+        self.start = datetime.now().strftime("%Y-%m-%d")
+        self.invalidate("header", "body")
+
+    def bindings(self) -> Dict[str, Callable]:
+        keys = {key: self.app.pop for key in BACK_KEYS}
+        keys.update(
+            {
+                "up": lambda: self.scroll(-1),
+                "down": lambda: self.scroll(1),
+                "left": lambda: self.scroll(-self.PAGE),
+                "1": lambda: self.scroll(-self.PAGE),
+                "right": lambda: self.scroll(self.PAGE),
+                "2": lambda: self.scroll(self.PAGE),
+                "t": self.go_today,
+            }
+        )
+        return keys
@@ -0,0 +1,232 @@
+"""Раздел «Игры»."""
+
+import asyncio
+import os
+import time
+from typing import Callable, Dict
+
+from rich.panel import Panel
+from rich.prompt import IntPrompt, Prompt
+from rich.table import Table
+from rich.text import Text
+
+from core.game_manager import TETROMINOES, SimpleTetris, TicTacToe
+from core.replay import (
+    ReplayError,
+    ReplayPlayer,
+    ReplayReader,
+    ReplayWriter,
+    list_replays,
+    new_replay_path,
+    prune_replays,
+)
+from ui.app import BACK_KEYS, MenuItem, MenuScreen, Screen
+
+PLUGIN = {"title": "🎮 Игры", "order": 40}
+
+
+def create_screen(ui):
+    return MenuScreen(
+        "🎮 Игры",
+        [
+            MenuItem("1", "❌⭕ Крестики-нолики", ui.dialog(play_tic_tac_toe, ui)),
+            MenuItem("2", "🧱 Тетрис", lambda: ui.app.push(TetrisScreen())),
+            MenuItem("3", "📼 Повторы партий", ui.dialog(show_replays, ui)),
+        ],
+        style="bold red",
+    )
+
+
+def start_recording(game: str, seed=None) -> ReplayWriter:
+    prune_replays()
+    return ReplayWriter(new_replay_path(game), game, seed)
+
+
+def finish_recording(writer: ReplayWriter):
+    writer.close()
+    if writer.frames == 0:
+        os.remove(writer.path)  # партия без ходов
+
+
+def play_tic_tac_toe(ui):
+    while True:
+        play_tic_tac_toe_round(ui)
+        play_again = Prompt.ask("Сыграть еще раз? (y/N)", default="n")
+        if play_again.lower() != "y":
+            break
+
+
+def play_tic_tac_toe_round(ui):
+    console = ui.console
+    ui.clear_screen()
+    console.print(Panel("[bold green]❌⭕ Крестики-нолики[/bold green]", expand=False))
+
+    game = TicTacToe()
+    recorder = start_recording("tictactoe")
+    try:
+        while True:
+            console.print(game.display_board())
+
+            winner = game.check_winner()
+            if winner:
+                if winner == "Draw":
+                    console.print("[yellow]Ничья![/yellow]")
+                else:
+                    console.print(f"[bold green]Победитель: {winner}[/bold green]")
+                break
+
+            try:
+                position = IntPrompt.ask(
+                    f"Игрок {game.current_player}, введите позицию (0-8)"
+                )
+                if game.apply(position):
+                    recorder.sync(game.moves)
+                else:
+                    console.print("[red]Неверный ход! Попробуйте снова.[/red]")
+            except ValueError:
+                console.print("[red]Введите число от 0 до 8[/red]")
+    finally:
+        finish_recording(recorder)
+
+
+def show_replays(ui):
+    console = ui.console
+    paths = list_replays()[:10]
+    if not paths:
+        console.print("[yellow]Записанных партий нет[/yellow]")
+        return
+
+    table = Table(title="📼 Последние партии", show_header=True, header_style="bold")
+    table.add_column("№", style="cyan", justify="right")
+    table.add_column("Игра", style="white")
+    table.add_column("Файл", style="dim")
+    table.add_column("Ходов", justify="right")
+    table.add_column("Длительность", justify="right")
+    table.add_column("Размер", justify="right")
+    readers = []
+    for path in paths:
+        try:
+            reader = ReplayReader(path)
+        except (OSError, ReplayError) as e:
+            console.print(f"[red]{path}: {e}[/red]")
+            continue
+        readers.append(reader)
+        table.add_row(
+            str(len(readers)),
+            reader.game,
+            os.path.basename(path),
+            str(reader.frame_count),
+            f"{reader.duration_ms / 1000:.1f} с",
+            f"{len(reader.data)} Б",
+        )
+    if not readers:
+        return
+    console.print(table)
+
+    number = IntPrompt.ask("Номер партии (0 - назад)", default=1)
+    if not 1 <= number <= len(readers):
+        return
+    reader = readers[number - 1]
+    player = ReplayPlayer(reader)
+    started = time.perf_counter()
+    game = player.run()
+    elapsed = time.perf_counter() - started
+    speed = reader.duration_ms / 1000 / elapsed if elapsed > 0 else 0
+    console.print(game.display_board())
+    console.print(
+        f"[dim]Проиграно {reader.frame_count} ходов за {elapsed * 1000:.1f} мс "
+        f"(в {speed:,.0f} раз быстрее реального времени)[/dim]"
+    )
+
+    while True:
+        frame = IntPrompt.ask(
+            f"Перейти к ходу 0-{reader.frame_count} (-1 - выход)", default=-1
+        )
+        if frame < 0:
+            break
+        console.print(player.seek(frame).display_board())
+
+
+class TetrisScreen(Screen):
+    """Тетрис: гравитация - фоновая задача, управление стрелками"""
+
+    def __init__(self, seed: int = None):
+        super().__init__()
+        self.game = SimpleTetris(seed)
+        self.recorder = None
+        self._gravity = None
+
+    def on_mount(self):
+        self.recorder = start_recording("tetris", self.game.moves.seed)
+        self._gravity = self.app.spawn(self.gravity_loop())
+
+    def on_unmount(self):
+        if self._gravity is not None:
+            self._gravity.cancel()
+        finish_recording(self.recorder)
+
+    async def gravity_loop(self):
+        while not self.game.game_over:
+            await asyncio.sleep(self.game.tick_interval())
+            self.act("tick")
+
+    def act(self, action: str):
+        game = self.game
+        if game.apply(action) or action == "tick":
+            self.invalidate("header", "body")
+        self.recorder.sync(game.moves)
+        if game.game_over and not self.message:
+            self.set_message(
+                f"[bold red]Игра окончена! Счет: {game.score}[/bold red] "
+                f"[dim](зерно {game.moves.seed}, r - заново)[/dim]"
+            )
+
+    def restart(self):
+        self.on_unmount()
+        self.game = SimpleTetris()
+        self.set_message("")
+        self.invalidate("header", "body")
+        self.on_mount()
+
+    def render_header(self):
+        game = self.game
+        return Panel(
+            f"[bold cyan]🧱 Тетрис[/bold cyan]  Счет: {game.score} · "
+            f"Линии: {game.lines} · Уровень: {game.level} · "
+            f"Далее: {game.next_kind}",
+            expand=False,
+        )
+
+    def render_body(self):
+        width = self.game.board_width
+        text = Text("┌" + "──" * width + "┐\n")
+        for row in self.game.rows():
+            text.append("│")
+            for cell in row:
+                if cell == " ":
+                    text.append(" ·", style="dim")
+                else:
+                    text.append("██", style=TETROMINOES.get(cell, ("", "white"))[1])
+            text.append("│\n")
+        text.append("└" + "──" * width + "┘")
+        return text
+
+    def render_footer(self):
+        return (
+            "[dim]← → - сдвиг · ↑ - поворот · ↓ - вниз · пробел/Enter - сбросить · "
+            "r - заново · 0 / Esc - назад[/dim]"
+        )
+
+    def bindings(self) -> Dict[str, Callable]:
+        keys = {key: self.app.pop for key in BACK_KEYS}
+        for key, action in (
+            ("left", "left"),
+            ("right", "right"),
+            ("up", "rotate"),
+            ("down", "down"),
+            (" ", "drop"),
+            ("enter", "drop"),
+        ):
+            keys[key] = lambda action=action: self.act(action)
+        keys["r"] = self.restart
+        return keys
@@ -0,0 +1,228 @@
+"""Раздел «Монитор системы»."""
+
+import asyncio
+from typing import Callable, Dict
+
+from rich.console import Group
+from rich.prompt import FloatPrompt, Prompt
+from rich.table import Table
+
+from core import system_monitor
+from core.metrics_history import MetricsRecorder
+from core.system_monitor import ProcessScanner, SystemMonitor
+from ui.app import BACK_KEYS, MenuItem, MenuScreen, Screen
+
+PLUGIN = {"title": "🖥️  Монитор системы", "order": 60}
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values, width: int = 30, maximum: float = None) -> str:
+    """Мини-график из последних width значений"""
+    values = list(values)[-width:]
+    if not values:
+        return ""
+    top = maximum if maximum else max(values)
+    if top <= 0:
+        return SPARK_CHARS[0] * len(values)
+    last = len(SPARK_CHARS) - 1
+    return "".join(
+        SPARK_CHARS[min(int(value / top * last + 0.5), last)] for value in values
+    )
+
+
+def format_bytes(value: float) -> str:
+    for unit in ("Б", "КБ", "МБ", "ГБ"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} ТБ"
+
+
+def create_screen(ui):
+    if not system_monitor.available():
+        return ui.app.run_dialog(
+            ui.console.print,
+            "[yellow]Монитор доступен только в Linux (нужен /proc)[/yellow]",
+        )
+    return MenuScreen(
+        "🖥️  Монитор системы",
+        [
+            MenuItem(
+                "1", "📈 Мониторинг в реальном времени", lambda: open_live_monitor(ui)
+            ),
+            MenuItem(
+                "2", "🕘 История за час и сутки", ui.dialog(show_metrics_history, ui)
+            ),
+        ],
+        style="bold cyan",
+    )
+
+
+def ask_monitor_settings():
+    interval = FloatPrompt.ask("Интервал обновления, сек", default=1.0)
+    sort_by = Prompt.ask("Сортировка процессов", choices=["cpu", "rss"], default="cpu")
+    return max(interval, 0.1), sort_by
+
+
+async def open_live_monitor(ui):
+    settings = await ui.app.run_dialog(ask_monitor_settings, pause=False)
+    if settings is not None:
+        ui.app.push(MonitorScreen(*settings))
+
+
+def show_metrics_history(ui):
+    recorder = MetricsRecorder()
+    try:
+        for title, tier, seconds in (
+            ("🕐 Последний час (средние за минуту)", "1m", 3600),
+            ("📆 Последние сутки (средние за час)", "1h", 86400),
+        ):
+            records = recorder.read(tier, seconds)
+            table = Table(title=title, show_header=True, header_style="bold blue")
+            table.add_column("Метрика", style="cyan", no_wrap=True)
+            table.add_column("Среднее", style="white", justify="right", no_wrap=True)
+            table.add_column("Макс.", style="white", justify="right", no_wrap=True)
+            table.add_column("График", style="green", no_wrap=True)
+
+            if not records:
+                ui.console.print(
+                    f"[yellow]{title}: нет данных - история пишется, "
+                    "пока открыта программа[/yellow]"
+                )
+                continue
+
+            for label, metric, maximum, unit in (
+                ("CPU", "cpu_percent", 100, "%"),
+                ("Память", "mem_percent", 100, "%"),
+                ("Диск: чтение", "disk_read_bps", None, "/с"),
+                ("Диск: запись", "disk_write_bps", None, "/с"),
+                ("Сеть: прием", "net_rx_bps", None, "/с"),
+                ("Сеть: передача", "net_tx_bps", None, "/с"),
+            ):
+                column = recorder.metrics.index(metric)
+                values = [record[column] for _, record in records]
+                average = sum(values) / len(values)
+                peak = max(values)
+                if unit == "%":
+                    average_text, peak_text = f"{average:.1f}%", f"{peak:.1f}%"
+                else:
+                    average_text = f"{format_bytes(average)}{unit}"
+                    peak_text = f"{format_bytes(peak)}{unit}"
+                table.add_row(
+                    label,
+                    average_text,
+                    peak_text,
+                    sparkline(values, width=30, maximum=maximum),
+                )
+            ui.console.print(table)
+    finally:
+        recorder.close()
+
+
+def render_system_monitor(monitor: SystemMonitor, interval: float):
+    history = monitor.history
+    table = Table(
+        title="🖥️  Загруженность ПК",
+        caption=(
+            f"Обновление каждые {interval:g} с · нагрузка монитора: "
+            f"{monitor.self_cpu_percent:.2f}% CPU"
+        ),
+        show_header=True,
+        header_style="bold blue",
+    )
+    table.add_column("Метрика", style="cyan")
+    table.add_column("Значение", style="white", justify="right")
+    table.add_column("История", style="green", no_wrap=True)
+
+    cpu = history["cpu_percent"]
+    table.add_row("CPU", f"{cpu.latest():.1f}%", sparkline(cpu, maximum=100))
+    memory = history["mem_percent"]
+    table.add_row(
+        "Память",
+        f"{format_bytes(history['mem_used'].latest())} / "
+        f"{format_bytes(monitor.mem_total)} ({memory.latest():.1f}%)",
+        sparkline(memory, maximum=100),
+    )
+    for label, metric in (
+        ("Диск: чтение", "disk_read_bps"),
+        ("Диск: запись", "disk_write_bps"),
+        ("Сеть: прием", "net_rx_bps"),
+        ("Сеть: передача", "net_tx_bps"),
+    ):
+        values = history[metric]
+        table.add_row(label, f"{format_bytes(values.latest())}/с", sparkline(values))
+    return table
+
+
+def render_process_table(scanner: ProcessScanner, sort_by: str = "cpu", count=10):
+    table = Table(
+        title=f"Процессы: топ-{count} по {sort_by.upper()} "
+        f"(всего {len(scanner.processes)})",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("PID", style="cyan", justify="right", no_wrap=True)
+    table.add_column("Имя", style="white", no_wrap=True)
+    table.add_column("CPU", style="yellow", justify="right", no_wrap=True)
+    table.add_column("RSS", style="green", justify="right", no_wrap=True)
+    table.add_column("Команда", style="dim", no_wrap=True)
+
+    for process in scanner.top(count, sort_by):
+        table.add_row(
+            str(process.pid),
+            process.name,
+            f"{process.cpu_percent:.1f}%",
+            format_bytes(process.rss),
+            process.cmdline[:32] + ("…" if len(process.cmdline) > 32 else ""),
+        )
+    return table
+
+
+class MonitorScreen(Screen):
+    """Монитор в реальном времени: замеры идут фоновой задачей"""
+
+    def __init__(self, interval: float, sort_by: str):
+        super().__init__()
+        self.interval = interval
+        self.sort_by = sort_by
+        self.monitor = SystemMonitor()
+        self.scanner = ProcessScanner()
+        self._sampler = None
+
+    def on_mount(self):
+        self.monitor.sample()
+        self.scanner.scan()
+        self._sampler = self.app.spawn(self.sample_loop())
+
+    def on_unmount(self):
+        if self._sampler is not None:
+            self._sampler.cancel()
+        self.monitor.close()
+
+    async def sample_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            # История пишется отдельно, фоновой задачей интерфейса
+            self.monitor.sample()
+            self.scanner.scan()
+            self.invalidate("body")
+
+    def render_body(self):
+        return Group(
+            render_system_monitor(self.monitor, self.interval),
+            render_process_table(self.scanner, self.sort_by),
+        )
+
+    def render_footer(self):
+        return "[dim]c / r - сортировка по CPU / RSS · 0 / Esc - назад[/dim]"
+
+    def sort(self, sort_by: str):
+        self.sort_by = sort_by
+        self.invalidate("body")
+
+    def bindings(self) -> Dict[str, Callable]:
+        keys = {key: self.app.pop for key in BACK_KEYS}
+        keys["c"] = lambda: self.sort("cpu")
+        keys["r"] = lambda: self.sort("rss")
+        return keys
@@ -0,0 +1,154 @@
+"""Раздел «Генератор паролей»."""
+
+from rich.prompt import IntPrompt, Prompt
+
+from core.password_generator import CAPITALIZE_MODES, PasswordGenerator
+from core.password_policy import PasswordPolicy, load_policy, save_policy
+from core.wordlist import LANGUAGES
+from ui.app import MenuItem, MenuScreen
+
+PLUGIN = {"title": "🔐 Генератор паролей", "order": 50}
+
+password_generator = PasswordGenerator()
+
+
+def create_screen(ui):
+    return MenuScreen(
+        "🔐 Генератор паролей",
+        [
+            MenuItem("1", "🎲 Сгенерировать пароли", ui.dialog(generate_passwords, ui)),
+            MenuItem(
+                "2",
+                "🔍 Проверить надежность пароля",
+                ui.dialog(check_password_strength, ui),
+            ),
+            MenuItem(
+                "3", "📖 Парольные фразы из слов", ui.dialog(generate_passphrases, ui)
+            ),
+        ],
+        style="bold purple",
+    )
+
+
+def generate_passwords(ui):
+    console = ui.console
+    console.print("\n[bold]🎲 Генерация паролей[/bold]")
+
+    try:
+        count = IntPrompt.ask("Количество паролей", default=5)
+        length = IntPrompt.ask("Длина пароля", default=12)
+
+        use_uppercase = (
+            Prompt.ask("Использовать заглавные буквы? (Y/n)", default="y").lower()
+            == "y"
+        )
+        use_lowercase = (
+            Prompt.ask("Использовать строчные буквы? (Y/n)", default="y").lower() == "y"
+        )
+        use_digits = Prompt.ask("Использовать цифры? (Y/n)", default="y").lower() == "y"
+        min_digits = IntPrompt.ask("Минимум цифр", default=1) if use_digits else None
+        use_special = (
+            Prompt.ask("Использовать специальные символы? (Y/n)", default="y").lower()
+            == "y"
+        )
+        if not (use_uppercase or use_lowercase or use_digits or use_special):
+            use_lowercase = True
+        exclude_ambiguous = (
+            Prompt.ask("Исключить похожие символы (l1O0)? (y/N)", default="n").lower()
+            == "y"
+        )
+        exclude = Prompt.ask("Исключить символы", default="")
+        max_repeat = IntPrompt.ask(
+            "Максимум одинаковых символов подряд (0 - без ограничения)", default=0
+        )
+
+        policy = PasswordPolicy(
+            length=max(length, 4),
+            lower=1 if use_lowercase else None,
+            upper=1 if use_uppercase else None,
+            digits=min_digits,
+            special=1 if use_special else None,
+            special_chars=password_generator.special_chars,
+            exclude=exclude,
+            exclude_ambiguous=exclude_ambiguous,
+            max_repeat=max_repeat or None,
+        )
+        passwords = password_generator.generate_multiple_passwords(
+            count=count, policy=policy
+        )
+        # Та же политика потом используется при проверке паролей
+        save_policy(policy)
+
+        console.print("\n[bold]Сгенерированные пароли:[/bold]")
+        for i, password in enumerate(passwords, 1):
+            console.print(f"{i}. {password}", markup=False)
+
+    except Exception as e:
+        console.print(f"[red]Ошибка генерации паролей: {e}[/red]")
+
+
+def generate_passphrases(ui):
+    console = ui.console
+    console.print("\n[bold]📖 Парольные фразы[/bold]")
+
+    try:
+        count = IntPrompt.ask("Количество фраз", default=5)
+        options = {
+            "words": IntPrompt.ask("Слов во фразе", default=6),
+            "language": Prompt.ask(
+                "Список слов", choices=list(LANGUAGES), default="en"
+            ),
+            "separator": Prompt.ask("Разделитель", default="-"),
+            "capitalize": Prompt.ask(
+                "Регистр слов", choices=list(CAPITALIZE_MODES), default="lower"
+            ),
+            "add_digit": Prompt.ask("Добавить цифру? (y/N)", default="n").lower()
+            == "y",
+        }
+
+        passphrases = password_generator.generate_multiple_passwords(
+            count=count, passphrase=True, **options
+        )
+        entropy = password_generator.passphrase_entropy(**options)
+
+        console.print("\n[bold]Сгенерированные фразы:[/bold]")
+        for i, passphrase in enumerate(passphrases, 1):
+            console.print(f"{i}. {passphrase}", markup=False)
+        note = "" if options["separator"] else " (верхняя оценка: нет разделителя)"
+        console.print(f"\nЭнтропия каждой фразы: [bold]{entropy:.1f} бит[/bold]{note}")
+
+    except Exception as e:
+        console.print(f"[red]Ошибка генерации фраз: {e}[/red]")
+
+
+def check_password_strength(ui):
+    console = ui.console
+    console.print("\n[bold]🔍 Проверка надежности пароля[/bold]")
+    password = Prompt.ask("Введите пароль для проверки")
+
+    if not password:
+        console.print("[yellow]Пароль не может быть пустым[/yellow]")
+        return
+
+    policy = load_policy()
+    result = password_generator.check_password_strength(password, policy)
+
+    console.print("\n[bold]Результаты проверки:[/bold]")
+    console.print(
+        f"Надежность: [bold]{result['strength']}[/bold] ({result['score']}/5)"
+    )
+
+    if result["feedback"]:
+        console.print("\n[bold]Рекомендации:[/bold]")
+        for feedback in result["feedback"]:
+            console.print(f"• {feedback}")
+    else:
+        console.print("[green]✅ Пароль надежный![/green]")
+
+    if policy is not None:
+        if result["violations"]:
+            console.print("\n[bold red]Не соответствует политике:[/bold red]")
+            for violation in result["violations"]:
+                console.print(f"• {violation}", markup=False)
+        else:
+            console.print("[green]✅ Соответствует политике паролей[/green]")
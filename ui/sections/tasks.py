@@ -0,0 +1,329 @@
+"""Раздел «Трекер задач»."""
+
+from datetime import datetime
+
+from rich.prompt import IntPrompt, Prompt
+from rich.table import Table
+
+from core.profiling import instrument
+from core.task_io import parse_depends_on
+from ui.app import MenuItem, MenuScreen
+
+PLUGIN = {"title": "📋 Трекер задач", "order": 10}
+
+
+def create_screen(ui):
+    return MenuScreen(
+        "📋 Трекер задач",
+        [
+            MenuItem("1", "📋 Показать все задачи", ui.dialog(show_tasks, ui)),
+            MenuItem("2", "➕ Добавить новую задачу", ui.dialog(add_task, ui)),
+            MenuItem("3", "✅ Отметить прогресс", ui.dialog(increment_task, ui)),
+            MenuItem("4", "📊 Статистика", ui.dialog(show_task_statistics, ui)),
+            MenuItem("5", "🔄 Сбросить задачу", ui.dialog(reset_task, ui)),
+            MenuItem("6", "🗑️  Удалить задачу", ui.dialog(remove_task, ui)),
+            MenuItem("7", "📥 Импорт задач (JSONL/CSV)", ui.dialog(import_tasks, ui)),
+            MenuItem("8", "📤 Экспорт задач (JSONL/CSV)", ui.dialog(export_tasks, ui)),
+            MenuItem("9", "🧭 Что дальше", ui.dialog(show_next_tasks, ui)),
+            *ui.undo_items(),
+        ],
+        style="bold green",
+    )
+
+
+@instrument()
+def show_tasks(ui):
+    tasks = ui.task_manager.get_all_tasks()
+    if not tasks:
+        ui.console.print("[yellow]Нет созданных задач[/yellow]")
+        return
+
+    table = Table(title="📋 Ваши задачи", show_header=True, header_style="bold magenta")
+    table.add_column("Название", style="cyan")
+    table.add_column("Описание", style="white")
+    table.add_column("Приоритет", style="yellow")
+    table.add_column("Прогресс", style="green")
+    table.add_column("Срок", style="white")
+    table.add_column("Статус", style="blue")
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    for task in tasks:
+        progress_text = f"{task.current_count}/{task.target_count}"
+        priority_style = {"low": "green", "medium": "yellow", "high": "red"}.get(
+            task.priority, "white"
+        )
+        priority_text = f"[{priority_style}]{task.priority}[/{priority_style}]"
+
+        if task.is_completed:
+            status = "[green]✅ Завершено[/green]"
+        elif task.name in ui.task_manager.graph.ready:
+            status = "[blue]⏳ В процессе[/blue]"
+        else:
+            status = "[yellow]🔒 Ждет зависимостей[/yellow]"
+
+        due_text = task.due_date or "-"
+        if task.due_date and task.due_date < today and not task.is_completed:
+            due_text = f"[red]{task.due_date}[/red]"
+
+        table.add_row(
+            task.name,
+            task.description or "-",
+            priority_text,
+            progress_text,
+            due_text,
+            status,
+        )
+
+    ui.console.print(table)
+
+
+def add_task(ui):
+    ui.console.print("\n[bold]➕ Добавление новой задачи[/bold]")
+    name = Prompt.ask("Введите название задачи")
+    if not name:
+        ui.console.print("[red]Название не может быть пустым![/red]")
+        return
+
+    if ui.task_manager.get_task(name) is not None:
+        ui.console.print("[red]Задача с таким названием уже существует![/red]")
+        return
+
+    description = Prompt.ask("Описание (необязательно)", default="")
+    target_count = IntPrompt.ask("Целевое количество", default=1)
+    priority = Prompt.ask(
+        "Приоритет (low/medium/high)",
+        choices=["low", "medium", "high"],
+        default="medium",
+    )
+    while True:
+        due_date = Prompt.ask("Срок (ГГГГ-ММ-ДД, необязательно)", default="")
+        try:
+            if due_date:
+                datetime.strptime(due_date, "%Y-%m-%d")
+            break
+        except ValueError:
+            ui.console.print("[red]Неверный формат даты[/red]")
+    depends_on = parse_depends_on(
+        Prompt.ask("Зависит от задач (через ;, необязательно)", default="")
+    )
+    unknown = [dep for dep in depends_on if ui.task_manager.get_task(dep) is None]
+    if unknown:
+        ui.console.print(f"[yellow]Таких задач пока нет: {', '.join(unknown)}[/yellow]")
+
+    try:
+        ui.task_manager.add_task(
+            name, description, target_count, priority, due_date or None, depends_on
+        )
+    except ValueError as e:
+        ui.console.print(f"[red]{e}[/red]")
+        return
+
+    ui.console.print("[green]✅ Задача успешно добавлена![/green]")
+
+
+def increment_task(ui):
+    tasks = ui.task_manager.get_all_tasks()
+    if not tasks:
+        ui.console.print("[yellow]Нет задач для отметки прогресса[/yellow]")
+        return
+
+    ui.console.print("\n[bold]Выберите задачу для отметки прогресса:[/bold]")
+    for i, task in enumerate(tasks, 1):
+        status = "✅" if task.is_completed else "⏳"
+        ui.console.print(f"{i}. {status} {task.name}")
+
+    try:
+        choice = IntPrompt.ask(
+            "Введите номер задачи",
+            choices=[str(i) for i in range(1, len(tasks) + 1)],
+        )
+        selected_task = tasks[choice - 1]
+
+        if ui.task_manager.increment_task(selected_task.name):
+            ui.console.print("[green]✅ Прогресс отмечен![/green]")
+            if selected_task.is_completed:
+                ui.console.print(
+                    f"[bold green]🎉 Поздравляем! Задача '{selected_task.name}' завершена![/bold green]"
+                )
+        else:
+            ui.console.print("[yellow]Эта задача уже завершена![/yellow]")
+
+    except (ValueError, IndexError):
+        ui.console.print("[red]Неверный выбор[/red]")
+
+
+@instrument()
+def show_next_tasks(ui):
+    """Готовые к работе задачи и порядок выполнения остальных"""
+    ready = ui.task_manager.get_next_tasks(10)
+    if not ui.task_manager.tasks:
+        ui.console.print("[yellow]Нет созданных задач[/yellow]")
+        return
+
+    table = Table(
+        title="🧭 Можно делать сейчас",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("#", style="dim", justify="right")
+    table.add_column("Название", style="cyan")
+    table.add_column("Приоритет", style="yellow")
+    table.add_column("Срок", style="white")
+    for i, task in enumerate(ready, 1):
+        table.add_row(str(i), task.name, task.priority, task.due_date or "-")
+    if ready:
+        ui.console.print(table)
+    else:
+        ui.console.print("[yellow]Нет задач, готовых к работе[/yellow]")
+
+    blocked = ui.task_manager.get_blocked_tasks()
+    if blocked:
+        ui.console.print("\n[bold]🔒 Ждут зависимостей:[/bold]")
+        for name, dependencies in sorted(blocked.items())[:10]:
+            ui.console.print(f"• {name} ← {', '.join(dependencies)}")
+        if len(blocked) > 10:
+            ui.console.print(f"  ... и еще {len(blocked) - 10}")
+
+    plan = ui.task_manager.get_plan()
+    if plan:
+        ui.console.print(
+            "\n[bold]📋 План:[/bold] "
+            + " → ".join(task.name for task in plan[:15])
+            + (" → ..." if len(plan) > 15 else "")
+        )
+    for cycle in ui.task_manager.graph.cycles:
+        ui.console.print(f"[red]⚠️  Циклическая зависимость: {' → '.join(cycle)}[/red]")
+
+
+@instrument()
+def show_task_statistics(ui):
+    stats = ui.task_manager.get_statistics()
+    tasks = ui.task_manager.get_all_tasks()
+
+    table = Table(title="📊 Статистика задач", show_header=False)
+    table.add_row("Всего задач", str(stats["total_tasks"]))
+    table.add_row("Завершено", str(stats["completed_tasks"]))
+    table.add_row("В процессе", str(stats["in_progress_tasks"]))
+    table.add_row("Общий прогресс", stats["overall_progress"])
+
+    ui.console.print(table)
+
+    if tasks:
+        ui.console.print("\n[bold]Детальный прогресс:[/bold]")
+        for task in tasks:
+            ui.console.print(f"\n[cyan]{task.name}[/cyan]")
+            progress_percentage = (
+                (task.current_count / task.target_count) * 100
+                if task.target_count > 0
+                else 0
+            )
+            progress_bar = "█" * int(progress_percentage // 5) + "░" * (
+                20 - int(progress_percentage // 5)
+            )
+            status = "✅ Завершено" if task.is_completed else "⏳ В процессе"
+            ui.console.print(f"  [{progress_bar}] {progress_percentage:.1f}%")
+            ui.console.print(f"  {task.current_count}/{task.target_count} | {status}")
+
+
+def reset_task(ui):
+    tasks = ui.task_manager.get_all_tasks()
+    if not tasks:
+        ui.console.print("[yellow]Нет задач для сброса[/yellow]")
+        return
+
+    ui.console.print("\n[bold]Выберите задачу для сброса:[/bold]")
+    for i, task in enumerate(tasks, 1):
+        ui.console.print(f"{i}. 🔄 {task.name}")
+
+    try:
+        choice = IntPrompt.ask(
+            "Введите номер задачи",
+            choices=[str(i) for i in range(1, len(tasks) + 1)],
+        )
+        selected_task = tasks[choice - 1]
+
+        confirm = Prompt.ask(
+            f"Вы уверены, что хотите сбросить '{selected_task.name}'? (y/N)",
+            default="n",
+        )
+        if confirm.lower() == "y":
+            ui.task_manager.reset_task(selected_task.name)
+            ui.console.print("[green]✅ Задача сброшена![/green]")
+        else:
+            ui.console.print("[yellow]Сброс отменен[/yellow]")
+
+    except (ValueError, IndexError):
+        ui.console.print("[red]Неверный выбор[/red]")
+
+
+def remove_task(ui):
+    tasks = ui.task_manager.get_all_tasks()
+    if not tasks:
+        ui.console.print("[yellow]Нет задач для удаления[/yellow]")
+        return
+
+    ui.console.print("\n[bold]Выберите задачу для удаления:[/bold]")
+    for i, task in enumerate(tasks, 1):
+        status = "✅" if task.is_completed else "⏳"
+        ui.console.print(f"{i}. {status} {task.name}")
+
+    try:
+        choice = IntPrompt.ask(
+            "Введите номер задачи",
+            choices=[str(i) for i in range(1, len(tasks) + 1)],
+        )
+        selected_task = tasks[choice - 1]
+
+        confirm = Prompt.ask(
+            f"Вы уверены, что хотите удалить '{selected_task.name}'? (y/N)",
+            default="n",
+        )
+        if confirm.lower() == "y":
+            ui.task_manager.remove_task(selected_task.name)
+            ui.console.print("[green]✅ Задача удалена![/green]")
+        else:
+            ui.console.print("[yellow]Удаление отменено[/yellow]")
+
+    except (ValueError, IndexError):
+        ui.console.print("[red]Неверный выбор[/red]")
+
+
+def import_tasks(ui):
+    ui.console.print("\n[bold]📥 Импорт задач[/bold]")
+    path = Prompt.ask("Путь к файлу (.jsonl или .csv)")
+    try:
+        result = ui.task_manager.import_tasks(path)
+    except Exception as e:
+        ui.console.print(f"[red]Ошибка импорта: {e}[/red]")
+        return
+
+    ui.console.print(
+        f"[green]✅ Импортировано задач: {result['imported']} "
+        f"({result['tasks_per_sec']:.0f} задач/с)[/green]"
+    )
+    if result["skipped"]:
+        ui.console.print(f"[yellow]Пропущено дубликатов: {result['skipped']}[/yellow]")
+    if result["errors"]:
+        ui.console.print(f"[red]Некорректных записей: {len(result['errors'])}[/red]")
+        for error in result["errors"][:5]:
+            ui.console.print(f"• {error}")
+
+
+def export_tasks(ui):
+    ui.console.print("\n[bold]📤 Экспорт задач[/bold]")
+    path = Prompt.ask("Путь к файлу (.jsonl или .csv)", default="data/tasks.csv")
+    subset = Prompt.ask(
+        "Какие задачи экспортировать",
+        choices=["all", "active", "completed"],
+        default="all",
+    )
+    predicates = {
+        "all": None,
+        "active": lambda task: not task.is_completed,
+        "completed": lambda task: task.is_completed,
+    }
+    try:
+        count = ui.task_manager.export_tasks(path, predicate=predicates[subset])
+        ui.console.print(f"[green]✅ Экспортировано задач: {count}[/green]")
+    except Exception as e:
+        ui.console.print(f"[red]Ошибка экспорта: {e}[/red]")
@@ -0,0 +1,84 @@
+"""Раздел «Прогноз погоды»."""
+
+import time
+
+from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.table import Table
+
+from core.weather_cache import format_age
+
+PLUGIN = {
+    "title": "🌤️  Прогноз погоды",
+    "order": 20,
+    "kind": "dialog",
+    "entry": "show_weather",
+    "pause": False,
+}
+
+# Сколько ждать первых прогнозов, если кеш еще пуст (первый запуск);
+# срок общий для всех городов раздела
+FIRST_LOAD_WAIT = 1.0
+
+
+def show_weather(ui):
+    console = ui.console
+    refresher = ui.weather
+    ui.clear_screen()
+
+    # Прогноз берется из кеша, который обновляет фоновый поток: раздел
+    # открывается сразу, даже если поставщик медленный или недоступен
+    deadline = time.monotonic() + FIRST_LOAD_WAIT
+    for city in refresher.cities:
+        console.print(
+            Panel(f"[bold yellow]🌤️ Прогноз погоды: {city}[/bold yellow]", expand=False)
+        )
+        try:
+            forecast, entry = refresher.forecast(city)
+            wait = deadline - time.monotonic()
+            if forecast is None and wait > 0 and refresher.wait(city, wait):
+                forecast, entry = refresher.forecast(city)
+        except Exception as e:
+            console.print(f"[red]Ошибка получения погоды: {e}[/red]")
+            continue
+
+        error = refresher.errors.get(city)
+        if forecast is None:
+            if error:
+                console.print(f"[red]Ошибка получения погоды: {error}[/red]")
+            else:
+                console.print("[yellow]Прогноз загружается, загляните позже[/yellow]")
+            continue
+
+        table = Table(
+            title="Прогноз на неделю", show_header=True, header_style="bold blue"
+        )
+        table.add_column("Дата", style="cyan")
+        table.add_column("День недели", style="white")
+        table.add_column("Погода", style="yellow")
+        table.add_column("Температура", style="green")
+        table.add_column("Сегодня", style="red")
+
+        for day in forecast:
+            today_mark = "✓" if day["is_today"] else ""
+            temp_range = f"{day['temp_min']}°C / {day['temp_max']}°C"
+
+            table.add_row(
+                day["date"],
+                day["day_of_week"],
+                day["condition"],
+                temp_range,
+                today_mark,
+            )
+
+        console.print(table)
+        if entry is not None:
+            age = f"Обновлено {format_age(entry.age())}"
+            if refresher.is_stale(entry):
+                refresher.request(city)
+                reason = f": {error}" if error else ""
+                console.print(f"[yellow]⚠️  {age}, данные устарели{reason}[/yellow]")
+            else:
+                console.print(f"[dim]{age}[/dim]")
+
+    Prompt.ask("\nНажмите Enter для продолжения...")